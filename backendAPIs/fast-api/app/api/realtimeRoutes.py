@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+from app.routes.realtimeRoutes import router as realtime_router
+
+
+router = APIRouter()
+
+router.include_router(realtime_router)
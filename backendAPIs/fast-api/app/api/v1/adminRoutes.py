@@ -4,6 +4,7 @@ from app.routes.Admin.adminCreatorRequestRoutes import router as admin_creator_r
 from app.routes.Admin.adminPostRequestRoutes import router as admin_post_request_router
 from app.routes.Admin.adminManageRoutes import router as admin_manage_router
 from app.routes.Admin.adminMessagesRoutes import router as admin_messages_router
+from app.routes.Admin.adminMasterRoutes import router as admin_master_router
 
 
 router = APIRouter(
@@ -15,4 +16,5 @@ router = APIRouter(
 router.include_router(admin_creator_request_router)
 router.include_router(admin_post_request_router)
 router.include_router(admin_manage_router)
-router.include_router(admin_messages_router)
\ No newline at end of file
+router.include_router(admin_messages_router)
+router.include_router(admin_master_router)
\ No newline at end of file
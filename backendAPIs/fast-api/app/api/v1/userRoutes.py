@@ -4,6 +4,7 @@ from app.routes.Users.userRequestRoutes import router as user_request_router
 from app.routes.Users.userDashboardRoutes import router as user_dashboard_router
 from app.routes.Users.userPostRoutes import router as user_post_router
 from app.routes.Users.userMessagesRoutes import router as user_messages_router
+from app.routes.Users.userRecipeRoutes import router as user_recipe_router
 
 router = APIRouter(prefix="/users",tags=["Users"])
 
@@ -13,3 +14,4 @@ router.include_router(user_request_router)
 router.include_router(user_dashboard_router)
 router.include_router(user_post_router)
 router.include_router(user_messages_router)
+router.include_router(user_recipe_router)
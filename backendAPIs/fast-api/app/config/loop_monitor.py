@@ -0,0 +1,257 @@
+"""Event loop stall detection.
+
+Route handlers are ``async def`` but many of them still run blocking work
+(synchronous ORM calls, hashing, JSON encoding) directly on the event loop.
+While that work runs no other request on the worker makes progress, which
+shows up as latency spikes that never appear in the logs.
+
+The monitor runs a heartbeat task on the loop that measures how late each
+tick fires (loop lag), and a watchdog thread that notices when the heartbeat
+stops. When the loop is blocked past the threshold the watchdog samples the
+loop thread's stack, which names the route handler and service function that
+are holding the loop. Once the loop recovers the stall is logged to the Foodie
+logger with that stack and the requests in flight. The admin-only ``/metrics``
+endpoint only reports counts, lag percentiles and the route and service names
+of recent stalls, never stacks or request paths.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from itertools import count
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.routing import APIRoute
+
+from app.config.logging_config import log_info, log_warning
+
+APP_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+SERVICES_DIR = str(Path(APP_ROOT) / "app" / "services")
+
+
+class LoopMonitor:
+    """Measure event loop lag and attribute stalls to routes and services."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        interval_seconds: float = 0.1,
+        threshold_seconds: float = 0.2,
+        history_size: int = 50,
+        stack_depth: int = 30,
+        lag_window: int = 600,
+    ):
+        self.enabled = enabled
+        self.interval_seconds = interval_seconds
+        self.threshold_seconds = threshold_seconds
+        self.stack_depth = stack_depth
+        self._history = deque(maxlen=history_size)
+        self._lags = deque(maxlen=lag_window)
+        self._lock = threading.Lock()
+        self._request_ids = count()
+        self._in_flight: Dict[int, tuple] = {}
+        self._endpoints: Dict[object, str] = {}
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._last_beat = time.perf_counter()
+        self._sample: Optional[dict] = None
+        self.stalls = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    def start(self, app: FastAPI) -> None:
+        """Start the heartbeat and watchdog. Must be called from the running loop."""
+        if not self.enabled or self._heartbeat_task is not None:
+            return
+
+        self._endpoints = {
+            route.endpoint.__code__: f"{','.join(sorted(route.methods))} {route.path}"
+            for route in app.routes
+            if isinstance(route, APIRoute)
+        }
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop_event.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+        log_info(
+            f"Event loop monitor started (threshold {self.threshold_seconds * 1000:.0f} ms)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and watchdog."""
+        if self._heartbeat_task is None:
+            return
+
+        self._stop_event.set()
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat_task = None
+
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval_seconds * 2)
+            self._watchdog = None
+
+    async def track_requests(self, request: Request, call_next):
+        """HTTP middleware that records in-flight requests for attribution."""
+        if not self.enabled:
+            return await call_next(request)
+
+        request_id = next(self._request_ids)
+        with self._lock:
+            self._in_flight[request_id] = (request.method, request.url.path, time.perf_counter())
+        try:
+            return await call_next(request)
+        finally:
+            with self._lock:
+                self._in_flight.pop(request_id, None)
+
+    async def _heartbeat(self) -> None:
+        """Tick on the loop and measure how late each tick fires."""
+        while True:
+            expected = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            now = time.perf_counter()
+            lag = max(now - expected, 0.0)
+
+            with self._lock:
+                self._last_beat = now
+                self.last_lag_seconds = lag
+                self._lags.append(lag)
+                self.max_lag_seconds = max(self.max_lag_seconds, lag)
+                sample, self._sample = self._sample, None
+
+            if lag >= self.threshold_seconds:
+                self._record_stall(lag, sample)
+
+    def _watch(self) -> None:
+        """Watchdog thread: sample the loop thread's stack while it is blocked.
+
+        Sampling starts at half the threshold so short stalls are not missed
+        between polls; samples for ticks that end up under the threshold are
+        discarded by the heartbeat.
+        """
+        poll_interval = min(self.interval_seconds, self.threshold_seconds) / 4
+        sample_after = self.interval_seconds + self.threshold_seconds / 2
+        while not self._stop_event.wait(poll_interval):
+            with self._lock:
+                blocked_for = time.perf_counter() - self._last_beat
+                already_sampled = self._sample is not None
+
+            if already_sampled or blocked_for < sample_after:
+                continue
+
+            sample = self._sample_loop_thread()
+            if sample is not None:
+                with self._lock:
+                    self._sample = sample
+
+    def _sample_loop_thread(self) -> Optional[dict]:
+        """Capture the loop thread's stack and the code it is running."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+
+        route = None
+        service = None
+        walker = frame
+        while walker is not None:
+            code = walker.f_code
+            if route is None and code in self._endpoints:
+                route = self._endpoints[code]
+            if code.co_filename.startswith(SERVICES_DIR):
+                # Keep the outermost service frame: the call the route made
+                service = code.co_qualname
+            walker = walker.f_back
+
+        stack = [
+            f"{_short_path(entry.filename)}:{entry.lineno} in {entry.name}"
+            for entry in traceback.extract_stack(frame, limit=self.stack_depth)
+        ]
+        return {"route": route, "service": service, "stack": stack}
+
+    def _record_stall(self, lag: float, sample: Optional[dict]) -> None:
+        """Log a stall with its stack and keep a summary in the history."""
+        with self._lock:
+            now = time.perf_counter()
+            in_flight = [
+                {"route": f"{method} {path}", "elapsed_ms": round((now - started_at) * 1000, 1)}
+                for method, path, started_at in self._in_flight.values()
+            ]
+            self.stalls += 1
+
+        sample = sample or {"route": None, "service": None, "stack": []}
+        stall = {
+            "lag_ms": round(lag * 1000, 1),
+            "route": sample["route"],
+            "service": sample["service"],
+        }
+        with self._lock:
+            self._history.append(stall)
+
+        blamed = sample["route"] or ", ".join(r["route"] for r in in_flight) or "unknown route"
+        message = (
+            f"Event loop blocked for {stall['lag_ms']} ms in {blamed}"
+            f" (service: {sample['service'] or 'unknown'})"
+        )
+        if sample["stack"]:
+            message += "\n" + "\n".join(f"    {line}" for line in sample["stack"])
+        log_warning(message)
+
+    def stats(self) -> dict:
+        """Return loop lag counters and recent stalls for monitoring.
+
+        Stalls are reported by route and service only; their stacks and the
+        in-flight request paths stay in the log.
+        """
+        with self._lock:
+            lags = sorted(self._lags)
+            return {
+                "enabled": self.enabled,
+                "running": self._heartbeat_task is not None,
+                "threshold_ms": round(self.threshold_seconds * 1000, 1),
+                "last_lag_ms": round(self.last_lag_seconds * 1000, 1),
+                "max_lag_ms": round(self.max_lag_seconds * 1000, 1),
+                "lag_p50_ms": _percentile_ms(lags, 0.50),
+                "lag_p95_ms": _percentile_ms(lags, 0.95),
+                "lag_p99_ms": _percentile_ms(lags, 0.99),
+                "stalls": self.stalls,
+                "in_flight": len(self._in_flight),
+                "recent_stalls": list(self._history),
+            }
+
+
+def _percentile_ms(lags: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted lags, in milliseconds."""
+    if not lags:
+        return 0.0
+    rank = min(int(fraction * len(lags)), len(lags) - 1)
+    return round(lags[rank] * 1000, 1)
+
+
+def _short_path(filename: str) -> str:
+    """Show application files relative to the project root."""
+    if filename.startswith(APP_ROOT):
+        return os.path.relpath(filename, APP_ROOT)
+    return filename
+
+
+loop_monitor = LoopMonitor(
+    enabled=os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true",
+    interval_seconds=int(os.getenv("LOOP_MONITOR_INTERVAL_MS", "100")) / 1000,
+    threshold_seconds=int(os.getenv("LOOP_STALL_THRESHOLD_MS", "200")) / 1000,
+    history_size=int(os.getenv("LOOP_STALL_HISTORY", "50")),
+)
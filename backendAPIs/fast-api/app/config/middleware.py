@@ -10,14 +10,15 @@ from typing import Optional
 import jwt
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
 from app.config.logging_config import log_error, log_warning
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from app.models.user import User
 from app.models.admin import Admin
 from app.models.user_auth_identity import UserAuthIdentity
-from app.models.auth_provider import AuthProvider
+from app.utils.principal_cache import principal_cache
+from app.utils.token_revocation import revocation_list
 
 
 class AuthMiddleware:
@@ -28,6 +29,12 @@ class AuthMiddleware:
         self.secret_key = os.getenv("SECRET_KEY")
         if not self.secret_key:
             raise ValueError("SECRET_KEY environment variable is not set")
+
+        # "stateful" checks every token against the database,
+        # "stateless" trusts signed claims plus the revocation list
+        self.validation_mode = os.getenv("AUTH_VALIDATION_MODE", "stateful").lower()
+        if self.validation_mode not in ("stateful", "stateless"):
+            raise ValueError("AUTH_VALIDATION_MODE must be 'stateful' or 'stateless'")
         
         self.public_routes = {
             "/health",
@@ -37,6 +44,12 @@ class AuthMiddleware:
             "/auth"
         }
 
+        # Routes under a public prefix that still need an authenticated user
+        self.protected_routes = {
+            "/auth/logout",
+            "/auth/me"
+        }
+
     async def __call__(self, request: Request, call_next):
         """Process the request and validate authentication."""
         
@@ -52,7 +65,7 @@ class AuthMiddleware:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        auth_data = await self._validate_token(token)
+        auth_data = await self.authenticate(token)
         
         if not auth_data:
             return JSONResponse(
@@ -74,8 +87,24 @@ class AuthMiddleware:
         response = await call_next(request)
         return response
 
+    async def authenticate(self, token: str) -> Optional[dict]:
+        """Validate a bearer token and return the principal, or None if invalid.
+
+        Also used by the WebSocket endpoint, which this HTTP middleware does not see.
+        """
+        if self.validation_mode == "stateless":
+            return await self._validate_stateless_token(token)
+
+        auth_data = principal_cache.get(token)
+        if auth_data is None:
+            auth_data = await self._validate_token(token)
+        return auth_data
+
     def _is_public_route(self, path: str) -> bool:
         """Check if the route is public and doesn't require authentication."""
+        if path in self.protected_routes:
+            return False
+
         # Exact match
         if path in self.public_routes:
             return True
@@ -103,10 +132,63 @@ class AuthMiddleware:
         
         return parts[1]
 
+    async def _validate_stateless_token(self, token: str) -> Optional[dict]:
+        """Validate JWT token from its signed claims and the revocation list only."""
+        try:
+            payload = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=["HS256"]
+            )
+
+            user_id = payload.get("sub")
+            email = payload.get("email")
+
+            if not user_id or not email:
+                log_warning("Token missing required claims (sub or email)")
+                return None
+
+            if payload.get("type") != "access" or "ver" not in payload:
+                log_warning(f"Token without stateless claims for user: {user_id}")
+                return None
+
+            if not payload.get("is_active", False):
+                log_warning(f"Inactive user attempted access: {user_id}")
+                return None
+
+            try:
+                await revocation_list.refresh_if_stale(AsyncSessionLocal)
+            except Exception as e:
+                # Keep serving with the last known list rather than failing every request
+                log_error(f"Error refreshing token revocations: {str(e)}")
+
+            if revocation_list.is_revoked(payload):
+                log_warning(f"Revoked token used for user: {user_id}")
+                return None
+
+            return {
+                "user_id": user_id,
+                "email": email,
+                "is_active": True,
+                "is_creator": payload.get("is_creator", False),
+                "is_admin": payload.get("is_admin", False),
+                "name": None,
+                "phone_no": None,
+                "provider_id": payload.get("provider_id"),
+            }
+
+        except jwt.ExpiredSignatureError:
+            log_warning("Token has expired")
+            return None
+        except jwt.InvalidTokenError as e:
+            log_error(f"Invalid token: {str(e)}")
+            return None
+        except Exception as e:
+            log_error(f"Error validating token: {str(e)}", exc_info=True)
+            return None
+
     async def _validate_token(self, token: str) -> Optional[dict]:
         """Validate JWT token and return decoded payload with user information."""
-        db: Session = SessionLocal()
-        
         try:
             # Decode JWT token
             payload = jwt.decode(
@@ -131,11 +213,21 @@ class AuthMiddleware:
                     log_warning(f"Token expired for user {user_id}")
                     return None
             
-            if is_admin:
-                user = db.query(Admin).filter(Admin.id == user_id).first()
-            else:
-                user = db.query(User).filter(User.id == user_id).first()
-            
+            async with AsyncSessionLocal() as db:
+                principal_model = Admin if is_admin else User
+                user = (await db.execute(
+                    select(principal_model).where(principal_model.id == user_id)
+                )).scalars().first()
+
+                auth_identity = None
+                if user:
+                    auth_identity = (await db.execute(
+                        select(UserAuthIdentity).where(
+                            UserAuthIdentity.user_id == user_id,
+                            UserAuthIdentity.provider_id == provider_id
+                        )
+                    )).scalars().first()
+
             if not user:
                 log_warning(f"User not found for user_id: {user_id}")
                 return None
@@ -144,26 +236,24 @@ class AuthMiddleware:
                 log_warning(f"Inactive user attempted access: {user_id}")
                 return None
             
-            auth_identity = (
-                db.query(UserAuthIdentity)
-                .filter(
-                    UserAuthIdentity.user_id == user_id,
-                    UserAuthIdentity.provider_id == provider_id
-                )
-                .first()
-            )
-            
             if not auth_identity:
                 log_warning(f"Auth identity not found for user: {user_id}")
                 return None
             
-            if auth_identity.token_expires_at:
-                if datetime.now(timezone.utc) > auth_identity.token_expires_at:
+            if not auth_identity.access_token:
+                log_warning(f"Token used after logout for user: {user_id}")
+                return None
+
+            token_expires_at = auth_identity.token_expires_at
+            if token_expires_at and token_expires_at.tzinfo is None:
+                token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
+
+            if token_expires_at:
+                if datetime.now(timezone.utc) > token_expires_at:
                     log_warning(f"Database token expired for user: {user_id}")
                     return None
             
-            # Return validated auth data
-            return {
+            auth_data = {
                 "user_id": user.id,
                 "email": user.email,
                 "is_active": user.is_active,
@@ -171,7 +261,17 @@ class AuthMiddleware:
                 "is_admin": is_admin,
                 "name": getattr(user, "name", None),
                 "phone_no": getattr(user, "phone_no", None),
+                "provider_id": provider_id,
             }
+
+            # Cache the principal, never beyond the token's own expiry
+            expires_at = exp
+            if token_expires_at:
+                identity_expires_at = token_expires_at.timestamp()
+                expires_at = min(expires_at, identity_expires_at) if expires_at else identity_expires_at
+            principal_cache.set(token, auth_data, expires_at=expires_at)
+
+            return auth_data
             
         except jwt.ExpiredSignatureError:
             log_warning("Token has expired")
@@ -182,5 +282,3 @@ class AuthMiddleware:
         except Exception as e:
             log_error(f"Error validating token: {str(e)}", exc_info=True)
             return None
-        finally:
-            db.close()
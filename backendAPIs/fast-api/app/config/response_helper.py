@@ -1,43 +1,77 @@
 """Response helper for standardized API responses."""
-from typing import Any, Optional
+import os
+from typing import Any, Dict, Optional
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+
+from app.config.json_response import FastJSONResponse
+
+# Set RESPONSE_ENVELOPE=false to send bare data without status_code/message
+ENVELOPE = os.getenv("RESPONSE_ENVELOPE", "true").lower() != "false"
 
 
 class ResponseHelper:
     """Helper class for creating standardized API responses."""
 
     @staticmethod
-    def success_response(
+    def body(
         data: Any = None,
         message: str = "Success",
-        status_code: int = status.HTTP_200_OK
-    ) -> JSONResponse:
+        status_code: int = status.HTTP_200_OK,
+        envelope: Optional[bool] = None
+    ) -> Any:
         """
-        Create a successful response with status code, message, and data.
+        Build the response content for data.
 
         Args:
-            data: The response data (can be dict, list, or any serializable object)
+            data: The response data
             message: Success message
             status_code: HTTP status code (default: 200)
+            envelope: Wrap data with status_code and message; defaults to
+                RESPONSE_ENVELOPE
 
         Returns:
-            JSONResponse with standardized format
+            The enveloped content, or data itself without the envelope
         """
-        response_content = {
+        if not (ENVELOPE if envelope is None else envelope):
+            return data
+        return {
             "status_code": status_code,
             "message": message,
             "data": data
         }
-        return JSONResponse(
+
+    @staticmethod
+    def success_response(
+        data: Any = None,
+        message: str = "Success",
+        status_code: int = status.HTTP_200_OK,
+        envelope: Optional[bool] = None
+    ) -> JSONResponse:
+        """
+        Create a successful response with status code, message, and data.
+
+        Args:
+            data: The response data (dicts, lists, datetimes, enums,
+                dataclasses or Pydantic models)
+            message: Success message
+            status_code: HTTP status code (default: 200)
+            envelope: Wrap data with status_code and message; defaults to
+                RESPONSE_ENVELOPE
+
+        Returns:
+            FastJSONResponse with standardized format
+        """
+        return FastJSONResponse(
             status_code=status_code,
-            content=response_content
+            content=ResponseHelper.body(data, message, status_code, envelope)
         )
 
     @staticmethod
     def created_response(
         data: Any = None,
-        message: str = "Resource created successfully"
+        message: str = "Resource created successfully",
+        envelope: Optional[bool] = None
     ) -> JSONResponse:
         """
         Create a 201 Created response.
@@ -45,6 +79,8 @@ class ResponseHelper:
         Args:
             data: The created resource data
             message: Success message
+            envelope: Wrap data with status_code and message; defaults to
+                RESPONSE_ENVELOPE
 
         Returns:
             JSONResponse with 201 status code
@@ -52,13 +88,15 @@ class ResponseHelper:
         return ResponseHelper.success_response(
             data=data,
             message=message,
-            status_code=status.HTTP_201_CREATED
+            status_code=status.HTTP_201_CREATED,
+            envelope=envelope
         )
 
     @staticmethod
     def ok_response(
         data: Any = None,
-        message: str = "Request successful"
+        message: str = "Request successful",
+        envelope: Optional[bool] = None
     ) -> JSONResponse:
         """
         Create a 200 OK response.
@@ -66,6 +104,8 @@ class ResponseHelper:
         Args:
             data: The response data
             message: Success message
+            envelope: Wrap data with status_code and message; defaults to
+                RESPONSE_ENVELOPE
 
         Returns:
             JSONResponse with 200 status code
@@ -73,7 +113,8 @@ class ResponseHelper:
         return ResponseHelper.success_response(
             data=data,
             message=message,
-            status_code=status.HTTP_200_OK
+            status_code=status.HTTP_200_OK,
+            envelope=envelope
         )
 
     @staticmethod
@@ -94,3 +135,27 @@ class ResponseHelper:
             message=message,
             status_code=status.HTTP_204_NO_CONTENT
         )
+
+    @staticmethod
+    def encoded_response(
+        body: bytes,
+        status_code: int = status.HTTP_200_OK,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        """
+        Send a response body that is already encoded in the standard format.
+
+        Args:
+            body: JSON bytes, e.g. from the master data cache
+            status_code: HTTP status code (default: 200)
+            headers: Extra response headers (ETag, Content-Encoding, ...)
+
+        Returns:
+            Response carrying the body unchanged
+        """
+        return Response(
+            content=body,
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json"
+        )
@@ -1,18 +1,21 @@
 """Database connection and session management.
 
 This module handles database configuration, engine creation, and session management.
-It provides a Base class for SQLAlchemy models and a dependency function for FastAPI
-to get database sessions.
+It provides a Base class for SQLAlchemy models and dependency functions for FastAPI
+to get sync or async database sessions.
 """
 import os
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.db.query_stats import instrument_engine
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -36,6 +39,55 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Async drivers for the sync URL schemes we support
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Derive the async driver URL from a sync database URL.
+
+    ASYNC_DATABASE_URL takes precedence when set.
+
+    Args:
+        database_url: Sync SQLAlchemy database URL
+
+    Returns:
+        Database URL using an asyncio driver
+    """
+    async_url = os.getenv("ASYNC_DATABASE_URL")
+    if async_url:
+        return async_url
+
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+
+# aiosqlite runs without a connection pool, so pool sizing only applies to servers
+async_engine_kwargs = (
+    {"pool_pre_ping": True}
+    if make_url(ASYNC_DATABASE_URL).get_backend_name() == "sqlite"
+    else engine_kwargs
+)
+
+async_engine: AsyncEngine = create_async_engine(ASYNC_DATABASE_URL, **async_engine_kwargs)
+
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
@@ -76,3 +128,22 @@ def get_db() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for async database sessions.
+
+    Use this in hot path operations so database I/O does not block the event
+    loop. Existing sync service code can run on the session via ``run_sync``.
+
+    Yields:
+        AsyncSession: Async database session
+
+    Example:
+        @app.get("/users/")
+        async def get_users(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(User))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
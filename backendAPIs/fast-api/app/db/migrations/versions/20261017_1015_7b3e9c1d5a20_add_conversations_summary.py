@@ -0,0 +1,61 @@
+"""add conversations summary
+
+Revision ID: 7b3e9c1d5a20
+Revises: 4f1c2a9d7e63
+Create Date: 2026-10-17 10:15:44.902311+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3e9c1d5a20'
+down_revision = '4f1c2a9d7e63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('conversations',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('partner_id', sa.String(length=36), nullable=False),
+    sa.Column('last_message_id', sa.BigInteger(), nullable=False),
+    sa.Column('last_message_sender_id', sa.String(length=36), nullable=False),
+    sa.Column('last_message_content', sa.Text(), nullable=True),
+    sa.Column('last_message_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['partner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'partner_id')
+    )
+    op.create_index('ix_conversations_user_id_last_message_id', 'conversations', ['user_id', 'last_message_id'], unique=False)
+
+    # Backfill one row per participant from the existing message history
+    op.execute("""
+        INSERT INTO conversations (
+            user_id, partner_id, last_message_id, last_message_sender_id,
+            last_message_content, last_message_at, unread_count
+        )
+        SELECT p.user_id, p.partner_id, m.id, m.sender_id, m.content, m.created_at,
+               (SELECT count(*) FROM user_messages u
+                WHERE u.sender_id = p.partner_id
+                  AND u.recevier_id = p.user_id
+                  AND u.is_read = false)
+        FROM (
+            SELECT user_id, partner_id, max(id) AS last_message_id
+            FROM (
+                SELECT sender_id AS user_id, recevier_id AS partner_id, id FROM user_messages
+                UNION ALL
+                SELECT recevier_id AS user_id, sender_id AS partner_id, id FROM user_messages
+            ) pairs
+            GROUP BY user_id, partner_id
+        ) p
+        JOIN user_messages m ON m.id = p.last_message_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conversations_user_id_last_message_id', table_name='conversations')
+    op.drop_table('conversations')
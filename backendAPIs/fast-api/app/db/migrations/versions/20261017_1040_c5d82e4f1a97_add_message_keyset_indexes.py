@@ -0,0 +1,26 @@
+"""add message keyset indexes
+
+Revision ID: c5d82e4f1a97
+Revises: 7b3e9c1d5a20
+Create Date: 2026-10-17 10:40:27.115630+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d82e4f1a97'
+down_revision = '7b3e9c1d5a20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_user_messages_sender_id_recevier_id_id', 'user_messages', ['sender_id', 'recevier_id', 'id'], unique=False)
+    op.create_index('ix_admin_messages_user_id_id', 'admin_messages', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_admin_messages_user_id_id', table_name='admin_messages')
+    op.drop_index('ix_user_messages_sender_id_recevier_id_id', table_name='user_messages')
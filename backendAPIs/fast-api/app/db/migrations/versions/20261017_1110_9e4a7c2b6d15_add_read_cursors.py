@@ -0,0 +1,87 @@
+"""add read cursors
+
+Revision ID: 9e4a7c2b6d15
+Revises: c5d82e4f1a97
+Create Date: 2026-10-17 11:10:52.348107+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4a7c2b6d15'
+down_revision = 'c5d82e4f1a97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('conversations', sa.Column('last_read_message_id', sa.BigInteger(), nullable=True))
+    op.create_table('admin_conversations',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('user_last_read_message_id', sa.BigInteger(), nullable=True),
+    sa.Column('admin_last_read_message_id', sa.BigInteger(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # Each cursor sits just before the reader's oldest unread message,
+    # or on the latest message when everything has been read
+    op.execute("""
+        UPDATE conversations
+        SET last_read_message_id = COALESCE(
+            (SELECT min(m.id) - 1 FROM user_messages m
+             WHERE m.sender_id = conversations.partner_id
+               AND m.recevier_id = conversations.user_id
+               AND m.is_read = false),
+            conversations.last_message_id
+        )
+    """)
+    op.execute("""
+        INSERT INTO admin_conversations (user_id, user_last_read_message_id, admin_last_read_message_id)
+        SELECT user_id,
+               COALESCE(min(CASE WHEN sender = 'Admin' AND is_read = false THEN id END) - 1, max(id)),
+               COALESCE(min(CASE WHEN sender = 'User' AND is_read = false THEN id END) - 1, max(id))
+        FROM admin_messages
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    """)
+
+    op.drop_column('conversations', 'unread_count')
+    op.drop_column('user_messages', 'is_read')
+    op.drop_column('admin_messages', 'is_read')
+
+
+def downgrade() -> None:
+    op.add_column('admin_messages', sa.Column('is_read', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('user_messages', sa.Column('is_read', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('conversations', sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        UPDATE user_messages
+        SET is_read = true
+        WHERE id <= (SELECT c.last_read_message_id FROM conversations c
+                     WHERE c.user_id = user_messages.recevier_id
+                       AND c.partner_id = user_messages.sender_id)
+    """)
+    op.execute("""
+        UPDATE admin_messages
+        SET is_read = true
+        WHERE id <= (SELECT CASE WHEN admin_messages.sender = 'Admin'
+                                 THEN a.user_last_read_message_id
+                                 ELSE a.admin_last_read_message_id END
+                     FROM admin_conversations a
+                     WHERE a.user_id = admin_messages.user_id)
+    """)
+    op.execute("""
+        UPDATE conversations
+        SET unread_count = (SELECT count(*) FROM user_messages m
+                            WHERE m.sender_id = conversations.partner_id
+                              AND m.recevier_id = conversations.user_id
+                              AND m.is_read = false)
+    """)
+
+    op.drop_table('admin_conversations')
+    op.drop_column('conversations', 'last_read_message_id')
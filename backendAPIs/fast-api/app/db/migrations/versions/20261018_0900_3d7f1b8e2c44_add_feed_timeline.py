@@ -0,0 +1,47 @@
+"""add feed timeline
+
+Revision ID: 3d7f1b8e2c44
+Revises: 9e4a7c2b6d15
+Create Date: 2026-10-18 09:00:31.662954+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d7f1b8e2c44'
+down_revision = '9e4a7c2b6d15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('feed_timeline',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('author_id', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['post_id'], ['creator_posts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'post_id')
+    )
+    op.create_index('ix_feed_timeline_user_id_author_id', 'feed_timeline', ['user_id', 'author_id'], unique=False)
+    op.create_index('ix_creator_posts_user_id_id', 'creator_posts', ['user_id', 'id'], unique=False)
+    op.add_column('users', sa.Column('feed_fanout_on_read', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # Backfill every follower's timeline with the posts their feed showed so far
+    op.execute("""
+        INSERT INTO feed_timeline (user_id, post_id, author_id)
+        SELECT f.following_user_id, p.id, p.user_id
+        FROM follows f
+        JOIN creator_posts p ON p.user_id = f.followed_user_id
+        WHERE p.status = 'APPROVED'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'feed_fanout_on_read')
+    op.drop_index('ix_creator_posts_user_id_id', table_name='creator_posts')
+    op.drop_index('ix_feed_timeline_user_id_author_id', table_name='feed_timeline')
+    op.drop_table('feed_timeline')
@@ -0,0 +1,41 @@
+"""add user search indexes
+
+Revision ID: a6c3e5f19b27
+Revises: 3d7f1b8e2c44
+Create Date: 2026-10-18 10:30:12.418305+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c3e5f19b27'
+down_revision = '3d7f1b8e2c44'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite builds its FTS5 index on first search (see app/db/search.py)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Prefix search; the expression must match name_tsvector() exactly
+    op.execute(
+        "CREATE INDEX ix_users_name_tsv ON users "
+        "USING gin (to_tsvector('simple'::regconfig, coalesce(name, '')))"
+    )
+    # Typo-tolerant word similarity and substring matches
+    op.execute("CREATE INDEX ix_users_name_trgm ON users USING gin (name gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_users_email_trgm ON users USING gin (email gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_name_trgm', table_name='users')
+    op.drop_index('ix_users_name_tsv', table_name='users')
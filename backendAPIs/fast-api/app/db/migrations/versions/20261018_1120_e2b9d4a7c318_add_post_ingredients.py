@@ -0,0 +1,33 @@
+"""add post ingredients
+
+Revision ID: e2b9d4a7c318
+Revises: a6c3e5f19b27
+Create Date: 2026-10-18 11:20:47.103958+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b9d4a7c318'
+down_revision = 'a6c3e5f19b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing posts are filled in by app/scripts/backfill_post_ingredients.py
+    op.create_table('post_ingredients',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('ingredient_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ingredient_id'], ['ingredients.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['post_id'], ['creator_posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id', 'ingredient_id')
+    )
+    op.create_index('ix_post_ingredients_ingredient_id_post_id', 'post_ingredients', ['ingredient_id', 'post_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_post_ingredients_ingredient_id_post_id', table_name='post_ingredients')
+    op.drop_table('post_ingredients')
@@ -0,0 +1,39 @@
+"""add user counters
+
+Revision ID: 5b8f2d6c9a41
+Revises: e2b9d4a7c318
+Create Date: 2026-10-18 13:00:12.487215+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b8f2d6c9a41'
+down_revision = 'e2b9d4a7c318'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('follower_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('following_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('post_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Initial values; app/scripts/repair_user_counters.py fixes later drift
+    op.execute("""
+        UPDATE users SET
+            follower_count = (SELECT count(*) FROM follows f WHERE f.followed_user_id = users.id),
+            following_count = (SELECT count(*) FROM follows f WHERE f.following_user_id = users.id),
+            post_count = (
+                SELECT count(*) FROM creator_posts p
+                WHERE p.user_id = users.id AND p.status = 'APPROVED'
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'post_count')
+    op.drop_column('users', 'following_count')
+    op.drop_column('users', 'follower_count')
@@ -0,0 +1,35 @@
+"""add hot query indexes
+
+Revision ID: 8d41c7e5b2f9
+Revises: 5b8f2d6c9a41
+Create Date: 2026-10-18 14:00:05.912844+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41c7e5b2f9'
+down_revision = '5b8f2d6c9a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable on PostgreSQL but cannot run
+    # inside a transaction; other databases build the indexes normally.
+    # Check the plans afterwards with app/scripts/check_query_plans.py
+    with op.get_context().autocommit_block():
+        op.create_index('ix_creator_posts_status_user_id_created_at', 'creator_posts', ['status', 'user_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_creator_posts_pending_created_at', 'creator_posts', ['created_at'], unique=False, postgresql_concurrently=True, postgresql_where=sa.text("status = 'PENDING'"), sqlite_where=sa.text("status = 'PENDING'"))
+        op.create_index('ix_follows_followed_user_id_following_user_id', 'follows', ['followed_user_id', 'following_user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_meal_planner_user_id_date', 'meal_planner', ['user_id', 'date'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_meal_planner_user_id_date', table_name='meal_planner', postgresql_concurrently=True)
+        op.drop_index('ix_follows_followed_user_id_following_user_id', table_name='follows', postgresql_concurrently=True)
+        op.drop_index('ix_creator_posts_pending_created_at', table_name='creator_posts', postgresql_concurrently=True)
+        op.drop_index('ix_creator_posts_status_user_id_created_at', table_name='creator_posts', postgresql_concurrently=True)
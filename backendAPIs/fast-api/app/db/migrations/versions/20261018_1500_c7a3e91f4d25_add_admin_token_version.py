@@ -0,0 +1,24 @@
+"""add admin token version
+
+Revision ID: c7a3e91f4d25
+Revises: 8d41c7e5b2f9
+Create Date: 2026-10-18 15:00:08.231904+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a3e91f4d25'
+down_revision = '8d41c7e5b2f9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('Admin', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('Admin', 'token_version')
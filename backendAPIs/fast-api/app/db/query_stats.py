@@ -0,0 +1,199 @@
+"""Per-request SQL instrumentation.
+
+Cursor execution events on the sync and async engines feed a collector that
+lives in a context variable for the duration of a request. The collector
+counts statements and database time, and groups them by statement text: since
+SQLAlchemy renders bound parameters as placeholders, the same text executed
+many times in one request is the signature of an N+1 loop.
+
+The HTTP middleware reports the totals in a ``Server-Timing`` header and logs
+N+1 patterns. ``assert_query_budget`` gives tests the same numbers.
+"""
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, List, Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config.logging_config import log_warning
+
+SQL_INSTRUMENTATION_ENABLED = os.getenv("SQL_INSTRUMENTATION_ENABLED", "true").lower() == "true"
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "3"))
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Statements and database time collected for one unit of work."""
+
+    def __init__(self, n_plus_one_threshold: int = 3):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.duration_seconds = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration_seconds: float) -> None:
+        """Record one executed statement."""
+        self.count += 1
+        self.duration_seconds += duration_seconds
+        self.statements[_WHITESPACE.sub(" ", statement).strip()] += 1
+
+    def merge(self, other: "QueryStats") -> None:
+        """Add another collector's statements to this one."""
+        self.count += other.count
+        self.duration_seconds += other.duration_seconds
+        self.statements.update(other.statements)
+
+    def repeated_statements(self) -> List[Tuple[str, int]]:
+        """Return statements executed at least ``n_plus_one_threshold`` times."""
+        return [
+            (statement, executions)
+            for statement, executions in self.statements.most_common()
+            if executions >= self.n_plus_one_threshold
+        ]
+
+    @property
+    def duration_ms(self) -> float:
+        """Total database time in milliseconds."""
+        return round(self.duration_seconds * 1000, 2)
+
+    def server_timing(self) -> str:
+        """Format the totals as a Server-Timing header value."""
+        return f'db;dur={self.duration_ms};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+_totals_lock = threading.Lock()
+_totals = {"requests": 0, "queries": 0, "n_plus_one_requests": 0}
+# Collectors of active assert_query_budget blocks; test clients may run the
+# app on another thread, so request stats are handed over explicitly
+_budget_collectors: List[QueryStats] = []
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    start_times = conn.info.get("query_start_times")
+    if stats is None or not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the collector to an engine (use ``AsyncEngine.sync_engine`` for async)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries(n_plus_one_threshold: Optional[int] = None) -> Generator[QueryStats, None, None]:
+    """Collect the statements executed in the current context.
+
+    Example:
+        with track_queries() as stats:
+            UserMessagesService.get_conversations(db, user_id)
+        print(stats.count, stats.repeated_statements())
+    """
+    stats = QueryStats(
+        n_plus_one_threshold=n_plus_one_threshold or N_PLUS_ONE_THRESHOLD
+    )
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_query_budget(
+    max_queries: int,
+    allow_n_plus_one: bool = False
+) -> Generator[QueryStats, None, None]:
+    """Fail when the wrapped code exceeds a query budget.
+
+    Intended for tests. Counts statements run directly in the block plus
+    those of every request the app finishes while the block is active, so it
+    works with TestClient as well as with direct service calls.
+
+    Example:
+        with assert_query_budget(3):
+            client.get("/api/v1/users/messages/conversations", headers=headers)
+
+    Raises:
+        AssertionError: If more than ``max_queries`` statements ran, or a
+            statement repeated like an N+1 loop while ``allow_n_plus_one``
+            is False
+    """
+    with track_queries() as stats:
+        with _totals_lock:
+            _budget_collectors.append(stats)
+        try:
+            yield stats
+        finally:
+            with _totals_lock:
+                _budget_collectors.remove(stats)
+
+    if stats.count > max_queries:
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n"
+            + "\n".join(f"  {n} x {statement}" for statement, n in stats.statements.most_common())
+        )
+    repeated = stats.repeated_statements()
+    if repeated and not allow_n_plus_one:
+        raise AssertionError(
+            "N+1 query pattern detected:\n"
+            + "\n".join(f"  {n} x {statement}" for statement, n in repeated)
+        )
+
+
+async def query_stats_middleware(request: Request, call_next):
+    """HTTP middleware that reports query counts and flags N+1 patterns."""
+    if not SQL_INSTRUMENTATION_ENABLED:
+        return await call_next(request)
+
+    with track_queries() as stats:
+        response = await call_next(request)
+
+    response.headers["Server-Timing"] = stats.server_timing()
+
+    repeated = stats.repeated_statements()
+    with _totals_lock:
+        _totals["requests"] += 1
+        _totals["queries"] += stats.count
+        if repeated:
+            _totals["n_plus_one_requests"] += 1
+        for collector in _budget_collectors:
+            collector.merge(stats)
+
+    for statement, executions in repeated:
+        log_warning(
+            f"Possible N+1 in {request.method} {request.url.path}: "
+            f"{executions} x {statement[:300]}"
+        )
+
+    return response
+
+
+def query_totals() -> dict:
+    """Return process-wide query counters for monitoring."""
+    with _totals_lock:
+        totals = dict(_totals)
+    totals["queries_per_request"] = (
+        round(totals["queries"] / totals["requests"], 2) if totals["requests"] else 0.0
+    )
+    totals["enabled"] = SQL_INSTRUMENTATION_ENABLED
+    return totals
+
@@ -0,0 +1,202 @@
+"""Indexed, ranked search over user names and emails.
+
+``ILIKE '%term%'`` cannot use a B-tree index, so every search scanned the
+whole users table. Searches now go through a dialect-specific index:
+
+* Postgres: a GIN index on ``to_tsvector('simple', name)`` answers prefix
+  queries (``chef:* & ann:*``), and ``pg_trgm`` GIN indexes on ``name`` and
+  ``email`` answer typo-tolerant word similarity and substring matches.
+  Results are ranked by ``ts_rank`` plus trigram similarity.
+* SQLite (local runs): every query word must be a prefix of a word in the
+  name (or a substring of the email) within one typo or swapped pair, checked by a Python
+  edit-distance function registered on the connection. Results are ranked
+  by the number of typos. When every word is at least six characters long
+  one typo cannot touch all of its trigrams, so an FTS5 trigram table narrows
+  the candidates first; shorter words are checked against every row, which
+  is fine for the small databases SQLite is used for.
+
+Both indexes are maintained by the database (an expression index on
+Postgres, triggers on SQLite), so profile updates that change a name are
+searchable immediately. The SQLite table is rebuilt whenever its triggers
+are missing, e.g. after the users table was dropped and created again.
+"""
+import re
+import threading
+from typing import List, Optional
+
+from sqlalchemy import String, column, func, literal_column, or_, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query
+
+from app.models.user import User
+
+FTS_TABLE = "users_search"
+FTS_TRIGGERS = (f"{FTS_TABLE}_ai", f"{FTS_TABLE}_ad", f"{FTS_TABLE}_au")
+
+# Typos allowed per query word on SQLite, for words of at least TYPO_MIN_LENGTH
+MAX_TYPOS = 1
+TYPO_MIN_LENGTH = 3
+# Shortest word that keeps a trigram intact through MAX_TYPOS edits
+INDEXED_MIN_LENGTH = 3 * MAX_TYPOS + 3
+
+_WORD = re.compile(r"\w+")
+
+_SQLITE_SETUP = (
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "name, email, content='users', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON users BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, name, email) VALUES (new.rowid, new.name, new.email); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON users BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, email) "
+    "VALUES ('delete', old.rowid, old.name, old.email); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name, email ON users BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, email) "
+    "VALUES ('delete', old.rowid, old.name, old.email); "
+    f"INSERT INTO {FTS_TABLE}(rowid, name, email) VALUES (new.rowid, new.name, new.email); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+
+_sqlite_lock = threading.Lock()
+
+
+def search_words(term: str) -> List[str]:
+    """Split a search term into lower-cased words."""
+    return _WORD.findall(term.lower())
+
+
+def name_tsvector():
+    """The expression indexed by ``ix_users_name_tsv``; queries must match it exactly."""
+    return func.to_tsvector(
+        literal_column("'simple'::regconfig"),
+        func.coalesce(User.name, literal_column("''"))
+    )
+
+
+def search_users(query: Query, term: str, include_email: bool = False) -> Query:
+    """
+    Filter a query over User to rows matching a search term, best match first.
+
+    Args:
+        query: ORM query selecting User
+        term: Free-text search term
+        include_email: Also match against the email address
+
+    Returns:
+        The filtered query ordered by relevance
+    """
+    dialect = query.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return _search_postgresql(query, term, include_email)
+    if dialect == "sqlite":
+        return _search_sqlite(query, term, include_email)
+    return _search_ilike(query, term, include_email)
+
+
+def _search_postgresql(query: Query, term: str, include_email: bool) -> Query:
+    words = search_words(term)
+    conditions = [User.name.op("%>")(term)]
+    rank = func.word_similarity(term, func.coalesce(User.name, ""))
+
+    if words:
+        tsquery = func.to_tsquery(
+            literal_column("'simple'::regconfig"),
+            " & ".join(f"{word}:*" for word in words)
+        )
+        conditions.append(name_tsvector().op("@@")(tsquery))
+        rank = rank + func.ts_rank(name_tsvector(), tsquery)
+
+    if include_email:
+        conditions.append(User.email.ilike(f"%{term}%"))
+        rank = rank + func.similarity(term, User.email)
+
+    return query.filter(or_(*conditions)).order_by(rank.desc(), User.id)
+
+
+def _search_sqlite(query: Query, term: str, include_email: bool) -> Query:
+    words = search_words(term)
+    if not words:
+        return _search_ilike(query, term, include_email)
+
+    connection = query.session.connection()
+    _ensure_sqlite_index(connection)
+    connection.connection.driver_connection.create_function(
+        "search_typos", 3, _search_typos, deterministic=True
+    )
+
+    typos = func.search_typos(
+        " ".join(words), User.name, User.email if include_email else literal_column("NULL")
+    )
+    query = query.filter(typos.isnot(None))
+
+    if all(len(word) >= INDEXED_MIN_LENGTH for word in words):
+        trigrams = dict.fromkeys(
+            word[i:i + 3] for word in words for i in range(len(word) - 2)
+        )
+        columns = "{name email}" if include_email else "{name}"
+        match = f"{columns} : (" + " OR ".join(f'"{trigram}"' for trigram in trigrams) + ")"
+        candidates = text(
+            f"SELECT users.id AS user_id FROM {FTS_TABLE} "
+            f"JOIN users ON users.rowid = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :match"
+        ).bindparams(match=match).columns(column("user_id", String))
+        query = query.filter(User.id.in_(candidates))
+
+    return query.order_by(typos, User.id)
+
+
+def _search_typos(words: str, name: Optional[str], email: Optional[str]) -> Optional[int]:
+    """SQLite function: typos needed for every word to match, or NULL when one does not."""
+    name_words = search_words(name or "")
+    email = (email or "").lower()
+    total = 0
+    for word in words.split():
+        if email and word in email:
+            continue
+        allowed = MAX_TYPOS if len(word) >= TYPO_MIN_LENGTH else 0
+        typos = min((_prefix_distance(word, name_word) for name_word in name_words), default=None)
+        if typos is None or typos > allowed:
+            return None
+        total += typos
+    return total
+
+
+def _prefix_distance(word: str, text_word: str) -> int:
+    """Edits (a swap of neighbours counts once) from ``word`` to the closest prefix of ``text_word``."""
+    before, row = None, list(range(len(text_word) + 1))
+    for i, char in enumerate(word, 1):
+        current = [i] + [0] * len(text_word)
+        for j, text_char in enumerate(text_word, 1):
+            current[j] = min(
+                row[j] + 1,
+                current[j - 1] + 1,
+                row[j - 1] + (char != text_char)
+            )
+            if before is not None and j > 1 and char == text_word[j - 2] and word[i - 2] == text_char:
+                current[j] = min(current[j], before[j - 2] + 1)
+        before, row = row, current
+    return min(row)
+
+
+def _ensure_sqlite_index(connection: Connection) -> None:
+    """Create and fill the FTS5 table unless all of its sync triggers exist.
+
+    Triggers go with the users table, while the FTS table outlives it, so a
+    missing trigger means the table may hold stale rows and is rebuilt.
+    """
+    def ready(conn) -> bool:
+        placeholders = ", ".join("?" for _ in FTS_TRIGGERS)
+        return conn.exec_driver_sql(
+            f"SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN ({placeholders})",
+            FTS_TRIGGERS
+        ).scalar() == len(FTS_TRIGGERS)
+
+    if ready(connection):
+        return
+    with _sqlite_lock:
+        # Committed on its own connection, whatever the caller's session does
+        with connection.engine.begin() as setup:
+            if ready(setup):
+                return
+            for statement in _SQLITE_SETUP:
+                setup.exec_driver_sql(statement)
@@ -0,0 +1,18 @@
+"""Dialect-aware INSERT .. ON CONFLICT.
+
+Postgres and SQLite both support ``ON CONFLICT DO UPDATE`` but SQLAlchemy
+exposes it through dialect-specific ``insert`` constructs.
+"""
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def upsert_insert(db: Session):
+    """Return the ``insert`` construct supporting ON CONFLICT for the session's database."""
+    return UPSERT_INSERTS[db.get_bind().dialect.name]
@@ -7,7 +7,7 @@ import os
 from contextlib import asynccontextmanager
 from typing import Annotated
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -15,9 +15,18 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config.logging_config import log_info, log_error, log_warning
+from app.config.loop_monitor import loop_monitor
 from app.config.middleware import AuthMiddleware
+from app.config.role_dependencies import RoleAccess
 from app.db.database import engine
+from app.db.query_stats import query_stats_middleware, query_totals
 from app.models.base import Base
+from app.realtime import hub
+from app.utils.master_cache import master_cache
+from app.utils.password_hasher import password_hasher
+from app.utils.principal_cache import principal_cache
+from app.utils.recipe_index import recipe_index
+from app.utils.token_revocation import revocation_list
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
@@ -27,9 +36,19 @@ Authenticated = Annotated[str, oauth2_scheme]
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
     try:
+        loop_monitor.start(app)
+        await hub.start()
+        try:
+            await master_cache.reload_async()
+        except Exception as e:
+            # Served requests load it lazily once the database is reachable
+            log_error(f"Error loading master data cache: {str(e)}")
         log_info("Application startup complete")
         yield
     finally:
+        await hub.stop()
+        await loop_monitor.stop()
+        password_hasher.shutdown()
         log_info("Application shutdown")
 
 
@@ -49,7 +68,11 @@ app.add_middleware(
     max_age=600,
 )
 
-app.middleware("http")(AuthMiddleware(app))
+# Kept on app.state so the WebSocket endpoint can reuse its token checks
+app.state.auth = AuthMiddleware(app)
+app.middleware("http")(app.state.auth)
+app.middleware("http")(loop_monitor.track_requests)
+app.middleware("http")(query_stats_middleware)
 
 # Exception Handlers
 @app.exception_handler(RequestValidationError)
@@ -77,8 +100,25 @@ async def health_check():
     return {"status": "healthy", "version": app.version}
 
 
+@app.get("/metrics", tags=["Health"], dependencies=[Depends(RoleAccess.admin_access)])
+async def metrics():
+    """Runtime metrics for monitoring, for admins only."""
+    return {
+        "auth_cache": principal_cache.stats(),
+        "token_revocations": revocation_list.stats(),
+        "password_hashing": password_hasher.stats(),
+        "event_loop": loop_monitor.stats(),
+        "sql": query_totals(),
+        "realtime": hub.stats(),
+        "recipe_index": recipe_index.stats(),
+        "master_data": master_cache.stats(),
+    }
+
+
 from app.api.authRoutes import router as auth_router
 from app.api.v1 import router as api_v1_router
+from app.api.realtimeRoutes import router as realtime_router
 
 app.include_router(auth_router)
 app.include_router(api_v1_router)
+app.include_router(realtime_router)
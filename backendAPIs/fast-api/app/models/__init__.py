@@ -21,3 +21,8 @@ from .creator_post import CreatorPost
 from .follow import Follow
 from .user_message import UserMessage
 from .admin_message import AdminMessage
+from .token_revocation import TokenRevocation
+from .conversation import Conversation
+from .admin_conversation import AdminConversation
+from .feed_entry import FeedEntry
+from .post_ingredient import PostIngredient
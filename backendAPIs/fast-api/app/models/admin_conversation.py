@@ -0,0 +1,18 @@
+from sqlalchemy import Column, BigInteger, String, ForeignKey, DateTime
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class AdminConversation(Base):
+    __tablename__ = "admin_conversations"
+
+    # Read cursors for a user's support conversation. Admins share one
+    # inbox, so there is a single cursor for the admin side.
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    user_last_read_message_id = Column(BigInteger, nullable=True)
+    admin_last_read_message_id = Column(BigInteger, nullable=True)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<AdminConversation(user_id={self.user_id!r})>"
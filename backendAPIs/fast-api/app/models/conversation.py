@@ -0,0 +1,28 @@
+from sqlalchemy import Column, BigInteger, String, Text, ForeignKey, DateTime, Index
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class Conversation(Base):
+    __tablename__ = "conversations"
+
+    # One row per participant, so a user's conversation list is a single
+    # range scan over (user_id, last_message_id). Maintained by
+    # UserMessagesService in the same transaction as the messages.
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    partner_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    last_message_id = Column(BigInteger, nullable=False)
+    last_message_sender_id = Column(String(36), nullable=False)
+    last_message_content = Column(Text, nullable=True)
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
+    # Read cursor: messages from the partner with a higher id are unread
+    last_read_message_id = Column(BigInteger, nullable=True)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_conversations_user_id_last_message_id", "user_id", "last_message_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Conversation(user_id={self.user_id!r}, partner_id={self.partner_id!r}, last_message_id={self.last_message_id!r})>"
@@ -9,8 +9,9 @@ from sqlalchemy import (
     ForeignKey,
     JSON,
     Enum,
+    Index,
 )
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -44,5 +45,19 @@ class CreatorPost(Base):
 
     user = relationship("User", back_populates="creator_posts")
 
+    __table_args__ = (
+        # Latest posts of one creator (feed backfill and read-time merge)
+        Index("ix_creator_posts_user_id_id", "user_id", "id"),
+        # A creator's approved posts, newest first (dashboard, counters)
+        Index("ix_creator_posts_status_user_id_created_at", "status", "user_id", "created_at"),
+        # Admin moderation queue
+        Index(
+            "ix_creator_posts_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<CreatorPost(id={self.id!r}, title={self.title!r})>"
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+
+from .base import Base
+
+
+class FeedEntry(Base):
+    __tablename__ = "feed_timeline"
+
+    # Materialized home feed: one row per (follower, approved post), written
+    # when a post is approved. Paged by post_id along the primary key.
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    post_id = Column(Integer, ForeignKey("creator_posts.id", ondelete="CASCADE"), primary_key=True)
+    author_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    __table_args__ = (
+        # Pruning an author's posts on unfollow
+        Index("ix_feed_timeline_user_id_author_id", "user_id", "author_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<FeedEntry(user_id={self.user_id!r}, post_id={self.post_id!r})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -17,6 +17,8 @@ class Follow(Base):
 
     __table_args__ = (
         UniqueConstraint("following_user_id", "followed_user_id", name="uix_user_follows"),
+        # Followers of a user (feed fan-out, counters)
+        Index("ix_follows_followed_user_id_following_user_id", "followed_user_id", "following_user_id"),
     )
 
     def __repr__(self) -> str:  
@@ -1,5 +1,5 @@
 from uuid import uuid4
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -25,5 +25,10 @@ class MealPlanner(Base):
     user = relationship("User", back_populates="meal_plans")
     meal = relationship("Meal")
 
+    __table_args__ = (
+        # A user's meals for a day (dashboard)
+        Index("ix_meal_planner_user_id_date", "user_id", "date"),
+    )
+
     def __repr__(self) -> str:  
         return f"<MealPlanner(id={self.id!r}, user_id={self.user_id!r}, date={self.date!r})>"
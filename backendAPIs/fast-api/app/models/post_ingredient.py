@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+
+from .base import Base
+
+
+class PostIngredient(Base):
+    __tablename__ = "post_ingredients"
+
+    # Master ingredients used by a creator post, matched from the post's
+    # free-form ingredients JSON by app.utils.ingredient_matcher
+    post_id = Column(Integer, ForeignKey("creator_posts.id", ondelete="CASCADE"), primary_key=True)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        # Posts containing an ingredient and per-ingredient post counts
+        Index("ix_post_ingredients_ingredient_id_post_id", "ingredient_id", "post_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PostIngredient(post_id={self.post_id!r}, ingredient_id={self.ingredient_id!r})>"
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, BigInteger, String, Integer, DateTime
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class TokenRevocation(Base):
+    __tablename__ = "token_revocations"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    # No FK: revocations must outlive deleted users until their tokens expire
+    user_id = Column(String(36), nullable=False, index=True)
+    token_version = Column(Integer, nullable=True)
+    jti = Column(String(64), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<TokenRevocation(id={self.id!r}, user_id={self.user_id!r}, token_version={self.token_version!r})>"
@@ -10,6 +10,7 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     Index,
+    false,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -29,7 +30,7 @@ class User(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     profile_pic = Column(String(1024), nullable=True)
     name = Column(String(200), nullable=True)
-    email = Column(String(320), nullable=False, index=True)
+    email = Column(String(320), nullable=False)
     phone_no = Column(String(32), nullable=True)
     country_id = Column(Integer, ForeignKey("countries.id", ondelete="SET NULL"), nullable=True, index=True)
     city_id = Column(Integer, ForeignKey("cities.id", ondelete="SET NULL"), nullable=True, index=True)
@@ -42,6 +43,15 @@ class User(Base):
     about_me = Column(Text, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
     is_creator = Column(Boolean, nullable=False, default=False)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Creators with too many followers to fan out to; their posts are merged
+    # into followers' feeds at read time instead
+    feed_fanout_on_read = Column(Boolean, nullable=False, default=False, server_default=false())
+    # Denormalized counters, kept in step by UserCounterService and repaired
+    # by app/scripts/repair_user_counters.py
+    follower_count = Column(Integer, nullable=False, default=0, server_default="0")
+    following_count = Column(Integer, nullable=False, default=0, server_default="0")
+    post_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, BigInteger, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -8,11 +8,10 @@ from .base import Base
 class UserMessage(Base):
     __tablename__ = "user_messages"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
     sender_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     recevier_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=True)
-    is_read = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
@@ -20,5 +19,10 @@ class UserMessage(Base):
     sender = relationship("User", back_populates="sent_messages", foreign_keys=[sender_id])
     receiver = relationship("User", back_populates="received_messages", foreign_keys=[recevier_id])
 
+    __table_args__ = (
+        # Keyset pagination over one direction of a conversation
+        Index("ix_user_messages_sender_id_recevier_id_id", "sender_id", "recevier_id", "id"),
+    )
+
     def __repr__(self) -> str:  
         return f"<UserMessage(id={self.id!r}, sender_id={self.sender_id!r}, recevier_id={self.recevier_id!r})>"
\ No newline at end of file
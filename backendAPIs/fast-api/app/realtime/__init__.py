@@ -0,0 +1,5 @@
+"""Realtime delivery of messaging events over WebSockets."""
+from app.realtime.broker import Broker, LocalBroker, PostgresBroker
+from app.realtime.hub import ConnectionHub, hub
+
+__all__ = ["Broker", "LocalBroker", "PostgresBroker", "ConnectionHub", "hub"]
@@ -0,0 +1,234 @@
+"""Pub/sub brokers that carry realtime events between workers.
+
+Every uvicorn worker has its own connection hub, and a recipient's socket may
+be held by any of them. The hub therefore never delivers directly: it
+publishes each event to a broker and delivers what the broker hands back.
+
+``LocalBroker`` loops events straight back inside the process; it is enough
+for a single worker and for development. ``PostgresBroker`` uses
+LISTEN/NOTIFY on the application database so all workers see every event
+without another piece of infrastructure. Its LISTEN connection is watched
+and re-established with backoff when it drops; until then the worker only
+delivers its own events, and the hub resynchronises presence afterwards.
+"""
+import asyncio
+import contextlib
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.engine import make_url
+
+from app.config.json_response import dumps
+from app.config.logging_config import log_error, log_info, log_warning
+
+EventHandler = Callable[[dict], Awaitable[None]]
+
+# NOTIFY payloads are limited to 8000 bytes
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+
+class Broker(ABC):
+    """Interface for delivering hub events to every worker."""
+
+    # Called after an outage in which events from other workers may have been lost
+    on_reconnect: Optional[Callable[[], Awaitable[None]]] = None
+
+    @abstractmethod
+    async def start(self, handler: EventHandler) -> None:
+        """Begin delivering published events to ``handler``."""
+
+    @abstractmethod
+    async def publish(self, event: dict) -> None:
+        """Publish an event to every subscribed worker, including this one."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop delivering events and release resources."""
+
+    def stats(self) -> dict:
+        """Return connection counters for monitoring."""
+        return {}
+
+
+class LocalBroker(Broker):
+    """In-process broker: events only reach the publishing worker."""
+
+    def __init__(self):
+        self._handler: Optional[EventHandler] = None
+
+    async def start(self, handler: EventHandler) -> None:
+        self._handler = handler
+
+    async def publish(self, event: dict) -> None:
+        if self._handler is not None:
+            await self._handler(event)
+
+    async def stop(self) -> None:
+        self._handler = None
+
+
+class PostgresBroker(Broker):
+    """Broker on Postgres LISTEN/NOTIFY, shared by all workers on the database."""
+
+    def __init__(
+        self,
+        database_url: str,
+        channel: str = "foodie_realtime",
+        health_check_seconds: float = 5.0,
+        reconnect_min_seconds: float = 0.5,
+        reconnect_max_seconds: float = 30.0
+    ):
+        # asyncpg takes a plain libpq-style DSN
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self.health_check_seconds = health_check_seconds
+        self.reconnect_min_seconds = reconnect_min_seconds
+        self.reconnect_max_seconds = reconnect_max_seconds
+        self._connection = None
+        self._handler: Optional[EventHandler] = None
+        self._tasks = set()
+        # An asyncpg connection runs one statement at a time
+        self._publish_lock = asyncio.Lock()
+        self._lost: Optional[asyncio.Event] = None
+        self._supervisor: Optional[asyncio.Task] = None
+        self._down_since: Optional[float] = None
+        self.reconnects = 0
+
+    async def start(self, handler: EventHandler) -> None:
+        self._handler = handler
+        self._lost = asyncio.Event()
+        await self._connect()
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    async def _connect(self) -> None:
+        """Open the LISTEN connection and watch it for termination."""
+        import asyncpg
+
+        connection = await asyncpg.connect(self.dsn)
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+        except Exception:
+            await connection.close()
+            raise
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+        self._lost.clear()
+
+    def _on_termination(self, connection) -> None:
+        """asyncpg callback for a connection closed by anything but stop()."""
+        if connection is self._connection:
+            self._lost.set()
+
+    async def _supervise(self) -> None:
+        """Health-check the LISTEN connection and reconnect when it is gone."""
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._lost.wait(), self.health_check_seconds)
+            if not await self._is_healthy():
+                await self._reconnect()
+
+    async def _is_healthy(self) -> bool:
+        """Whether the connection is open and answers a query in time."""
+        if self._lost.is_set() or self._connection is None or self._connection.is_closed():
+            return False
+
+        async def ping() -> None:
+            async with self._publish_lock:
+                await self._connection.execute("SELECT 1")
+
+        try:
+            await asyncio.wait_for(ping(), self.health_check_seconds)
+            return True
+        except Exception as e:
+            log_error(f"Realtime LISTEN connection failed its health check: {str(e) or type(e).__name__}")
+            return False
+
+    async def _reconnect(self) -> None:
+        """Replace the LISTEN connection, backing off while the database is unreachable."""
+        self._down_since = time.monotonic()
+        log_error(
+            f"Realtime LISTEN connection on {self.channel} lost; "
+            "events from other workers are not received until it reconnects"
+        )
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.remove_termination_listener(self._on_termination)
+            connection.terminate()
+
+        delay = self.reconnect_min_seconds
+        while True:
+            try:
+                await self._connect()
+                break
+            except Exception as e:
+                log_warning(f"Realtime LISTEN reconnect failed, retrying in {delay:.1f} s: {str(e)}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max_seconds)
+
+        outage = time.monotonic() - self._down_since
+        self._down_since = None
+        self.reconnects += 1
+        log_info(f"Realtime LISTEN connection restored after {outage:.1f} s")
+        if self.on_reconnect is not None:
+            try:
+                await self.on_reconnect()
+            except Exception as e:
+                log_error(f"Error resynchronising realtime state: {str(e)}")
+
+    async def publish(self, event: dict) -> None:
+        payload = dumps(event).decode("utf-8")
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            # Too large for NOTIFY: send the event type only, clients refetch
+            log_warning(f"Realtime event too large for NOTIFY ({len(payload)} bytes), sending without payload")
+            payload = dumps({**event, "event": {"type": event["event"]["type"], "truncated": True}}).decode("utf-8")
+
+        if self._connection is None:
+            # Reconnecting: the outage is logged once by the supervisor
+            await self._handler(event)
+            return
+
+        try:
+            async with self._publish_lock:
+                await self._connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except Exception as e:
+            # Keep at least this worker's clients up to date
+            log_error(f"Error publishing realtime event: {str(e)}")
+            await self._handler(event)
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        """asyncpg listener callback; hands the event to the hub on the loop."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            log_warning("Dropping malformed realtime notification")
+            return
+
+        task = asyncio.get_running_loop().create_task(self._handler(event))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._supervisor
+            self._supervisor = None
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            connection.remove_termination_listener(self._on_termination)
+            try:
+                await connection.remove_listener(self.channel, self._on_notification)
+                await connection.close()
+            except Exception as e:
+                log_warning(f"Error closing realtime LISTEN connection: {str(e)}")
+                connection.terminate()
+        self._handler = None
+
+    def stats(self) -> dict:
+        return {
+            "connected": self._connection is not None and not self._connection.is_closed(),
+            "reconnects": self.reconnects,
+            "outage_seconds": round(time.monotonic() - self._down_since, 1) if self._down_since else 0.0,
+        }
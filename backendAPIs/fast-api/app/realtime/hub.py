@@ -0,0 +1,274 @@
+"""In-process hub of WebSocket connections.
+
+The hub owns this worker's sockets, keyed by user id (admins are additionally
+grouped so user-to-admin messages reach whichever admin is connected). Events
+are published through the broker and delivered by every worker to the
+sockets it holds, so senders never need to know where a recipient is
+connected.
+
+Presence is shared the same way: each worker announces when a user's first
+socket connects and last socket disconnects, and every hub keeps the set of
+other workers holding a connection for each user. Workers also publish a
+heartbeat; presence held by a worker that has not been heard from within the
+TTL (it crashed or was redeployed) is ignored and then dropped. A starting
+worker asks the others for a snapshot of their connected users, and a worker
+that stops cleanly says goodbye so its users go offline at once. When the
+broker recovers from an outage the worker does both again, since presence
+events sent in the meantime were lost.
+"""
+import asyncio
+import contextlib
+import os
+import time
+from typing import Dict, Iterable, Optional, Set
+from uuid import uuid4
+
+from fastapi import WebSocket
+
+from app.config.json_response import dumps
+from app.config.logging_config import log_error, log_info
+from app.realtime.broker import Broker, LocalBroker, PostgresBroker
+
+ADMINS = "@admins"
+# User ids per snapshot event, keeping NOTIFY payloads well under 8000 bytes
+SNAPSHOT_CHUNK_SIZE = 100
+
+
+class ConnectionHub:
+    """Track WebSocket connections and deliver events to them."""
+
+    def __init__(
+        self,
+        broker: Broker,
+        heartbeat_seconds: float = 10.0,
+        presence_ttl_seconds: Optional[float] = None
+    ):
+        self.broker = broker
+        self.worker_id = uuid4().hex
+        self.heartbeat_seconds = heartbeat_seconds
+        self.presence_ttl_seconds = presence_ttl_seconds or heartbeat_seconds * 3
+        self._connections: Dict[str, Set[WebSocket]] = {}
+        self._admin_ids: Set[str] = set()
+        # user id -> other workers holding a socket for the user
+        self._presence: Dict[str, Set[str]] = {}
+        # other worker id -> when it was last heard from (monotonic)
+        self._worker_seen: Dict[str, float] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._started = False
+
+    async def start(self) -> None:
+        """Subscribe to the broker and start heartbeating."""
+        if self._started:
+            return
+        self.broker.on_reconnect = self._resync
+        await self.broker.start(self._on_event)
+        self._started = True
+        await self._publish({"kind": "hello", "worker_id": self.worker_id})
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        log_info(f"Realtime hub started with {type(self.broker).__name__}")
+
+    async def stop(self) -> None:
+        """Say goodbye, close every socket and unsubscribe from the broker."""
+        if not self._started:
+            return
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat_task
+            self._heartbeat_task = None
+        await self._publish({"kind": "goodbye", "worker_id": self.worker_id})
+        for sockets in list(self._connections.values()):
+            for websocket in list(sockets):
+                try:
+                    await websocket.close(code=1001)
+                except Exception:
+                    pass
+        self._connections.clear()
+        self._admin_ids.clear()
+        self._presence.clear()
+        self._worker_seen.clear()
+        await self.broker.stop()
+        self._started = False
+
+    async def connect(self, user_id: str, websocket: WebSocket, is_admin: bool = False) -> None:
+        """Register an accepted socket for a user."""
+        sockets = self._connections.setdefault(user_id, set())
+        first_socket = not sockets
+        sockets.add(websocket)
+        if is_admin:
+            self._admin_ids.add(user_id)
+        if first_socket:
+            await self._announce_presence(user_id, online=True)
+
+    async def disconnect(self, user_id: str, websocket: WebSocket) -> None:
+        """Forget a socket; announces the user offline when it was the last one."""
+        sockets = self._connections.get(user_id)
+        if not sockets:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del self._connections[user_id]
+            self._admin_ids.discard(user_id)
+            await self._announce_presence(user_id, online=False)
+
+    def is_online(self, user_id: str) -> bool:
+        """Whether the user has an open socket on any live worker."""
+        if user_id in self._connections:
+            return True
+        return any(self._is_alive(worker_id) for worker_id in self._presence.get(user_id, ()))
+
+    def _is_alive(self, worker_id: str) -> bool:
+        """Whether another worker has been heard from within the presence TTL."""
+        seen = self._worker_seen.get(worker_id)
+        return seen is not None and time.monotonic() - seen < self.presence_ttl_seconds
+
+    async def send_to_users(self, user_ids: Iterable[str], event: dict) -> None:
+        """Deliver an event to every socket of the given users."""
+        await self._publish({"kind": "deliver", "to": list(dict.fromkeys(user_ids)), "event": event})
+
+    async def send_to_admins(self, event: dict) -> None:
+        """Deliver an event to every connected admin."""
+        await self._publish({"kind": "deliver", "to": [ADMINS], "event": event})
+
+    async def _publish(self, envelope: dict) -> None:
+        """Publish without ever failing the calling request."""
+        try:
+            await self.broker.publish(envelope)
+        except Exception as e:
+            log_error(f"Error publishing realtime event: {str(e)}")
+
+    async def _announce_presence(self, user_id: str, online: bool) -> None:
+        await self._publish({
+            "kind": "presence",
+            "user_id": user_id,
+            "online": online,
+            "worker_id": self.worker_id,
+        })
+
+    async def _heartbeat(self) -> None:
+        """Tell the other workers this one is alive and expire those that are not."""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            await self._publish({"kind": "heartbeat", "worker_id": self.worker_id})
+            self._expire_workers()
+
+    def _expire_workers(self) -> None:
+        """Drop the presence of workers not heard from within the TTL."""
+        dead = {worker_id for worker_id in self._worker_seen if not self._is_alive(worker_id)}
+        if dead:
+            self._forget_workers(dead)
+            log_info(f"Expired presence of {len(dead)} silent realtime worker(s)")
+
+    def _forget_workers(self, worker_ids: Set[str]) -> None:
+        for worker_id in worker_ids:
+            self._worker_seen.pop(worker_id, None)
+        for user_id in list(self._presence):
+            workers = self._presence[user_id] - worker_ids
+            if workers:
+                self._presence[user_id] = workers
+            else:
+                del self._presence[user_id]
+
+    async def _resync(self) -> None:
+        """Rebuild shared presence after the broker may have dropped events."""
+        self._presence.clear()
+        # Replace what the other workers hold for this one, then ask for theirs
+        await self._publish({"kind": "goodbye", "worker_id": self.worker_id})
+        await self._send_snapshot()
+        await self._publish({"kind": "hello", "worker_id": self.worker_id})
+        log_info("Realtime presence resynchronised after a broker outage")
+
+    async def _send_snapshot(self) -> None:
+        """Publish the users connected to this worker, in NOTIFY-sized chunks."""
+        user_ids = list(self._connections)
+        for start in range(0, len(user_ids), SNAPSHOT_CHUNK_SIZE):
+            await self._publish({
+                "kind": "snapshot",
+                "worker_id": self.worker_id,
+                "user_ids": user_ids[start:start + SNAPSHOT_CHUNK_SIZE],
+            })
+
+    async def _on_presence_event(self, kind: str, envelope: dict) -> None:
+        """Track another worker's liveness and connected users."""
+        worker_id = envelope["worker_id"]
+        known = worker_id in self._worker_seen
+        self._worker_seen[worker_id] = time.monotonic()
+
+        if kind == "presence":
+            workers = self._presence.setdefault(envelope["user_id"], set())
+            if envelope["online"]:
+                workers.add(worker_id)
+            else:
+                workers.discard(worker_id)
+                if not workers:
+                    del self._presence[envelope["user_id"]]
+        elif kind == "snapshot":
+            for user_id in envelope["user_ids"]:
+                self._presence.setdefault(user_id, set()).add(worker_id)
+        elif kind == "hello":
+            await self._send_snapshot()
+        elif kind == "goodbye":
+            self._forget_workers({worker_id})
+        elif kind == "heartbeat" and not known:
+            # A worker we have no record of, e.g. one whose presence expired
+            # while it was unreachable: ask everyone for their users again
+            await self._publish({"kind": "hello", "worker_id": self.worker_id})
+
+    async def _on_event(self, envelope: dict) -> None:
+        """Handle an event coming back from the broker."""
+        kind = envelope.get("kind")
+        if kind in ("presence", "snapshot", "hello", "goodbye", "heartbeat"):
+            # This worker answers for its own users from _connections
+            if envelope["worker_id"] != self.worker_id:
+                await self._on_presence_event(kind, envelope)
+        elif kind == "deliver":
+            recipients: Set[str] = set()
+            for target in envelope["to"]:
+                recipients.update(self._admin_ids if target == ADMINS else [target])
+            if not recipients:
+                return
+            # Encode once for every recipient socket
+            payload = dumps(envelope["event"]).decode("utf-8")
+            await asyncio.gather(*(self._deliver(user_id, payload) for user_id in recipients))
+
+    async def _deliver(self, user_id: str, payload: str) -> None:
+        """Send an encoded event to this worker's sockets for a user, dropping dead ones."""
+        for websocket in list(self._connections.get(user_id, ())):
+            try:
+                await websocket.send_text(payload)
+            except Exception:
+                await self.disconnect(user_id, websocket)
+
+    def stats(self) -> dict:
+        """Return connection counters for monitoring."""
+        return {
+            "broker": type(self.broker).__name__,
+            "connected_users": len(self._connections),
+            "connections": sum(len(sockets) for sockets in self._connections.values()),
+            "online_users": len(set(self._connections) | {
+                user_id for user_id, workers in self._presence.items()
+                if any(self._is_alive(worker_id) for worker_id in workers)
+            }),
+            "live_workers": 1 + sum(1 for worker_id in self._worker_seen if self._is_alive(worker_id)),
+            "broker_connection": self.broker.stats(),
+        }
+
+
+def create_broker() -> Broker:
+    """Build the broker selected by REALTIME_BROKER."""
+    broker_name = os.getenv("REALTIME_BROKER", "local").lower()
+    if broker_name == "local":
+        return LocalBroker()
+    if broker_name == "postgres":
+        return PostgresBroker(
+            os.getenv("DATABASE_URL"),
+            channel=os.getenv("REALTIME_CHANNEL", "foodie_realtime"),
+            health_check_seconds=float(os.getenv("REALTIME_HEALTH_CHECK_SECONDS", "5")),
+        )
+    raise ValueError("REALTIME_BROKER must be 'local' or 'postgres'")
+
+
+hub = ConnectionHub(
+    create_broker(),
+    heartbeat_seconds=float(os.getenv("REALTIME_HEARTBEAT_SECONDS", "10")),
+)
@@ -12,6 +12,7 @@ from app.schemas.adminSchema import (
 )
 from app.services.admin.adminCreatorRequestService import AdminCreatorRequestService
 from app.config.response_helper import ResponseHelper
+from app.utils.pagination import CountMode
 
 
 router = APIRouter(prefix="/creator-requests")
@@ -23,6 +24,7 @@ async def get_creator_requests(
     status_filter: Optional[str] = Query(None, description="Filter by status (PENDING, APPROVED, REJECTED)"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=200, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """
@@ -34,7 +36,7 @@ async def get_creator_requests(
     """
     try:
         requests_data = AdminCreatorRequestService.get_creator_requests(
-            db, status_filter, skip, limit
+            db, status_filter, skip, limit, count
         )
         return ResponseHelper.success_response(
             data=requests_data,
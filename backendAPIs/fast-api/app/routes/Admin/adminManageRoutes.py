@@ -12,6 +12,7 @@ from app.schemas.adminSchema import (
 )
 from app.services.admin.adminManageService import AdminManageService
 from app.config.response_helper import ResponseHelper
+from app.utils.pagination import CountMode
 
 
 router = APIRouter(prefix="/manage")
@@ -22,6 +23,7 @@ async def get_users(
     search: Optional[str] = Query(None, description="Search by name or email"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=200, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """
@@ -30,7 +32,7 @@ async def get_users(
     Returns paginated list of users with optional search filter.
     """
     try:
-        users_data = AdminManageService.get_users(db, search, skip, limit)
+        users_data = AdminManageService.get_users(db, search, skip, limit, count)
         return ResponseHelper.success_response(
             data=users_data,
             message="Users fetched successfully"
@@ -49,6 +51,7 @@ async def get_creators(
     search: Optional[str] = Query(None, description="Search by name or email"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=200, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """
@@ -57,7 +60,7 @@ async def get_creators(
     Returns paginated list of creators with optional search filter.
     """
     try:
-        creators_data = AdminManageService.get_creators(db, search, skip, limit)
+        creators_data = AdminManageService.get_creators(db, search, skip, limit, count)
         return ResponseHelper.success_response(
             data=creators_data,
             message="Creators fetched successfully"
@@ -0,0 +1,35 @@
+"""API routes for admin master data operations."""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.utils.master_cache import master_cache
+from app.config.response_helper import ResponseHelper
+
+
+router = APIRouter(prefix="/master")
+
+
+@router.post("/reload")
+async def reload_master_data(
+    db: Session = Depends(get_db)
+) -> JSONResponse:
+    """
+    Reload the master data cache after countries, cities, meals or
+    ingredients were edited.
+    
+    Reloads the worker serving the request at once; other workers pick the
+    change up within MASTER_CACHE_REFRESH_SECONDS.
+    """
+    try:
+        data = await master_cache.reload_async(db)
+        return ResponseHelper.success_response(
+            data={"version": data.version},
+            message="Master data reloaded successfully"
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
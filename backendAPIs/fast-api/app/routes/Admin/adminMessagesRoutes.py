@@ -1,4 +1,6 @@
 """API routes for admin messaging operations."""
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
@@ -13,6 +15,7 @@ from app.schemas.adminSchema import (
 )
 from app.services.admin.adminMessagesService import AdminMessagesService
 from app.config.response_helper import ResponseHelper
+from app.realtime import hub
 
 
 router = APIRouter(prefix="/messages")
@@ -49,21 +52,23 @@ async def get_conversations(
 async def get_messages(
     request: Request,
     user_id: str,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
+    before_id: Optional[int] = Query(None, description="Only messages older than this message id"),
+    after_id: Optional[int] = Query(None, description="Only messages newer than this message id"),
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """
     Get messages for a specific conversation with a user.
     
-    Returns paginated messages between admin and specified user.
+    Returns messages between admin and specified user, newest first.
+    Page back with before_id or poll for new messages with after_id.
     Automatically marks user messages as read.
     Admin ID is extracted from JWT token in request state.
     """
     try:
         admin_id = request.state.user_id
         messages_data = AdminMessagesService.get_messages(
-            db, admin_id, user_id, skip, limit
+            db, admin_id, user_id, limit, before_id, after_id
         )
         return ResponseHelper.success_response(
             data=messages_data,
@@ -99,6 +104,9 @@ async def send_message(
             user_id,
             message_request.content
         )
+        event = {"type": "admin_message", "message": message_data}
+        await hub.send_to_users([user_id], event)
+        await hub.send_to_admins(event)
         return ResponseHelper.created_response(
             data=message_data,
             message="Message sent successfully"
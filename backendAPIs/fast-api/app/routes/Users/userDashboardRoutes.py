@@ -1,9 +1,9 @@
 """API routes for user dashboard operations."""
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.schemas.userDashboardSchema import (
     DateRequest,
     MarkMealsDoneRequest,
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/dashboard")
 async def get_todays_meals(
     request: Request,
     date_request: DateRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Fetch meals for a specific date.
@@ -33,7 +33,7 @@ async def get_todays_meals(
     """
     try:
         user_id = request.state.user_id
-        meals_data = UserDashboardService.get_todays_meals(
+        meals_data = await UserDashboardService.get_todays_meals_async(
             db, user_id, date_request.date
         )
         return ResponseHelper.success_response(
@@ -53,7 +53,7 @@ async def get_todays_meals(
 async def get_calories_intake(
     request: Request,
     date_request: DateRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Calculate total calories intake for a specific date.
@@ -63,7 +63,7 @@ async def get_calories_intake(
     """
     try:
         user_id = request.state.user_id
-        calories_data = UserDashboardService.get_calories_intake(
+        calories_data = await UserDashboardService.get_calories_intake_async(
             db, user_id, date_request.date
         )
         return ResponseHelper.success_response(
@@ -83,7 +83,7 @@ async def get_calories_intake(
 async def mark_meals_done(
     request: Request,
     mark_request: MarkMealsDoneRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Mark multiple meals as done.
@@ -93,7 +93,7 @@ async def mark_meals_done(
     """
     try:
         user_id = request.state.user_id
-        result = UserDashboardService.mark_meals_done(
+        result = await UserDashboardService.mark_meals_done_async(
             db, user_id, mark_request.meal_ids
         )
         return ResponseHelper.success_response(
@@ -112,7 +112,7 @@ async def mark_meals_done(
 @router.get("/latest-post")
 async def get_latest_followed_user_post(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Get the latest approved post from users that the current user follows.
@@ -122,7 +122,7 @@ async def get_latest_followed_user_post(
     """
     try:
         user_id = request.state.user_id
-        post_data = UserDashboardService.get_latest_followed_user_post(db, user_id)
+        post_data = await UserDashboardService.get_latest_followed_user_post_async(db, user_id)
         
         if not post_data:
             return ResponseHelper.success_response(
@@ -1,9 +1,11 @@
 """API routes for user messaging operations."""
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.schemas.userMessagesSchema import (
     SendMessageRequest,
     SendAdminMessageRequest,
@@ -20,6 +22,7 @@ from app.services.users.userMessagesService import (
     AdminMessagesService
 )
 from app.config.response_helper import ResponseHelper
+from app.realtime import hub
 
 
 router = APIRouter(prefix="/messages")
@@ -30,19 +33,23 @@ router = APIRouter(prefix="/messages")
 @router.get("/conversations")
 async def get_conversations(
     request: Request,
-    db: Session = Depends(get_db)
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of conversations to return"),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
-    Get list of all conversations for the current user.
+    Get conversations for the current user, most recent first.
     
-    Returns conversations with last message, unread count, and user details.
-    User ID is extracted from JWT token in request state.
+    Returns conversations with last message, unread count, and user details,
+    paginated by cursor. User ID is extracted from JWT token in request state.
     """
     try:
         user_id = request.state.user_id
-        conversations = UserMessagesService.get_conversations(db, user_id)
+        conversations_data = await UserMessagesService.get_conversations_async(
+            db, user_id, limit, cursor
+        )
         return ResponseHelper.success_response(
-            data={"conversations": conversations},
+            data=conversations_data,
             message="Conversations fetched successfully"
         )
     except HTTPException:
@@ -58,21 +65,23 @@ async def get_conversations(
 async def get_messages(
     request: Request,
     creator_id: str,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
+    before_id: Optional[int] = Query(None, description="Only messages older than this message id"),
+    after_id: Optional[int] = Query(None, description="Only messages newer than this message id"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Get messages for a specific conversation.
     
-    Returns paginated messages between current user and specified creator.
+    Returns messages between current user and specified creator, newest first.
+    Page back with before_id or poll for new messages with after_id.
     Automatically marks received messages as read.
     User ID is extracted from JWT token in request state.
     """
     try:
         user_id = request.state.user_id
-        messages_data = UserMessagesService.get_messages(
-            db, user_id, creator_id, skip, limit
+        messages_data = await UserMessagesService.get_messages_async(
+            db, user_id, creator_id, limit, before_id, after_id
         )
         return ResponseHelper.success_response(
             data=messages_data,
@@ -91,7 +100,7 @@ async def get_messages(
 async def send_message(
     request: Request,
     message_request: SendMessageRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Send a message to another user.
@@ -101,12 +110,17 @@ async def send_message(
     """
     try:
         user_id = request.state.user_id
-        message_data = UserMessagesService.send_message(
+        message_data = await UserMessagesService.send_message_async(
             db,
             user_id,
             message_request.receiver_id,
             message_request.content
         )
+        # Both users: the sender may have other devices connected
+        await hub.send_to_users(
+            [user_id, message_request.receiver_id],
+            {"type": "message", "message": message_data}
+        )
         return ResponseHelper.created_response(
             data=message_data,
             message="Message sent successfully"
@@ -124,7 +138,7 @@ async def send_message(
 async def mark_conversation_as_read(
     request: Request,
     creator_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Mark all messages in a conversation as read.
@@ -134,7 +148,7 @@ async def mark_conversation_as_read(
     """
     try:
         user_id = request.state.user_id
-        result = UserMessagesService.mark_conversation_as_read(
+        result = await UserMessagesService.mark_conversation_as_read_async(
             db, user_id, creator_id
         )
         return ResponseHelper.success_response(
@@ -155,21 +169,23 @@ async def mark_conversation_as_read(
 @router.get("/admin")
 async def get_admin_conversation(
     request: Request,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
+    before_id: Optional[int] = Query(None, description="Only messages older than this message id"),
+    after_id: Optional[int] = Query(None, description="Only messages newer than this message id"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Get messages between user and admin.
     
-    Returns paginated messages in the admin conversation.
+    Returns messages in the admin conversation, newest first.
+    Page back with before_id or poll for new messages with after_id.
     Automatically marks admin messages as read.
     User ID is extracted from JWT token in request state.
     """
     try:
         user_id = request.state.user_id
-        messages_data = AdminMessagesService.get_admin_conversation(
-            db, user_id, skip, limit
+        messages_data = await AdminMessagesService.get_admin_conversation_async(
+            db, user_id, limit, before_id, after_id
         )
         return ResponseHelper.success_response(
             data=messages_data,
@@ -188,7 +204,7 @@ async def get_admin_conversation(
 async def send_message_to_admin(
     request: Request,
     message_request: SendAdminMessageRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Send a message to admin.
@@ -198,9 +214,12 @@ async def send_message_to_admin(
     """
     try:
         user_id = request.state.user_id
-        message_data = AdminMessagesService.send_message_to_admin(
+        message_data = await AdminMessagesService.send_message_to_admin_async(
             db, user_id, message_request.content
         )
+        event = {"type": "admin_message", "message": message_data}
+        await hub.send_to_admins(event)
+        await hub.send_to_users([user_id], event)
         return ResponseHelper.created_response(
             data=message_data,
             message="Message sent to admin successfully"
@@ -217,7 +236,7 @@ async def send_message_to_admin(
 @router.get("/admin/unread-count")
 async def get_unread_admin_message_count(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Get count of unread admin messages.
@@ -227,7 +246,7 @@ async def get_unread_admin_message_count(
     """
     try:
         user_id = request.state.user_id
-        count_data = AdminMessagesService.get_unread_admin_message_count(db, user_id)
+        count_data = await AdminMessagesService.get_unread_admin_message_count_async(db, user_id)
         return ResponseHelper.success_response(
             data=count_data,
             message="Unread count fetched successfully"
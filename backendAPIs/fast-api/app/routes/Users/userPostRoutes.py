@@ -2,9 +2,10 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.database import get_db
+from app.db.database import get_async_db, get_db
 from app.schemas.userPostSchema import (
     FollowRequest,
     UserFeedResponse,
@@ -15,6 +16,7 @@ from app.schemas.userPostSchema import (
 )
 from app.services.users.userPostService import UserPostService
 from app.config.response_helper import ResponseHelper
+from app.utils.pagination import CountMode
 
 
 router = APIRouter(prefix="/posts")
@@ -23,19 +25,20 @@ router = APIRouter(prefix="/posts")
 @router.get("/feed")
 async def get_user_feed(
     request: Request,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """
     Get feed of approved posts from followed users.
     
-    Returns paginated list of posts from users that the current user follows.
+    Returns posts from users that the current user follows, newest first.
+    Pass next_cursor back as cursor to fetch the following page.
     User ID is extracted from JWT token in request state.
     """
     try:
         user_id = request.state.user_id
-        feed_data = UserPostService.get_user_feed(db, user_id, skip, limit)
+        feed_data = await UserPostService.get_user_feed_async(db, user_id, limit, cursor)
         return ResponseHelper.success_response(
             data=feed_data,
             message="Feed fetched successfully"
@@ -54,6 +57,7 @@ async def get_following_list(
     request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total to report: exact, estimate or none"),
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """
@@ -64,7 +68,7 @@ async def get_following_list(
     """
     try:
         user_id = request.state.user_id
-        following_data = UserPostService.get_following_list(db, user_id, skip, limit)
+        following_data = UserPostService.get_following_list(db, user_id, skip, limit, count)
         return ResponseHelper.success_response(
             data=following_data,
             message="Following list fetched successfully"
@@ -139,6 +143,7 @@ async def search_creators(
     search: Optional[str] = Query(None, description="Search term for creator name"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.ESTIMATE, description="Total to report: exact, estimate or none"),
     db: Session = Depends(get_db)
 ) -> JSONResponse:
     """
@@ -146,9 +151,10 @@ async def search_creators(
     
     Returns paginated list of creators matching the search query.
     If no search term is provided, returns all creators.
+    The total is an estimate unless count=exact is requested.
     """
     try:
-        creators_data = UserPostService.search_creators(db, search, skip, limit)
+        creators_data = UserPostService.search_creators(db, search, skip, limit, count)
         return ResponseHelper.success_response(
             data=creators_data,
             message="Creators fetched successfully"
@@ -85,7 +85,7 @@ async def update_user_password(
     """
     try:
         user_id = request.state.user_id
-        result = UserProfileService.update_password(db, user_id, password_data)
+        result = await UserProfileService.update_password(db, user_id, password_data)
         return ResponseHelper.ok_response(
             data=None,
             message=result["message"]
@@ -0,0 +1,71 @@
+"""API routes for recipe matching operations."""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.schemas.userRecipeSchema import RecipeMatchRequest
+from app.services.users.userRecipeService import UserRecipeService
+from app.config.response_helper import ResponseHelper
+from app.utils.pagination import CountMode
+
+
+router = APIRouter(prefix="/recipes")
+
+
+@router.post("/match")
+async def match_recipes(
+    match_request: RecipeMatchRequest,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of records to return"),
+    db: Session = Depends(get_db)
+) -> JSONResponse:
+    """
+    Find approved creator posts that use the given ingredients.
+    
+    Returns posts ranked by how much of each recipe the ingredients cover,
+    then by how few ingredients are missing.
+    """
+    try:
+        recipes_data = UserRecipeService.match_recipes(
+            db, match_request.ingredients, skip, limit
+        )
+        return ResponseHelper.success_response(
+            data=recipes_data,
+            message="Recipes matched successfully"
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
+
+
+@router.get("/ingredients/{ingredient_id}")
+async def get_recipes_with_ingredient(
+    ingredient_id: int,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.ESTIMATE, description="Total to report: exact, estimate or none"),
+    db: Session = Depends(get_db)
+) -> JSONResponse:
+    """
+    Get approved creator posts that use a master ingredient, newest first.
+    """
+    try:
+        recipes_data = UserRecipeService.get_recipes_with_ingredient(
+            db, ingredient_id, skip, limit, count
+        )
+        return ResponseHelper.success_response(
+            data=recipes_data,
+            message="Recipes retrieved successfully"
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
@@ -33,7 +33,7 @@ async def sign_up(
     Returns user data and authentication tokens.
     """
     try:
-        result = AuthService.sign_up(
+        result = await AuthService.sign_up(
             db,
             email=signup_data.email,
             password=signup_data.password,
@@ -64,7 +64,7 @@ async def sign_in(
     Validates credentials and returns user data with authentication tokens.
     """
     try:
-        result = AuthService.sign_in(
+        result = await AuthService.sign_in(
             db,
             email=signin_data.email,
             password=signin_data.password
@@ -93,7 +93,7 @@ async def admin_sign_in(
     Validates admin credentials and returns admin data with authentication tokens.
     """
     try:
-        result = AuthService.admin_sign_in(
+        result = await AuthService.admin_sign_in(
             db,
             email=signin_data.email,
             password=signin_data.password
@@ -153,7 +153,8 @@ async def logout(
     try:
         user_id = request.state.user_id
         provider_id = request.state.provider_id
-        result = AuthService.logout(db, user_id, provider_id)
+        is_admin = getattr(request.state, "is_admin", False)
+        result = AuthService.logout(db, user_id, provider_id, is_admin)
         return ResponseHelper.success_response(
             data=result,
             message="Logged out successfully"
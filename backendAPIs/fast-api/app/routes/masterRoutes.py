@@ -1,16 +1,10 @@
 """API routes for master data GET operations."""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
-
-from app.db.database import get_db
-from app.schemas.masterSchema import (
-    CountryResponse, CityResponse, MealResponse, IngredientResponse
-)
+from typing import Optional
+from fastapi import APIRouter, HTTPException, status, Path, Query, Request
+from fastapi.responses import JSONResponse, Response
+
 from app.services.masterService import (
-    CountryService, CityService, MealService, IngredientService
+    CountryService, CityService, MealService, IngredientService, MasterBundleService
 )
 from app.config.response_helper import ResponseHelper
 
@@ -18,18 +12,102 @@ from app.config.response_helper import ResponseHelper
 router = APIRouter(prefix="/master", tags=["Master Data"])
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values."""
+    wildcard = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return bool(wildcard)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header."""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+# Bundle Route
+@router.get("/bundle")
+async def get_master_bundle(
+    request: Request,
+    since_version: Optional[str] = Query(None, max_length=64, description="Bundle version the client already has")
+) -> Response:
+    """
+    Get countries, cities, meals and ingredients in one request.
+    
+    Tables are sent as columns plus rows of values. Pass the returned
+    version as since_version to receive only changed rows and deleted ids;
+    "full" is true when the whole bundle was sent instead. Responses carry
+    an ETag, so If-None-Match revalidation costs a 304. The gzip and
+    identity bodies carry different ETags.
+    """
+    try:
+        etag, body, compressed = MasterBundleService.get_bundle(since_version)
+        headers = {
+            "Cache-Control": "private, no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if _accepts_gzip(request.headers.get("accept-encoding", "")):
+            etag = f'{etag[:-1]}-gz"'
+            headers["Content-Encoding"] = "gzip"
+            body = compressed
+        headers["ETag"] = etag
+        if _etag_matches(etag, request.headers.get("if-none-match", "")):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return ResponseHelper.encoded_response(body, headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
+
+
 # Country Routes
+@router.get("/countries/search")
+async def search_countries(
+    q: str = Query(..., min_length=1, max_length=100, description="Name prefix, accents optional"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of matches to return")
+) -> JSONResponse:
+    """Autocomplete countries by name prefix."""
+    try:
+        countries = CountryService.search_countries(q, limit)
+        return ResponseHelper.ok_response(
+            data=countries,
+            message="Countries retrieved successfully"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
+
+
 @router.get("/countries/{country_id}")
 async def get_country(
-    country_id: int = Path(..., gt=0, description="The ID of the country to retrieve"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    country_id: int = Path(..., gt=0, description="The ID of the country to retrieve")
+) -> Response:
     """Get a country by ID."""
     try:
-        country = CountryService.get_country(db, country_id)
-        return ResponseHelper.ok_response(
-            data=CountryResponse.model_validate(country).model_dump(),
-            message="Country retrieved successfully"
+        return ResponseHelper.encoded_response(
+            CountryService.get_country(country_id)
         )
     except HTTPException:
         raise
@@ -43,15 +121,12 @@ async def get_country(
 @router.get("/countries")
 async def get_all_countries(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return")
+) -> Response:
     """Get all countries with pagination."""
     try:
-        countries = CountryService.get_all_countries(db, skip, limit)
-        return ResponseHelper.ok_response(
-            data=[CountryResponse.model_validate(c).model_dump() for c in countries],
-            message="Countries retrieved successfully"
+        return ResponseHelper.encoded_response(
+            CountryService.get_all_countries(skip, limit)
         )
     except HTTPException:
         raise
@@ -63,17 +138,41 @@ async def get_all_countries(
 
 
 # City Routes
+@router.get("/cities/search")
+async def search_cities(
+    q: str = Query(..., min_length=1, max_length=100, description="Name prefix, accents optional"),
+    country_id: Optional[int] = Query(None, gt=0, description="Only cities in this country"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of matches to return")
+) -> JSONResponse:
+    """
+    Autocomplete cities by name prefix.
+    
+    Matches the start of the name or of any later word, ignoring case and
+    accents ("sao p" and "paulo" both find São Paulo).
+    """
+    try:
+        cities = CityService.search_cities(q, country_id, limit)
+        return ResponseHelper.ok_response(
+            data=cities,
+            message="Cities retrieved successfully"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred"
+        )
+
+
 @router.get("/cities/{city_id}")
 async def get_city(
-    city_id: int = Path(..., gt=0, description="The ID of the city to retrieve"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    city_id: int = Path(..., gt=0, description="The ID of the city to retrieve")
+) -> Response:
     """Get a city by ID."""
     try:
-        city = CityService.get_city(db, city_id)
-        return ResponseHelper.ok_response(
-            data=CityResponse.model_validate(city).model_dump(),
-            message="City retrieved successfully"
+        return ResponseHelper.encoded_response(
+            CityService.get_city(city_id)
         )
     except HTTPException:
         raise
@@ -87,15 +186,12 @@ async def get_city(
 @router.get("/cities")
 async def get_all_cities(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return")
+) -> Response:
     """Get all cities with pagination."""
     try:
-        cities = CityService.get_all_cities(db, skip, limit)
-        return ResponseHelper.ok_response(
-            data=[CityResponse.model_validate(c).model_dump() for c in cities],
-            message="Cities retrieved successfully"
+        return ResponseHelper.encoded_response(
+            CityService.get_all_cities(skip, limit)
         )
     except HTTPException:
         raise
@@ -108,15 +204,12 @@ async def get_all_cities(
 
 @router.get("/countries/{country_id}/cities")
 async def get_cities_by_country(
-    country_id: int = Path(..., gt=0, description="The ID of the country"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    country_id: int = Path(..., gt=0, description="The ID of the country")
+) -> Response:
     """Get all cities for a specific country."""
     try:
-        cities = CityService.get_cities_by_country(db, country_id)
-        return ResponseHelper.ok_response(
-            data=[CityResponse.model_validate(c).model_dump() for c in cities],
-            message="Cities retrieved successfully"
+        return ResponseHelper.encoded_response(
+            CityService.get_cities_by_country(country_id)
         )
     except HTTPException:
         raise
@@ -130,15 +223,12 @@ async def get_cities_by_country(
 # Meal Routes
 @router.get("/meals/{meal_id}")
 async def get_meal(
-    meal_id: int = Path(..., gt=0, description="The ID of the meal to retrieve"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    meal_id: int = Path(..., gt=0, description="The ID of the meal to retrieve")
+) -> Response:
     """Get a meal by ID."""
     try:
-        meal = MealService.get_meal(db, meal_id)
-        return ResponseHelper.ok_response(
-            data=MealResponse.model_validate(meal).model_dump(),
-            message="Meal retrieved successfully"
+        return ResponseHelper.encoded_response(
+            MealService.get_meal(meal_id)
         )
     except HTTPException:
         raise
@@ -152,15 +242,12 @@ async def get_meal(
 @router.get("/meals")
 async def get_all_meals(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return")
+) -> Response:
     """Get all meals with pagination."""
     try:
-        meals = MealService.get_all_meals(db, skip, limit)
-        return ResponseHelper.ok_response(
-            data=[MealResponse.model_validate(m).model_dump() for m in meals],
-            message="Meals retrieved successfully"
+        return ResponseHelper.encoded_response(
+            MealService.get_all_meals(skip, limit)
         )
     except HTTPException:
         raise
@@ -174,15 +261,12 @@ async def get_all_meals(
 # Ingredient Routes
 @router.get("/ingredients/{ingredient_id}")
 async def get_ingredient(
-    ingredient_id: int = Path(..., gt=0, description="The ID of the ingredient to retrieve"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    ingredient_id: int = Path(..., gt=0, description="The ID of the ingredient to retrieve")
+) -> Response:
     """Get an ingredient by ID."""
     try:
-        ingredient = IngredientService.get_ingredient(db, ingredient_id)
-        return ResponseHelper.ok_response(
-            data=IngredientResponse.model_validate(ingredient).model_dump(),
-            message="Ingredient retrieved successfully"
+        return ResponseHelper.encoded_response(
+            IngredientService.get_ingredient(ingredient_id)
         )
     except HTTPException:
         raise
@@ -196,15 +280,12 @@ async def get_ingredient(
 @router.get("/ingredients")
 async def get_all_ingredients(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return")
+) -> Response:
     """Get all ingredients with pagination."""
     try:
-        ingredients = IngredientService.get_all_ingredients(db, skip, limit)
-        return ResponseHelper.ok_response(
-            data=[IngredientResponse.model_validate(i).model_dump() for i in ingredients],
-            message="Ingredients retrieved successfully"
+        return ResponseHelper.encoded_response(
+            IngredientService.get_all_ingredients(skip, limit)
         )
     except HTTPException:
         raise
@@ -217,15 +298,12 @@ async def get_all_ingredients(
 
 @router.get("/ingredients/type/{ingredient_type}")
 async def get_ingredients_by_type(
-    ingredient_type: str = Path(..., description="Type of ingredient (Vegetables, Protein, Dairy, Grains)"),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    ingredient_type: str = Path(..., description="Type of ingredient (Vegetables, Protein, Dairy, Grains)")
+) -> Response:
     """Get all ingredients by type."""
     try:
-        ingredients = IngredientService.get_ingredients_by_type(db, ingredient_type)
-        return ResponseHelper.ok_response(
-            data=[IngredientResponse.model_validate(i).model_dump() for i in ingredients],
-            message="Ingredients retrieved successfully"
+        return ResponseHelper.encoded_response(
+            IngredientService.get_ingredients_by_type(ingredient_type)
         )
     except HTTPException:
         raise
@@ -0,0 +1,48 @@
+"""WebSocket routes for realtime messaging events."""
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+
+from app.config.logging_config import log_error
+from app.realtime import hub
+
+
+router = APIRouter(tags=["Realtime"])
+
+
+@router.websocket("/ws/messages")
+async def messages_socket(websocket: WebSocket):
+    """
+    Stream messaging events to the authenticated user.
+
+    The HTTP auth middleware does not run for WebSockets, so the access token
+    is checked here. Browsers cannot set headers on a WebSocket, so it is
+    accepted from the ``token`` query parameter as well as the Authorization
+    header.
+
+    Events sent to the client:
+    - {"type": "message", "message": {...}} for user conversations
+    - {"type": "admin_message", "message": {...}} for support conversations
+
+    Clients may send {"type": "ping"} and receive {"type": "pong"}.
+    """
+    auth = websocket.app.state.auth
+    token = websocket.query_params.get("token") or auth._extract_token(websocket)
+    auth_data = await auth.authenticate(token) if token else None
+
+    if not auth_data or not auth_data.get("is_active", True):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    user_id = auth_data["user_id"]
+    await websocket.accept()
+    await hub.connect(user_id, websocket, is_admin=auth_data.get("is_admin", False))
+    try:
+        while True:
+            data = await websocket.receive_json()
+            if isinstance(data, dict) and data.get("type") == "ping":
+                await websocket.send_json({"type": "pong"})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        log_error(f"WebSocket error for user {user_id}: {str(e)}")
+    finally:
+        await hub.disconnect(user_id, websocket)
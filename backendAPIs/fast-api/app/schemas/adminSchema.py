@@ -27,7 +27,8 @@ class CreatorRequestInfo(BaseModel):
 class CreatorRequestsListResponse(BaseModel):
     """Schema for creator requests list response."""
     requests: List[CreatorRequestInfo]
-    total: int
+    total: Optional[int] = None
+    has_more: bool
     skip: int
     limit: int
 
@@ -56,7 +57,8 @@ class PostRequestInfo(BaseModel):
 class PostRequestsListResponse(BaseModel):
     """Schema for post requests list response."""
     posts: List[PostRequestInfo]
-    total: int
+    total: Optional[int] = None
+    has_more: bool
     skip: int
     limit: int
 
@@ -76,7 +78,8 @@ class UserInfo(BaseModel):
 class UsersListResponse(BaseModel):
     """Schema for users list response."""
     data: List[UserInfo]
-    total: int
+    total: Optional[int] = None
+    has_more: bool
     skip: int
     limit: int
 
@@ -95,7 +98,8 @@ class CreatorInfo(BaseModel):
 class CreatorsListResponse(BaseModel):
     """Schema for creators list response."""
     data: List[CreatorInfo]
-    total: int
+    total: Optional[int] = None
+    has_more: bool
     skip: int
     limit: int
 
@@ -155,8 +159,7 @@ class AdminConversationsListResponse(BaseModel):
 class AdminMessagesListResponse(BaseModel):
     """Schema for admin messages list response."""
     messages: List[AdminMessageInfo]
-    total: int
-    skip: int
+    has_more: bool
     limit: int
     user: UserBasicInfo
 
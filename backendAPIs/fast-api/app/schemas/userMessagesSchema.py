@@ -49,21 +49,21 @@ class ConversationInfo(BaseModel):
 class ConversationsListResponse(BaseModel):
     """Schema for conversations list response."""
     conversations: List[ConversationInfo]
+    has_more: bool = False
+    next_cursor: Optional[int] = None
 
 
 class MessagesListResponse(BaseModel):
     """Schema for messages list response."""
     messages: List[MessageResponse]
-    total: int
-    skip: int
+    has_more: bool
     limit: int
 
 
 class AdminMessagesListResponse(BaseModel):
     """Schema for admin messages list response."""
     messages: List[AdminMessageResponse]
-    total: int
-    skip: int
+    has_more: bool
     limit: int
 
 
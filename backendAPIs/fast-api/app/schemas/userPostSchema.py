@@ -28,8 +28,8 @@ class PostInfo(BaseModel):
 class UserFeedResponse(BaseModel):
     """Schema for user feed response."""
     posts: List[PostInfo]
-    total: int
-    skip: int
+    has_more: bool
+    next_cursor: Optional[str] = None
     limit: int
 
 
@@ -54,7 +54,8 @@ class FollowingInfo(UserBasicInfo):
 class FollowingListResponse(BaseModel):
     """Schema for following list response."""
     following: List[FollowingInfo]
-    total: int
+    total: Optional[int] = None
+    has_more: bool
     skip: int
     limit: int
 
@@ -74,7 +75,8 @@ class CreatorInfo(BaseModel):
 class CreatorSearchResponse(BaseModel):
     """Schema for creator search response."""
     creators: List[CreatorInfo]
-    total: int
+    total: Optional[int] = None
+    has_more: bool
     skip: int
     limit: int
 
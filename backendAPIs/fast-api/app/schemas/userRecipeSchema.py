@@ -0,0 +1,38 @@
+"""Schemas for recipe matching operations."""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class RecipeMatchRequest(BaseModel):
+    """Schema for recipe match request."""
+    ingredients: List[str] = Field(..., min_length=1, max_length=50, description="Ingredient names the user has")
+
+
+class RecipeMatchInfo(BaseModel):
+    """Schema for a matched recipe."""
+    id: int
+    user_id: str
+    user_name: Optional[str] = None
+    user_profile_pic: Optional[str] = None
+    title: str
+    overview: str
+    cooking_time: int
+    cuisine_type: str
+    servings: int
+    image: Optional[str] = None
+    ingredients: List
+    matched_count: int
+    missing_count: int
+    coverage: float
+    missing_ingredients: List[str]
+    created_at: Optional[datetime] = None
+
+
+class RecipeMatchResponse(BaseModel):
+    """Schema for recipe match response."""
+    recipes: List[RecipeMatchInfo]
+    total: int
+    has_more: bool
+    skip: int
+    limit: int
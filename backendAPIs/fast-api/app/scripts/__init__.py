@@ -0,0 +1 @@
+"""Maintenance jobs run from the command line, e.g. ``python -m app.scripts.<name>``."""
@@ -0,0 +1,77 @@
+"""Backfill post_ingredients for existing creator posts.
+
+Matches every post's ingredients JSON against the ingredients master in
+batches of post ids, committing after each batch. Safe to re-run: existing
+links are left alone, so it can also pick up new master ingredients.
+
+Usage:
+    python -m app.scripts.backfill_post_ingredients [--batch-size 500]
+"""
+import argparse
+
+from sqlalchemy.orm import Session
+
+from app.config.logging_config import log_info
+from app.db.database import SessionLocal
+from app.db.upsert import upsert_insert
+from app.models.creator_post import CreatorPost
+from app.models.post_ingredient import PostIngredient
+from app.utils.ingredient_matcher import IngredientMatcher
+
+
+def backfill(db: Session, batch_size: int = 500) -> dict:
+    """
+    Link every creator post to the master ingredients it uses.
+
+    Args:
+        db: Database session
+        batch_size: Posts read and committed per batch
+
+    Returns:
+        Dictionary with the number of posts scanned and links inserted
+    """
+    matcher = IngredientMatcher.load(db)
+    insert = upsert_insert(db)
+    last_id = 0
+    posts = links = 0
+
+    while True:
+        batch = db.query(CreatorPost.id, CreatorPost.ingredients).filter(
+            CreatorPost.id > last_id
+        ).order_by(CreatorPost.id).limit(batch_size).all()
+        if not batch:
+            break
+
+        rows = [
+            {"post_id": post_id, "ingredient_id": ingredient_id}
+            for post_id, ingredients in batch
+            for ingredient_id in matcher.match_post(ingredients)
+        ]
+        if rows:
+            links += db.execute(
+                insert(PostIngredient).values(rows).on_conflict_do_nothing()
+            ).rowcount
+        db.commit()
+
+        posts += len(batch)
+        last_id = batch[-1].id
+        log_info(f"Backfilled post ingredients up to post {last_id} ({posts} posts, {links} links)")
+
+    return {"posts": posts, "links": links}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500, help="Posts per batch")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = backfill(db, args.batch_size)
+    finally:
+        db.close()
+    print(f"Scanned {result['posts']} posts, inserted {result['links']} post ingredient links")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Check that the hot queries are planned as index scans.
+
+Seeds users, follows, posts, meal plans and messages inside a transaction,
+runs EXPLAIN on the query shapes behind the feed, dashboard, moderation
+queue and conversations, and fails when any of them reads a table with a
+sequential scan. The transaction is rolled back, so nothing is left behind;
+still, point it at a development or CI database.
+
+Usage:
+    python -m app.scripts.check_query_plans [--users 300]
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.models.admin_message import AdminMessage, AdminMessageSender
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.follow import Follow
+from app.models.meal_planner import MealPlanner
+from app.models.user import User
+from app.models.user_message import UserMessage
+
+SEED_PREFIX = "plan-check-"
+POSTS_PER_CREATOR = 20
+DAYS = 14
+
+
+def seed(db: Session, users: int) -> List[str]:
+    """Insert an uncommitted data set sized so that index scans pay off."""
+    user_ids = [f"{SEED_PREFIX}{i:06d}" for i in range(users)]
+    creators = user_ids[::10]
+    started = datetime(2026, 1, 1)
+
+    db.add_all(
+        User(id=user_id, email=f"{user_id}@example.com", name=f"User {i}", is_creator=user_id in creators)
+        for i, user_id in enumerate(user_ids)
+    )
+    db.flush()
+    db.add_all(
+        Follow(following_user_id=user_id, followed_user_id=creator)
+        for i, user_id in enumerate(user_ids)
+        for creator in creators[i % 7::7]
+        if creator != user_id
+    )
+    statuses = list(CreatorPostStatus)
+    db.add_all(
+        CreatorPost(
+            user_id=creator, title=f"Post {n}", overview="", cooking_time=30,
+            cuisine_type="Italian", servings=2, ingredients=[], instructions="",
+            status=statuses[n % len(statuses)], created_at=started + timedelta(hours=n)
+        )
+        for creator in creators
+        for n in range(POSTS_PER_CREATOR)
+    )
+    db.add_all(
+        MealPlanner(user_id=user_id, date=date(2026, 1, 1) + timedelta(days=day), meal_type=meal_type)
+        for user_id in user_ids
+        for day in range(DAYS)
+        for meal_type in ("Breakfast", "Lunch", "Dinner")
+    )
+    db.add_all(
+        UserMessage(sender_id=sender, recevier_id=creators[i % len(creators)], content="Hi")
+        for i, sender in enumerate(user_ids)
+        for _ in range(5)
+    )
+    db.add_all(
+        AdminMessage(user_id=user_id, sender=sender, content="Hello")
+        for user_id in user_ids
+        for sender in (AdminMessageSender.User, AdminMessageSender.Admin)
+    )
+    db.flush()
+    return user_ids
+
+
+def hot_queries(user_ids: List[str]) -> List[Tuple[str, object, Tuple[str, ...]]]:
+    """(name, statement, tables that must not be scanned sequentially)."""
+    # User 1 follows and messages creator 1 (see seed)
+    user_id = user_ids[1]
+    creator_id = user_ids[10]
+    return [
+        ("feed: a creator's approved posts", select(CreatorPost.id).where(
+            CreatorPost.user_id == creator_id,
+            CreatorPost.status == CreatorPostStatus.APPROVED
+        ).order_by(CreatorPost.id.desc()).limit(11), ("creator_posts",)),
+        ("dashboard: latest post by followed creators", select(CreatorPost.id).join(
+            Follow, CreatorPost.user_id == Follow.followed_user_id
+        ).where(
+            Follow.following_user_id == user_id,
+            CreatorPost.status == CreatorPostStatus.APPROVED
+        ).order_by(CreatorPost.created_at.desc()).limit(1), ("creator_posts", "follows")),
+        ("dashboard: meals for a day", select(MealPlanner.id).where(
+            MealPlanner.user_id == user_id,
+            MealPlanner.date == date(2026, 1, 3)
+        ), ("meal_planner",)),
+        ("admin: pending post queue", select(CreatorPost.id).where(
+            CreatorPost.status == CreatorPostStatus.PENDING
+        ).order_by(CreatorPost.created_at.desc()).limit(20), ("creator_posts",)),
+        ("fan-out: followers of a creator", select(Follow.following_user_id).where(
+            Follow.followed_user_id == creator_id
+        ), ("follows",)),
+        ("messages: one direction of a conversation", select(UserMessage.id).where(
+            UserMessage.sender_id == user_id,
+            UserMessage.recevier_id == creator_id
+        ).order_by(UserMessage.id.desc()).limit(51), ("user_messages",)),
+        ("messages: unread admin messages", select(AdminMessage.id).where(
+            AdminMessage.user_id == user_id,
+            AdminMessage.sender == AdminMessageSender.Admin,
+            AdminMessage.id > 0
+        ), ("admin_messages",)),
+    ]
+
+
+def sequential_scans(db: Session, statement) -> List[str]:
+    """Tables the database would read with a full sequential scan."""
+    dialect = db.get_bind().dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    if dialect.name == "postgresql":
+        plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        scanned, nodes = [], [plan[0]["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            if node["Node Type"] == "Seq Scan":
+                scanned.append(node["Relation Name"])
+            nodes.extend(node.get("Plans", ()))
+        return scanned
+
+    # SQLite: "SCAN t" reads the whole table (or a whole index when followed
+    # by USING ... INDEX); "SEARCH t USING INDEX ..." is a range lookup
+    return [
+        detail.split()[1]
+        for *_, detail in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        if detail.startswith("SCAN ")
+    ]
+
+
+def check(db: Session, users: int = 300) -> List[str]:
+    """
+    Seed data, explain every hot query and roll back.
+
+    Args:
+        db: Database session
+        users: Number of users to seed (every tenth is a creator)
+
+    Returns:
+        Failure messages, empty when every query uses an index
+    """
+    failures = []
+    try:
+        user_ids = seed(db, users)
+        if db.get_bind().dialect.name == "postgresql":
+            for table in ("users", "follows", "creator_posts", "meal_planner", "user_messages", "admin_messages"):
+                db.execute(text(f"ANALYZE {table}"))
+
+        for name, statement, tables in hot_queries(user_ids):
+            scanned = [table for table in sequential_scans(db, statement) if table in tables]
+            print(f"{'FAIL' if scanned else 'ok':<6}{name}")
+            if scanned:
+                failures.append(f"{name}: sequential scan on {', '.join(scanned)}")
+    finally:
+        db.rollback()
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=300, help="Users to seed (every tenth is a creator)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        failures = check(db, args.users)
+    finally:
+        db.close()
+    for failure in failures:
+        print(failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
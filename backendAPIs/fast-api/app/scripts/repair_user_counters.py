@@ -0,0 +1,67 @@
+"""Repair drift in the follower, following and post counters on users.
+
+Recomputes the counters from follows and approved creator posts in batches
+of user ids, committing after each batch, and corrects only the users whose
+stored values differ. Safe to run at any time.
+
+Usage:
+    python -m app.scripts.repair_user_counters [--batch-size 1000]
+"""
+import argparse
+
+from sqlalchemy.orm import Session
+
+from app.config.logging_config import log_info
+from app.db.database import SessionLocal
+from app.models.user import User
+from app.services.userCounterService import UserCounterService
+
+
+def repair(db: Session, batch_size: int = 1000) -> dict:
+    """
+    Recompute every user's counters and fix the ones that drifted.
+
+    Args:
+        db: Database session
+        batch_size: Users checked and committed per batch
+
+    Returns:
+        Dictionary with the number of users scanned and corrected
+    """
+    last_id = ""
+    users = fixed = 0
+
+    while True:
+        user_ids = [
+            user_id for user_id, in db.query(User.id).filter(
+                User.id > last_id
+            ).order_by(User.id).limit(batch_size)
+        ]
+        if not user_ids:
+            break
+
+        fixed += UserCounterService.recount(db, user_ids)
+        db.commit()
+
+        users += len(user_ids)
+        last_id = user_ids[-1]
+        log_info(f"Checked user counters up to user {last_id} ({users} users, {fixed} corrected)")
+
+    return {"users": users, "fixed": fixed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users per batch")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = repair(db, args.batch_size)
+    finally:
+        db.close()
+    print(f"Checked {result['users']} users, corrected counters on {result['fixed']}")
+
+
+if __name__ == "__main__":
+    main()
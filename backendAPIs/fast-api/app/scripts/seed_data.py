@@ -0,0 +1,618 @@
+"""Generate a synthetic dataset for load and scale testing.
+
+Loads the master data shipped with the frontend (``Frontend/src/data/*.json``)
+and then bulk-generates users (every one can sign in with ``--password``),
+follows with a power-law spread over creators, creator posts, months of meal
+plans and large volumes of user and admin messages. Rows go in through COPY
+on PostgreSQL and executemany elsewhere, in batches committed as they go.
+
+Afterwards the derived tables are rebuilt from the generated rows: the user
+counters, post_ingredients, feed timelines, conversations and read cursors.
+The same ``--seed`` always generates the same data for the same end date.
+Run it against an empty local database; seeded users use the
+``@seed.example.com`` domain and a second run is refused.
+
+On PostgreSQL, create the schema with ``alembic upgrade head`` first. The
+migrations are Postgres-only, so a SQLite database is given its schema from
+the models instead: pass ``--create-schema``.
+
+Usage:
+    python -m app.scripts.seed_data [--users 10000] [--messages 1000000] [--seed 42]
+    python -m app.scripts.seed_data --master-only
+    DATABASE_URL=sqlite:///seed.db python -m app.scripts.seed_data --create-schema --users 1000
+"""
+import argparse
+import io
+import itertools
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import Table, text
+from sqlalchemy.orm import Session
+
+from app.config.logging_config import log_info
+from app.db.database import SessionLocal
+from app.db.upsert import upsert_insert
+from app.models.admin import Admin
+from app.models.admin_message import AdminMessage, AdminMessageSender
+from app.models.auth_provider import AuthProvider
+from app.models.base import Base
+from app.models.city import City
+from app.models.country import Country
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.follow import Follow
+from app.models.ingredient import Ingredient, IngredientType
+from app.models.meal import Meal, MealType
+from app.models.meal_planner import MealPlanner
+from app.models.user import User
+from app.models.user_auth_identity import UserAuthIdentity
+from app.models.user_message import UserMessage
+from app.scripts.backfill_post_ingredients import backfill
+from app.scripts.repair_user_counters import repair
+from app.services.feedService import FANOUT_MAX_FOLLOWERS
+from app.utils.password_hasher import bcrypt_hash
+
+MASTER_DATA_DIR = Path(__file__).resolve().parents[4] / "Frontend" / "src" / "data"
+SEED_DOMAIN = "seed.example.com"
+
+# Frontend meal types mapped to the closest backend MealType
+MEAL_TYPES = {
+    "breakfast": MealType.BREAKFAST,
+    "brunch": MealType.BRUNCH,
+    "morningSnack": MealType.ELEVENSES,
+    "elevenses": MealType.ELEVENSES,
+    "lunch": MealType.LUNCH,
+    "afternoonTea": MealType.AFTERNOON_TEA,
+    "eveningSnack": MealType.HIGH_TEA,
+    "dinner": MealType.DINNER,
+    "supper": MealType.SUPPER,
+    "midnightSnack": MealType.MIDNIGHT_SNACK,
+}
+PLANNED_MEALS = ("breakfast", "lunch", "dinner")
+
+FIRST_NAMES = (
+    "Aarav", "Amelia", "Carlos", "Chen", "Fatima", "Hana", "Ivan", "Jonas", "Lucia", "Maria",
+    "Mateo", "Noah", "Olivia", "Priya", "Sofia", "Tariq", "Yuki", "Zara", "Emeka", "Ingrid",
+)
+LAST_NAMES = (
+    "Garcia", "Kim", "Khan", "Rossi", "Silva", "Nguyen", "Muller", "Sato", "Okafor", "Cohen",
+    "Novak", "Haddad", "Larsen", "Patel", "Dubois", "Lopez", "Ivanova", "Mensah", "Tanaka", "Singh",
+)
+CUISINES = ("Italian", "Indian", "Mexican", "Japanese", "Thai", "French", "Greek", "Chinese", "Lebanese", "Spanish")
+DISHES = ("Pasta", "Curry", "Tacos", "Ramen", "Salad", "Stew", "Risotto", "Stir Fry", "Soup", "Flatbread")
+QUANTITIES = ("1", "2", "1/2 cup", "1 cup", "100g", "200g", "1 tbsp", "2 tsp", "a pinch", "to taste")
+MESSAGES = (
+    "Loved this recipe!", "Can I swap the cream for yogurt?", "How long does it keep in the fridge?",
+    "Made it tonight, the family asked for seconds.", "Thanks, glad you liked it!",
+    "Yes, that works fine.", "Any tips for a vegetarian version?", "Which brand of rice do you use?",
+)
+
+
+def bulk_insert(db: Session, table: Table, rows: Iterable[dict], batch_size: int) -> int:
+    """
+    Insert rows in batches: COPY on PostgreSQL, executemany elsewhere.
+
+    Args:
+        db: Database session
+        table: Target table
+        rows: Row dicts keyed by column name; every row has the same keys
+        batch_size: Rows per COPY or executemany call, committed per batch
+
+    Returns:
+        Number of rows inserted
+    """
+    copy = db.get_bind().dialect.name == "postgresql"
+    total = 0
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        if copy:
+            _copy(db, table, batch)
+        else:
+            db.execute(table.insert(), batch)
+        db.commit()
+        total += len(batch)
+    if total:
+        log_info(f"Seeded {total} rows into {table.name}")
+    return total
+
+
+def _copy_value(value) -> str:
+    """Render a value in COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, Enum):
+        # SQLAlchemy stores Python enums by name
+        value = value.name
+    elif isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return (
+        str(value).replace("\\", "\\\\").replace("\t", "\\t")
+        .replace("\n", "\\n").replace("\r", "\\r")
+    )
+
+
+def _copy(db: Session, table: Table, batch: List[dict]) -> None:
+    """COPY one batch into a table through the session's connection."""
+    names = list(batch[0])
+    buffer = io.StringIO()
+    for row in batch:
+        buffer.write("\t".join(_copy_value(row[name]) for name in names))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    preparer = db.get_bind().dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(name) for name in names)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+
+
+def _at(day: date, rng: random.Random) -> datetime:
+    """A random time of day on the given date, in UTC."""
+    return datetime.combine(day, dt_time(), timezone.utc) + timedelta(seconds=rng.randrange(86400))
+
+
+def load_master(db: Session, data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """
+    Load countries, cities, meals and ingredients from the frontend JSON files.
+
+    Rows that already exist (by id, or by name for ingredients) are kept.
+
+    Args:
+        db: Database session
+        data_dir: Directory holding countries.json, cities.json, meals.json and ingredients.json
+
+    Returns:
+        Dictionary with the number of rows inserted per table
+    """
+    def read(name: str):
+        with open(data_dir / f"{name}.json", encoding="utf-8") as file:
+            return json.load(file)
+
+    # countries.json lists some countries twice; keep the first and point
+    # the cities of the duplicates at it
+    countries, kept_ids, duplicate_ids = [], {}, {}
+    for country in read("countries"):
+        if country["code"] in kept_ids:
+            duplicate_ids[country["id"]] = kept_ids[country["code"]]
+        else:
+            kept_ids[country["code"]] = country["id"]
+            countries.append(country)
+    cities = [
+        {**city, "country_id": duplicate_ids.get(city["country_id"], city["country_id"])}
+        for city in read("cities")
+    ]
+
+    insert = upsert_insert(db)
+    inserted = {}
+    for model, rows in (
+        (Country, countries),
+        (City, cities),
+        (Meal, [
+            {
+                "id": meal["id"],
+                "meal_type": MEAL_TYPES[meal["meal_type"]],
+                "meal_name": meal["meal_name"],
+                "calories": meal.get("calories"),
+                "icon": meal.get("image"),
+            }
+            for meal in read("meals")
+        ]),
+    ):
+        inserted[model.__tablename__] = db.execute(
+            insert(model).values(rows).on_conflict_do_nothing(index_elements=["id"])
+        ).rowcount
+        if db.get_bind().dialect.name == "postgresql":
+            # Explicit ids leave the serial sequence behind
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{model.__tablename__}', 'id'), "
+                f"(SELECT max(id) FROM {model.__tablename__}))"
+            ))
+
+    existing = {name for name, in db.query(Ingredient.name)}
+    ingredients = [
+        Ingredient(name=item["name"], emoji=item.get("emoji"), type=IngredientType[group.capitalize()])
+        for group, items in read("ingredients").items()
+        for item in items
+        if item["name"] not in existing
+    ]
+    db.add_all(ingredients)
+    inserted["ingredients"] = len(ingredients)
+    db.commit()
+    return inserted
+
+
+def _zipf_cum_weights(count: int, exponent: float) -> List[float]:
+    """Cumulative weights of a Zipf distribution over ranks 1..count."""
+    return list(itertools.accumulate(1.0 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def _user_id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def seed_users(
+    db: Session,
+    rng: random.Random,
+    count: int,
+    creator_share: float,
+    password_hash: str,
+    start: date,
+    days: int,
+    batch_size: int
+) -> Tuple[List[str], List[str]]:
+    """Insert users with email/password identities; returns (user ids, creator ids)."""
+    provider = db.query(AuthProvider).filter(AuthProvider.provider_name == "email").first()
+    if not provider:
+        provider = AuthProvider(provider_name="email", provider_type="credentials")
+        db.add(provider)
+        db.commit()
+
+    cities = db.query(City.id, City.country_id).all()
+    user_ids = [_user_id(rng) for _ in range(count)]
+    creator_count = max(1, int(count * creator_share))
+    users = []
+    for i, user_id in enumerate(user_ids):
+        city_id, country_id = rng.choice(cities) if cities else (None, None)
+        users.append({
+            "id": user_id,
+            "email": f"user{i}@{SEED_DOMAIN}",
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "country_id": country_id,
+            "city_id": city_id,
+            "gender": rng.choice(("Male", "Female", "Other")),
+            "language": rng.choice(("English", "Spanish", "Hindi", "French", "Japanese")),
+            "age": rng.randint(18, 75),
+            "calories_target": rng.choice((1800, 2000, 2200, 2500)),
+            "about_me": "Home cook." if i >= creator_count else "Sharing the recipes I grew up with.",
+            "is_active": True,
+            "is_creator": i < creator_count,
+            "created_at": _at(start + timedelta(days=rng.randrange(days)), rng),
+        })
+
+    bulk_insert(db, User.__table__, users, batch_size)
+    bulk_insert(db, UserAuthIdentity.__table__, (
+        {
+            "id": _user_id(rng),
+            "user_id": user["id"],
+            "provider_id": provider.id,
+            "email": user["email"],
+            "password_hash": password_hash,
+        }
+        for user in users
+    ), batch_size)
+    return user_ids, user_ids[:creator_count]
+
+
+def seed_follows(
+    db: Session,
+    rng: random.Random,
+    user_ids: Sequence[str],
+    creator_ids: Sequence[str],
+    mean_follows: float,
+    batch_size: int
+) -> List[Tuple[str, str]]:
+    """
+    Insert follows; returns the (follower, creator) pairs.
+
+    Creator popularity follows a Zipf distribution and the number of creators
+    each user follows a Pareto distribution, so a few creators have most of
+    the followers and a few users follow many creators.
+    """
+    popularity = list(creator_ids)
+    rng.shuffle(popularity)
+    cum_weights = _zipf_cum_weights(len(popularity), 1.1)
+
+    pairs = []
+    for user_id in user_ids:
+        wanted = min(len(popularity), int(rng.paretovariate(2.0) * mean_follows / 2))
+        followed = set(rng.choices(popularity, cum_weights=cum_weights, k=wanted))
+        followed.discard(user_id)
+        pairs.extend((user_id, creator_id) for creator_id in sorted(followed))
+
+    bulk_insert(db, Follow.__table__, (
+        {"following_user_id": follower, "followed_user_id": followed}
+        for follower, followed in pairs
+    ), batch_size)
+    return pairs
+
+
+def seed_posts(
+    db: Session,
+    rng: random.Random,
+    creator_ids: Sequence[str],
+    mean_posts: int,
+    start: date,
+    days: int,
+    batch_size: int
+) -> int:
+    """Insert creator posts (mostly approved) with ingredients from the master table."""
+    ingredient_names = [name for name, in db.query(Ingredient.name).order_by(Ingredient.id)]
+    statuses = (CreatorPostStatus.APPROVED,) * 8 + (CreatorPostStatus.PENDING, CreatorPostStatus.REJECTED)
+
+    def posts() -> Iterator[dict]:
+        for creator_id in creator_ids:
+            for _ in range(rng.randint(0, 2 * mean_posts)):
+                created_at = _at(start + timedelta(days=rng.randrange(days)), rng)
+                post_status = rng.choice(statuses)
+                cuisine, dish = rng.choice(CUISINES), rng.choice(DISHES)
+                yield {
+                    "user_id": creator_id,
+                    "title": f"{cuisine} {dish}",
+                    "overview": f"A {cuisine.lower()} {dish.lower()} for weeknights.",
+                    "cooking_time": rng.choice((15, 20, 30, 45, 60, 90)),
+                    "cuisine_type": cuisine,
+                    "servings": rng.randint(1, 6),
+                    "image": None,
+                    "ingredients": [
+                        {"name": name, "quantity": rng.choice(QUANTITIES)}
+                        for name in rng.sample(ingredient_names, min(len(ingredient_names), rng.randint(4, 10)))
+                    ],
+                    "instructions": "<ol><li>Prepare the ingredients.</li><li>Cook and serve.</li></ol>",
+                    "status": post_status,
+                    "action_date": None if post_status == CreatorPostStatus.PENDING else created_at + timedelta(hours=rng.randint(1, 48)),
+                    "created_at": created_at,
+                }
+
+    return bulk_insert(db, CreatorPost.__table__, posts(), batch_size)
+
+
+def seed_meal_plans(
+    db: Session,
+    rng: random.Random,
+    user_ids: Sequence[str],
+    planner_share: float,
+    end: date,
+    days: int,
+    batch_size: int
+) -> int:
+    """Insert breakfast, lunch and dinner plans for the last ``days`` days for a share of users."""
+    meals_by_type: Dict[str, List[int]] = {}
+    for meal_id, meal_type in db.query(Meal.id, Meal.meal_type):
+        for key, value in MEAL_TYPES.items():
+            if value == meal_type:
+                meals_by_type.setdefault(key, []).append(meal_id)
+
+    planners = [user_id for user_id in user_ids if rng.random() < planner_share]
+
+    def plans() -> Iterator[dict]:
+        for user_id in planners:
+            for offset in range(days, 0, -1):
+                day = end - timedelta(days=offset)
+                week = day.isocalendar()
+                for meal_type in PLANNED_MEALS:
+                    meal_ids = meals_by_type.get(meal_type)
+                    custom = not meal_ids or rng.random() < 0.15
+                    yield {
+                        "week_id": f"{week.year}-W{week.week:02d}",
+                        "user_id": user_id,
+                        "date": day,
+                        "meal_type": meal_type,
+                        "is_marked_done": rng.random() < 0.7,
+                        "is_custom_meal": custom,
+                        "meal_id": None if custom else rng.choice(meal_ids),
+                        "custom_meal_name": f"Leftover {rng.choice(DISHES).lower()}" if custom else None,
+                        "custom_calories": str(rng.randrange(200, 900, 10)) if custom else None,
+                    }
+
+    return bulk_insert(db, MealPlanner.__table__, plans(), batch_size)
+
+
+def _timestamps(rng: random.Random, count: int, start: date, end: date) -> Iterator[datetime]:
+    """``count`` increasing timestamps between start and end, so ids follow time."""
+    first = datetime.combine(start, dt_time(), timezone.utc)
+    step = (datetime.combine(end, dt_time(), timezone.utc) - first) / max(count, 1)
+    for i in range(count):
+        yield first + step * i + step * rng.random()
+
+
+def seed_messages(
+    db: Session,
+    rng: random.Random,
+    pairs: Sequence[Tuple[str, str]],
+    count: int,
+    start: date,
+    end: date,
+    batch_size: int
+) -> int:
+    """Insert direct messages between followers and creators; a few pairs talk a lot."""
+    if not pairs or count <= 0:
+        return 0
+    conversations = list(pairs)
+    rng.shuffle(conversations)
+    conversations = conversations[:max(1, count // 20)]
+    cum_weights = _zipf_cum_weights(len(conversations), 0.8)
+
+    def messages() -> Iterator[dict]:
+        for created_at in _timestamps(rng, count, start, end):
+            follower, creator = rng.choices(conversations, cum_weights=cum_weights)[0]
+            sender, receiver = (follower, creator) if rng.random() < 0.6 else (creator, follower)
+            yield {
+                "sender_id": sender,
+                "recevier_id": receiver,
+                "content": rng.choice(MESSAGES),
+                "created_at": created_at,
+            }
+
+    return bulk_insert(db, UserMessage.__table__, messages(), batch_size)
+
+
+def seed_admin_messages(
+    db: Session,
+    rng: random.Random,
+    user_ids: Sequence[str],
+    count: int,
+    password_hash: str,
+    start: date,
+    end: date,
+    batch_size: int
+) -> int:
+    """Insert support conversations between users and a seeded admin."""
+    if count <= 0:
+        return 0
+    admin = Admin(id=_user_id(rng), name="Seed Admin", email=f"admin@{SEED_DOMAIN}", password=password_hash)
+    db.add(admin)
+    db.commit()
+
+    senders = list(AdminMessageSender)
+    askers = rng.sample(list(user_ids), min(len(user_ids), max(1, count // 10)))
+
+    def messages() -> Iterator[dict]:
+        for created_at in _timestamps(rng, count, start, end):
+            sender = rng.choice(senders)
+            yield {
+                "user_id": rng.choice(askers),
+                "admin_id": admin.id if sender == AdminMessageSender.Admin else None,
+                "sender": sender,
+                "content": rng.choice(MESSAGES),
+                "created_at": created_at,
+            }
+
+    return bulk_insert(db, AdminMessage.__table__, messages(), batch_size)
+
+
+def rebuild_derived(db: Session, batch_size: int) -> None:
+    """Rebuild the tables the services keep in step with the generated rows."""
+    repair(db, batch_size)
+    backfill(db, batch_size)
+
+    db.execute(
+        text("UPDATE users SET feed_fanout_on_read = (follower_count > :threshold)"),
+        {"threshold": FANOUT_MAX_FOLLOWERS}
+    )
+    db.execute(text("""
+        INSERT INTO feed_timeline (user_id, post_id, author_id)
+        SELECT f.following_user_id, p.id, p.user_id
+        FROM follows f
+        JOIN users a ON a.id = f.followed_user_id AND a.feed_fanout_on_read = false
+        JOIN creator_posts p ON p.user_id = f.followed_user_id
+        WHERE p.status = 'APPROVED'
+    """))
+    db.commit()
+    log_info("Rebuilt feed timelines")
+
+    # Each participant has read up to the last message they sent themselves
+    db.execute(text("""
+        INSERT INTO conversations (
+            user_id, partner_id, last_message_id, last_message_sender_id,
+            last_message_content, last_message_at, last_read_message_id
+        )
+        SELECT p.user_id, p.partner_id, m.id, m.sender_id, m.content, m.created_at,
+               (SELECT max(r.id) FROM user_messages r
+                WHERE r.sender_id = p.user_id AND r.recevier_id = p.partner_id)
+        FROM (
+            SELECT user_id, partner_id, max(id) AS last_message_id
+            FROM (
+                SELECT sender_id AS user_id, recevier_id AS partner_id, id FROM user_messages
+                UNION ALL
+                SELECT recevier_id AS user_id, sender_id AS partner_id, id FROM user_messages
+            ) pairs
+            GROUP BY user_id, partner_id
+        ) p
+        JOIN user_messages m ON m.id = p.last_message_id
+    """))
+    db.execute(text("""
+        INSERT INTO admin_conversations (user_id, user_last_read_message_id, admin_last_read_message_id)
+        SELECT user_id,
+               max(CASE WHEN sender = 'User' THEN id END),
+               max(CASE WHEN sender = 'Admin' THEN id END)
+        FROM admin_messages
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    """))
+    db.commit()
+    log_info("Rebuilt conversations and read cursors")
+
+
+def seed(db: Session, args: argparse.Namespace) -> dict:
+    """
+    Generate the whole dataset described by the command line options.
+
+    Args:
+        db: Database session
+        args: Parsed command line options (see main)
+
+    Returns:
+        Dictionary with the number of rows generated per table
+    """
+    if db.query(User.id).filter(User.email.like(f"%@{SEED_DOMAIN}")).first():
+        raise SystemExit("Seed users already exist; seed an empty database instead")
+
+    rng = random.Random(args.seed)
+    end = args.end_date
+    start = end - timedelta(days=args.days)
+    password_hash = bcrypt_hash(args.password)
+    started = time.monotonic()
+
+    user_ids, creator_ids = seed_users(
+        db, rng, args.users, args.creator_share, password_hash, start, args.days, args.batch_size
+    )
+    pairs = seed_follows(db, rng, user_ids, creator_ids, args.follows, args.batch_size)
+    counts = {
+        "users": len(user_ids),
+        "creators": len(creator_ids),
+        "follows": len(pairs),
+        "creator_posts": seed_posts(db, rng, creator_ids, args.posts, start, args.days, args.batch_size),
+        "meal_planner": seed_meal_plans(
+            db, rng, user_ids, args.planner_share, end, args.meal_days, args.batch_size
+        ),
+        "user_messages": seed_messages(db, rng, pairs, args.messages, start, end, args.batch_size),
+        "admin_messages": seed_admin_messages(
+            db, rng, user_ids, args.admin_messages, password_hash, start, end, args.batch_size
+        ),
+    }
+    rebuild_derived(db, args.batch_size)
+    counts["seconds"] = round(time.monotonic() - started, 1)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--users", type=int, default=10000, help="Users to create")
+    parser.add_argument("--creator-share", type=float, default=0.05, help="Share of users who are creators")
+    parser.add_argument("--follows", type=float, default=20, help="Mean number of creators a user follows")
+    parser.add_argument("--posts", type=int, default=20, help="Mean posts per creator")
+    parser.add_argument("--planner-share", type=float, default=0.3, help="Share of users with meal plans")
+    parser.add_argument("--meal-days", type=int, default=90, help="Days of meal plans per planner")
+    parser.add_argument("--messages", type=int, default=1_000_000, help="Direct messages to create")
+    parser.add_argument("--admin-messages", type=int, default=100_000, help="Support messages to create")
+    parser.add_argument("--days", type=int, default=365, help="Days of history to spread rows over")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(), help="Last day of history (YYYY-MM-DD)")
+    parser.add_argument("--password", default="password123", help="Password of every seeded user")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows per bulk insert")
+    parser.add_argument("--master-dir", type=Path, default=MASTER_DATA_DIR, help="Directory of the master data JSON files")
+    parser.add_argument("--master-only", action="store_true", help="Only load the master data")
+    parser.add_argument("--create-schema", action="store_true", help="Create missing tables from the models (SQLite only)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.create_schema:
+            if db.get_bind().dialect.name == "postgresql":
+                parser.error("--create-schema is for SQLite; run alembic upgrade head on PostgreSQL")
+            Base.metadata.create_all(db.get_bind())
+        print(f"Master data inserted: {load_master(db, args.master_dir)}")
+        if not args.master_only:
+            print(f"Generated: {seed(db, args)}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
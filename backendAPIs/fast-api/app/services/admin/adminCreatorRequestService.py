@@ -8,6 +8,8 @@ from fastapi import HTTPException, status
 
 from app.models.creator_request import CreatorRequest, CreatorRequestStatus
 from app.models.user import User
+from app.utils.pagination import CountMode, paginate
+from app.utils.principal_cache import principal_cache
 
 
 class AdminCreatorRequestService:
@@ -18,7 +20,8 @@ class AdminCreatorRequestService:
         db: Session,
         status_filter: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT
     ) -> dict:
         """
         Get list of creator requests.
@@ -28,6 +31,7 @@ class AdminCreatorRequestService:
             status_filter: Filter by status (PENDING, APPROVED, REJECTED)
             skip: Number of records to skip
             limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
             
         Returns:
             Dictionary with creator requests list and pagination info
@@ -52,11 +56,10 @@ class AdminCreatorRequestService:
                 # Default to PENDING requests
                 query = query.filter(CreatorRequest.status == CreatorRequestStatus.PENDING)
 
-            # Get total count
-            total = query.count()
-
             # Get paginated requests
-            requests = query.order_by(CreatorRequest.requested_date.desc()).offset(skip).limit(limit).all()
+            requests, page_info = paginate(
+                query.order_by(CreatorRequest.requested_date.desc()), skip, limit, count_mode
+            )
 
             requests_data = []
             for req in requests:
@@ -68,17 +71,15 @@ class AdminCreatorRequestService:
                     "description": req.about_self,
                     "experience": req.experience,
                     "links": req.links,
-                    "requestedDate": req.requested_date.isoformat() if req.requested_date else None,
+                    "requestedDate": req.requested_date,
                     "status": req.status.value,
-                    "actionDate": req.action_date.isoformat() if req.action_date else None,
+                    "actionDate": req.action_date,
                     "actionComments": req.action_comments
                 })
 
             return {
                 "requests": requests_data,
-                "total": total,
-                "skip": skip,
-                "limit": limit
+                **page_info
             }
 
         except HTTPException:
@@ -148,6 +149,7 @@ class AdminCreatorRequestService:
                 user.is_creator = True
 
             db.commit()
+            principal_cache.invalidate_user(creator_request.user_id)
 
             return {
                 "message": "Creator request approved successfully",
@@ -5,7 +5,14 @@ from sqlalchemy.exc import OperationalError, DatabaseError
 from sqlalchemy import and_, func
 from fastapi import HTTPException, status
 
+from app.db.search import search_users
+from app.models.creator_post import CreatorPost
 from app.models.user import User
+from app.services.userCounterService import UserCounterService
+from app.utils.pagination import CountMode, paginate
+from app.utils.principal_cache import principal_cache
+from app.utils.recipe_index import recipe_index
+from app.utils.token_revocation import revocation_list, revoke_principal_tokens
 
 
 class AdminManageService:
@@ -16,7 +23,8 @@ class AdminManageService:
         db: Session,
         search: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT
     ) -> dict:
         """
         Get list of users (non-creators).
@@ -26,6 +34,7 @@ class AdminManageService:
             search: Search term for name or email
             skip: Number of records to skip
             limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
             
         Returns:
             Dictionary with users list and pagination info
@@ -34,18 +43,16 @@ class AdminManageService:
             # Build query for non-creator users
             query = db.query(User).filter(User.is_creator == False)
 
-            # Apply search filter
+            # Apply search filter, best matches first
             if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    (User.name.ilike(search_term)) | (User.email.ilike(search_term))
-                )
-
-            # Get total count
-            total = query.count()
+                query = search_users(query, search, include_email=True)
+            else:
+                query = query.order_by(User.created_at.desc())
 
             # Get paginated users
-            users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+            users, page_info = paginate(
+                query, skip, limit, count_mode
+            )
 
             users_data = []
             for user in users:
@@ -56,14 +63,12 @@ class AdminManageService:
                     "phone": user.phone_no,
                     "profilePic": user.profile_pic,
                     "isActive": user.is_active,
-                    "createdAt": user.created_at.isoformat() if user.created_at else None
+                    "createdAt": user.created_at
                 })
 
             return {
                 "data": users_data,
-                "total": total,
-                "skip": skip,
-                "limit": limit
+                **page_info
             }
 
         except OperationalError:
@@ -87,7 +92,8 @@ class AdminManageService:
         db: Session,
         search: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT
     ) -> dict:
         """
         Get list of creators.
@@ -97,6 +103,7 @@ class AdminManageService:
             search: Search term for name or email
             skip: Number of records to skip
             limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
             
         Returns:
             Dictionary with creators list and pagination info
@@ -105,18 +112,16 @@ class AdminManageService:
             # Build query for creators
             query = db.query(User).filter(User.is_creator == True)
 
-            # Apply search filter
+            # Apply search filter, best matches first
             if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    (User.name.ilike(search_term)) | (User.email.ilike(search_term))
-                )
-
-            # Get total count
-            total = query.count()
+                query = search_users(query, search, include_email=True)
+            else:
+                query = query.order_by(User.created_at.desc())
 
             # Get paginated creators
-            creators = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+            creators, page_info = paginate(
+                query, skip, limit, count_mode
+            )
 
             creators_data = []
             for creator in creators:
@@ -127,14 +132,12 @@ class AdminManageService:
                     "phone": creator.phone_no,
                     "profilePic": creator.profile_pic,
                     "isActive": creator.is_active,
-                    "createdAt": creator.created_at.isoformat() if creator.created_at else None
+                    "createdAt": creator.created_at
                 })
 
             return {
                 "data": creators_data,
-                "total": total,
-                "skip": skip,
-                "limit": limit
+                **page_info
             }
 
         except OperationalError:
@@ -175,7 +178,10 @@ class AdminManageService:
                 )
 
             user.is_active = False
+            revocation = revoke_principal_tokens(db, user)
             db.commit()
+            principal_cache.invalidate_user(user_id)
+            revocation_list.apply(revocation)
 
             return {
                 "message": "User deactivated successfully",
@@ -281,7 +287,10 @@ class AdminManageService:
                 )
 
             user.is_creator = False
+            revocation = revoke_principal_tokens(db, user)
             db.commit()
+            principal_cache.invalidate_user(user_id)
+            revocation_list.apply(revocation)
 
             return {
                 "message": "Creator status removed successfully",
@@ -330,8 +339,15 @@ class AdminManageService:
                     detail="User not found"
                 )
 
+            revocation = revoke_principal_tokens(db, user)
+            UserCounterService.remove_user(db, user_id)
+            # Deleted with the user by cascade
+            post_ids = [post_id for (post_id,) in db.query(CreatorPost.id).filter(CreatorPost.user_id == user_id)]
             db.delete(user)
             db.commit()
+            principal_cache.invalidate_user(user_id)
+            revocation_list.apply(revocation)
+            recipe_index.remove_posts(post_ids)
 
             return {
                 "message": "User deleted successfully",
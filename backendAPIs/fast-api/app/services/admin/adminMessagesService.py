@@ -5,8 +5,12 @@ from sqlalchemy.exc import OperationalError, DatabaseError, IntegrityError
 from sqlalchemy import and_, or_, func, desc, case
 from fastapi import HTTPException, status
 
+from app.models.admin_conversation import AdminConversation
 from app.models.admin_message import AdminMessage, AdminMessageSender
 from app.models.user import User
+from app.realtime import hub
+from app.utils.pagination import apply_keyset, keyset_page
+from app.utils.read_cursors import advance_admin_read_cursor
 
 
 class AdminMessagesService:
@@ -31,6 +35,7 @@ class AdminMessagesService:
             user_ids_subquery = db.query(AdminMessage.user_id).distinct().subquery()
             
             # Get user details with last message info and unread count
+            # (user messages after the admins' read cursor)
             conversations_query = db.query(
                 User,
                 func.coalesce(
@@ -38,7 +43,7 @@ class AdminMessagesService:
                         case(
                             (and_(
                                 AdminMessage.sender == AdminMessageSender.User,
-                                AdminMessage.is_read == False
+                                AdminMessage.id > func.coalesce(AdminConversation.admin_last_read_message_id, 0)
                             ), 1)
                         )
                     ), 0
@@ -46,6 +51,9 @@ class AdminMessagesService:
             ).join(
                 user_ids_subquery,
                 User.id == user_ids_subquery.c.user_id
+            ).outerjoin(
+                AdminConversation,
+                AdminConversation.user_id == User.id
             ).outerjoin(
                 AdminMessage,
                 AdminMessage.user_id == User.id
@@ -68,14 +76,17 @@ class AdminMessagesService:
                         "email": user.email,
                         "image": user.profile_pic or "",
                         "lastMessage": last_message.content or "",
-                        "lastMessageTime": last_message.created_at.isoformat() if last_message.created_at else None,
+                        "lastMessageTime": last_message.created_at,
                         "lastMessageSender": last_message.sender.value,
                         "unreadCount": unread_count,
-                        "isOnline": False  # Can be enhanced with real-time status
+                        "isOnline": hub.is_online(user.id)
                     })
 
             # Sort by last message time
-            conversation_list.sort(key=lambda x: x['lastMessageTime'] or '', reverse=True)
+            conversation_list.sort(
+                key=lambda x: (x['lastMessageTime'] is not None, x['lastMessageTime'] or 0),
+                reverse=True
+            )
 
             return conversation_list
 
@@ -100,21 +111,25 @@ class AdminMessagesService:
         db: Session,
         admin_id: str,
         user_id: str,
-        skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> dict:
         """
-        Get messages for a specific conversation with a user.
+        Get a page of messages for a conversation with a user, newest first.
+        
+        Viewing a page moves the admins' read cursor up to its newest message.
         
         Args:
             db: Database session
             admin_id: Admin ID from request state
             user_id: The user in the conversation
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            before_id: Only messages older than this message id
+            after_id: Only messages newer than this message id
             
         Returns:
-            Dictionary with messages list and pagination info
+            Dictionary with messages list, has_more flag and user info
         """
         try:
             # Verify user exists
@@ -125,43 +140,41 @@ class AdminMessagesService:
                     detail="User not found"
                 )
 
-            # Get messages for this user
-            messages_query = db.query(AdminMessage).filter(
-                AdminMessage.user_id == user_id
-            ).order_by(AdminMessage.created_at.asc())
-
-            # Get total count
-            total = messages_query.count()
+            messages, has_more = keyset_page(
+                apply_keyset(
+                    db.query(AdminMessage).filter(AdminMessage.user_id == user_id),
+                    AdminMessage.id, limit, before_id, after_id
+                ).all(),
+                limit, before_id, after_id
+            )
 
-            # Get paginated messages
-            messages = messages_query.offset(skip).limit(limit).all()
+            cursors = db.query(AdminConversation).filter(
+                AdminConversation.user_id == user_id
+            ).first()
+            user_read_up_to = (cursors.user_last_read_message_id if cursors else None) or 0
+            admin_read_up_to = (cursors.admin_last_read_message_id if cursors else None) or 0
 
-            # Mark user messages as read
-            db.query(AdminMessage).filter(
-                and_(
-                    AdminMessage.user_id == user_id,
-                    AdminMessage.sender == AdminMessageSender.User,
-                    AdminMessage.is_read == False
-                )
-            ).update({"is_read": True}, synchronize_session=False)
-            db.commit()
+            if messages and messages[0].id > admin_read_up_to:
+                advance_admin_read_cursor(db, user_id, AdminMessageSender.Admin, messages[0].id)
+                db.commit()
+                admin_read_up_to = messages[0].id
 
             messages_data = []
             for message in messages:
+                read_up_to = admin_read_up_to if message.sender == AdminMessageSender.User else user_read_up_to
                 messages_data.append({
                     "id": message.id,
                     "userId": message.user_id,
                     "adminId": message.admin_id,
                     "sender": message.sender.value,
                     "content": message.content,
-                    "isRead": message.is_read,
-                    "createdAt": message.created_at.isoformat() if message.created_at else None
+                    "isRead": message.id <= read_up_to,
+                    "createdAt": message.created_at
                 })
 
             return {
                 "messages": messages_data,
-                "total": total,
-                "skip": skip,
+                "has_more": has_more,
                 "limit": limit,
                 "user": {
                     "id": user.id,
@@ -222,8 +235,7 @@ class AdminMessagesService:
                 user_id=user_id,
                 admin_id=admin_id,
                 sender=AdminMessageSender.Admin,
-                content=content,
-                is_read=False
+                content=content
             )
             
             db.add(message)
@@ -236,8 +248,8 @@ class AdminMessagesService:
                 "adminId": message.admin_id,
                 "sender": message.sender.value,
                 "content": message.content,
-                "isRead": message.is_read,
-                "createdAt": message.created_at.isoformat() if message.created_at else None
+                "isRead": False,
+                "createdAt": message.created_at
             }
 
         except HTTPException:
@@ -280,10 +292,14 @@ class AdminMessagesService:
             Dictionary with unread count
         """
         try:
-            unread_count = db.query(func.count(AdminMessage.id)).filter(
+            # User messages after the admins' read cursor
+            unread_count = db.query(func.count(AdminMessage.id)).outerjoin(
+                AdminConversation,
+                AdminConversation.user_id == AdminMessage.user_id
+            ).filter(
                 and_(
                     AdminMessage.sender == AdminMessageSender.User,
-                    AdminMessage.is_read == False
+                    AdminMessage.id > func.coalesce(AdminConversation.admin_last_read_message_id, 0)
                 )
             ).scalar()
 
@@ -316,6 +332,8 @@ class AdminMessagesService:
         """
         Mark all messages from a user as read.
         
+        Moves the admins' read cursor to the latest message.
+        
         Args:
             db: Database session
             admin_id: Admin ID from request state
@@ -325,14 +343,19 @@ class AdminMessagesService:
             Dictionary with success message
         """
         try:
-            # Mark all unread messages from user as read
-            updated_count = db.query(AdminMessage).filter(
+            admin_read_up_to = db.query(AdminConversation.admin_last_read_message_id).filter(
+                AdminConversation.user_id == user_id
+            ).scalar()
+
+            # Messages from user after the cursor are the ones marked read
+            updated_count = db.query(func.count(AdminMessage.id)).filter(
                 and_(
                     AdminMessage.user_id == user_id,
                     AdminMessage.sender == AdminMessageSender.User,
-                    AdminMessage.is_read == False
+                    AdminMessage.id > (admin_read_up_to or 0)
                 )
-            ).update({"is_read": True}, synchronize_session=False)
+            ).scalar()
+            advance_admin_read_cursor(db, user_id, AdminMessageSender.Admin)
 
             db.commit()
 
@@ -8,6 +8,10 @@ from fastapi import HTTPException, status
 
 from app.models.creator_post import CreatorPost, CreatorPostStatus
 from app.models.user import User
+from app.services.feedService import FeedService
+from app.services.userCounterService import UserCounterService
+from app.utils.pagination import CountMode, paginate
+from app.utils.recipe_index import recipe_index
 
 
 class AdminPostRequestService:
@@ -18,7 +22,8 @@ class AdminPostRequestService:
         db: Session,
         status_filter: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT
     ) -> dict:
         """
         Get list of creator post requests.
@@ -28,6 +33,7 @@ class AdminPostRequestService:
             status_filter: Filter by status (PENDING, APPROVED, REJECTED)
             skip: Number of records to skip
             limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
             
         Returns:
             Dictionary with post requests list and pagination info
@@ -52,11 +58,10 @@ class AdminPostRequestService:
                 # Default to PENDING posts
                 query = query.filter(CreatorPost.status == CreatorPostStatus.PENDING)
 
-            # Get total count
-            total = query.count()
-
             # Get paginated posts
-            posts = query.order_by(CreatorPost.created_at.desc()).offset(skip).limit(limit).all()
+            posts, page_info = paginate(
+                query.order_by(CreatorPost.created_at.desc()), skip, limit, count_mode
+            )
 
             posts_data = []
             for post in posts:
@@ -74,16 +79,14 @@ class AdminPostRequestService:
                     "ingredients": post.ingredients,
                     "instructions": post.instructions,
                     "status": post.status.value,
-                    "createdAt": post.created_at.isoformat() if post.created_at else None,
-                    "actionDate": post.action_date.isoformat() if post.action_date else None,
+                    "createdAt": post.created_at,
+                    "actionDate": post.action_date,
                     "actionComments": post.action_comments
                 })
 
             return {
                 "posts": posts_data,
-                "total": total,
-                "skip": skip,
-                "limit": limit
+                **page_info
             }
 
         except HTTPException:
@@ -145,7 +148,12 @@ class AdminPostRequestService:
             post.action_by = admin_id
             post.action_comments = comments
 
+            # Count it and deliver to followers' feeds in the same transaction
+            UserCounterService.adjust(db, post.user_id, post_count=1)
+            FeedService.fan_out_post(db, post)
+
             db.commit()
+            recipe_index.add_post(post)
 
             return {
                 "message": "Post request approved successfully",
@@ -5,18 +5,21 @@ from uuid import uuid4
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, DatabaseError, IntegrityError
 from fastapi import HTTPException, status
-import bcrypt
 
 from app.models.user import User
 from app.models.admin import Admin
 from app.models.user_auth_identity import UserAuthIdentity
 from app.models.auth_provider import AuthProvider
 from app.utils.jwt_utils import (
+    admin_access_token_lifetime,
     create_access_token,
     create_refresh_token,
     decode_token,
     update_user_tokens
 )
+from app.utils.password_hasher import bcrypt_hash, bcrypt_verify, password_hasher
+from app.utils.principal_cache import principal_cache
+from app.utils.token_revocation import revocation_list, revoke_principal_tokens
 
 
 class AuthService:
@@ -24,21 +27,16 @@ class AuthService:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password using bcrypt."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        """Hash a password using bcrypt on the calling thread."""
+        return bcrypt_hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
+        """Verify a password against its hash on the calling thread."""
+        return bcrypt_verify(plain_password, hashed_password)
 
     @staticmethod
-    def sign_up(
+    async def sign_up(
         db: Session,
         email: str,
         password: str,
@@ -96,7 +94,7 @@ class AuthService:
             db.flush()
 
             # Hash password
-            password_hash = AuthService.hash_password(password)
+            password_hash = await password_hasher.hash(password)
 
             # Create auth identity
             access_token_expires = datetime.now(timezone.utc) + timedelta(minutes=30)
@@ -104,7 +102,10 @@ class AuthService:
                 user_id=user.id,
                 email=email,
                 provider_id=provider.id,
-                is_admin=False
+                is_admin=False,
+                is_creator=user.is_creator,
+                is_active=user.is_active,
+                token_version=user.token_version or 0
             )
             refresh_token = create_refresh_token(
                 user_id=user.id,
@@ -168,7 +169,7 @@ class AuthService:
             )
 
     @staticmethod
-    def sign_in(db: Session, email: str, password: str) -> dict:
+    async def sign_in(db: Session, email: str, password: str) -> dict:
         """
         Authenticate a user.
         
@@ -193,7 +194,7 @@ class AuthService:
                 )
 
             # Verify password
-            if not AuthService.verify_password(password, auth_identity.password_hash):
+            if not await password_hasher.verify(password, auth_identity.password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password"
@@ -220,7 +221,10 @@ class AuthService:
                 user_id=user.id,
                 email=email,
                 provider_id=auth_identity.provider_id,
-                is_admin=False
+                is_admin=False,
+                is_creator=user.is_creator,
+                is_active=user.is_active,
+                token_version=user.token_version or 0
             )
             refresh_token = create_refresh_token(
                 user_id=user.id,
@@ -267,7 +271,7 @@ class AuthService:
             )
 
     @staticmethod
-    def admin_sign_in(db: Session, email: str, password: str) -> dict:
+    async def admin_sign_in(db: Session, email: str, password: str) -> dict:
         """
         Authenticate an admin.
         
@@ -290,7 +294,7 @@ class AuthService:
                 )
 
             # Verify password
-            if not AuthService.verify_password(password, admin.password_hash):
+            if not await password_hasher.verify(password, admin.password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password"
@@ -316,13 +320,14 @@ class AuthService:
                 db.flush()
 
             # Generate tokens
-            access_token_expires = datetime.now(timezone.utc) + timedelta(hours=8)
+            access_token_expires = datetime.now(timezone.utc) + admin_access_token_lifetime()
             access_token = create_access_token(
                 user_id=admin.id,
                 email=email,
                 provider_id=provider.id,
                 is_admin=True,
-                expires_delta=timedelta(hours=8)
+                expires_delta=admin_access_token_lifetime(),
+                token_version=admin.token_version or 0
             )
             refresh_token = create_refresh_token(
                 user_id=admin.id,
@@ -411,7 +416,10 @@ class AuthService:
                 user_id=user.id,
                 email=email,
                 provider_id=auth_identity.provider_id,
-                is_admin=False
+                is_admin=False,
+                is_creator=user.is_creator,
+                is_active=user.is_active,
+                token_version=user.token_version or 0
             )
 
             # Update token in database
@@ -443,14 +451,15 @@ class AuthService:
             )
 
     @staticmethod
-    def logout(db: Session, user_id: str, provider_id: int) -> dict:
+    def logout(db: Session, user_id: str, provider_id: int, is_admin: bool = False) -> dict:
         """
-        Logout user by invalidating tokens.
+        Logout user or admin by invalidating tokens.
         
         Args:
             db: Database session
-            user_id: User ID
+            user_id: User or admin ID
             provider_id: Provider ID
+            is_admin: Whether the principal is an admin
             
         Returns:
             Dictionary with success message
@@ -462,11 +471,22 @@ class AuthService:
                 UserAuthIdentity.provider_id == provider_id
             ).first()
 
+            revocation = None
+            principal_model = Admin if is_admin else User
+            principal = db.query(principal_model).filter(principal_model.id == user_id).first()
+            if principal:
+                revocation = revoke_principal_tokens(db, principal)
+
             if auth_identity:
                 auth_identity.access_token = None
                 auth_identity.refresh_token = None
                 auth_identity.token_expires_at = None
-                db.commit()
+
+            db.commit()
+
+            principal_cache.invalidate_user(user_id)
+            if revocation:
+                revocation_list.apply(revocation)
 
             return {
                 "message": "Logged out successfully"
@@ -0,0 +1,158 @@
+"""Maintenance of the materialized follower feed.
+
+Approved posts are written into each follower's ``feed_timeline`` (fan-out on
+write), so reading a feed page is a range scan over the reader's own rows.
+Creators with more followers than ``FEED_FANOUT_MAX_FOLLOWERS`` would make a
+single approval write that many rows; they are switched to fan-out on read
+and their posts are merged in when the feed is read.
+
+These helpers run inside the caller's transaction and leave committing and
+error handling to the calling service.
+"""
+import os
+from typing import List, Optional
+
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.db.upsert import upsert_insert
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.feed_entry import FeedEntry
+from app.models.follow import Follow
+from app.models.user import User
+
+FANOUT_MAX_FOLLOWERS = int(os.getenv("FEED_FANOUT_MAX_FOLLOWERS", "10000"))
+BACKFILL_POSTS = int(os.getenv("FEED_BACKFILL_POSTS", "200"))
+
+
+class FeedService:
+    """Helpers that keep feed timelines in step with posts and follows."""
+
+    @staticmethod
+    def fan_out_post(db: Session, post: CreatorPost) -> int:
+        """
+        Add a newly approved post to its author's followers' timelines.
+
+        Switches the author to fan-out on read instead when they have more
+        than FANOUT_MAX_FOLLOWERS followers.
+
+        Args:
+            db: Database session
+            post: The approved post
+
+        Returns:
+            Number of timelines written
+        """
+        author = db.query(User).filter(User.id == post.user_id).first()
+        if author.feed_fanout_on_read:
+            return 0
+
+        if author.follower_count > FANOUT_MAX_FOLLOWERS:
+            author.feed_fanout_on_read = True
+            return 0
+
+        result = db.execute(
+            FeedEntry.__table__.insert().from_select(
+                ["user_id", "post_id", "author_id"],
+                select(
+                    Follow.following_user_id,
+                    literal(post.id),
+                    literal(post.user_id)
+                ).where(Follow.followed_user_id == post.user_id)
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def backfill_author(db: Session, user_id: str, author: User) -> None:
+        """
+        Copy an author's latest approved posts into a new follower's timeline.
+
+        Args:
+            db: Database session
+            user_id: The new follower
+            author: The followed user
+        """
+        if author.feed_fanout_on_read:
+            return
+
+        latest_posts = select(
+            literal(user_id),
+            CreatorPost.id,
+            CreatorPost.user_id
+        ).where(
+            CreatorPost.user_id == author.id,
+            CreatorPost.status == CreatorPostStatus.APPROVED
+        ).order_by(CreatorPost.id.desc()).limit(BACKFILL_POSTS)
+
+        insert = upsert_insert(db)
+        db.execute(
+            insert(FeedEntry).from_select(
+                ["user_id", "post_id", "author_id"], latest_posts
+            ).on_conflict_do_nothing()
+        )
+
+    @staticmethod
+    def prune_author(db: Session, user_id: str, author_id: str) -> None:
+        """Remove an unfollowed author's posts from a user's timeline."""
+        db.query(FeedEntry).filter(
+            FeedEntry.user_id == user_id,
+            FeedEntry.author_id == author_id
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def page_post_ids(
+        db: Session,
+        user_id: str,
+        limit: int,
+        before_id: Optional[int] = None
+    ) -> List[int]:
+        """
+        Get up to ``limit + 1`` post ids for a feed page, newest first.
+
+        Reads the user's timeline and, for followed creators on fan-out on
+        read, each creator's own latest posts; every source stops after
+        ``limit + 1`` rows.
+
+        Args:
+            db: Database session
+            user_id: The reader
+            limit: Page size
+            before_id: Only posts older than this post id
+
+        Returns:
+            Post ids, newest first
+        """
+        timeline_query = db.query(FeedEntry.post_id).filter(FeedEntry.user_id == user_id)
+        if before_id is not None:
+            timeline_query = timeline_query.filter(FeedEntry.post_id < before_id)
+        post_ids = {
+            post_id for post_id, in
+            timeline_query.order_by(FeedEntry.post_id.desc()).limit(limit + 1)
+        }
+
+        pulled_author_ids = [
+            author_id for author_id, in db.query(Follow.followed_user_id).join(
+                User,
+                User.id == Follow.followed_user_id
+            ).filter(
+                Follow.following_user_id == user_id,
+                User.feed_fanout_on_read == True
+            )
+        ]
+
+        if pulled_author_ids:
+            author_pages = []
+            for author_id in pulled_author_ids:
+                author_page = select(CreatorPost.id).where(
+                    CreatorPost.user_id == author_id,
+                    CreatorPost.status == CreatorPostStatus.APPROVED
+                )
+                if before_id is not None:
+                    author_page = author_page.where(CreatorPost.id < before_id)
+                author_pages.append(select(
+                    author_page.order_by(CreatorPost.id.desc()).limit(limit + 1).subquery().c.id
+                ))
+            post_ids.update(db.execute(union_all(*author_pages)).scalars())
+
+        return sorted(post_ids, reverse=True)[:limit + 1]
@@ -1,330 +1,271 @@
-"""Service layer for master data GET operations."""
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError, OperationalError, DatabaseError
+"""Service layer for master data GET operations.
+
+Master data is served from the in-memory snapshot in
+``app.utils.master_cache``; each method returns an encoded JSON response
+body that the routes send as is.
+"""
+import gzip
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy.exc import OperationalError, DatabaseError
 from fastapi import HTTPException, status
 
-from app.models.country import Country
-from app.models.city import City
-from app.models.meal import Meal
-from app.models.ingredient import Ingredient
+from app.schemas.masterSchema import CityResponse, CountryResponse, IngredientResponse, MealResponse
+from app.utils.master_cache import MasterData, master_cache
+
+
+def _serve(action: str, build: Callable[[MasterData], bytes]) -> bytes:
+    """Run a lookup against the master data snapshot with error handling."""
+    try:
+        return build(master_cache.get())
+    except HTTPException:
+        raise
+    except OperationalError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection error. Please try again later."
+        )
+    except DatabaseError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error occurred while fetching {action}"
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred while fetching {action}"
+        )
+
+
+def _check_page(skip: int, limit: int) -> None:
+    """Validate pagination parameters."""
+    if skip < 0 or limit <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination parameters"
+        )
+    if limit > 1000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Limit cannot exceed 1000"
+        )
+
+
+def _item(data: MasterData, index, key: tuple, item_id: int, label: str) -> bytes:
+    """Encode a single row looked up by id, or raise 404."""
+    item = index.get(item_id)
+    if item is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{label} with id {item_id} not found"
+        )
+    return data.encoded(key, f"{label} retrieved successfully", lambda: item)
+
+
+def _search(action: str, search: Callable[[MasterData], List[dict]]) -> List[dict]:
+    """Run a prefix search against the master data snapshot with error handling."""
+    try:
+        return search(master_cache.get())
+    except OperationalError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection error. Please try again later."
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred while searching {action}"
+        )
 
 
 # Country Services
 class CountryService:
     @staticmethod
-    def get_country(db: Session, country_id: int) -> Optional[Country]:
-        """Get a single country by ID with error handling."""
-        try:
-            country = db.query(Country).filter(Country.id == country_id).first()
-            if not country:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Country with id {country_id} not found"
-                )
-            return country
-        except HTTPException:
-            raise
-        except OperationalError as e:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching country"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching country"
-            )
+    def get_country(country_id: int) -> bytes:
+        """Get a single country by ID."""
+        return _serve("country", lambda data: _item(
+            data, data.countries_by_id, ("country", country_id), country_id, "Country"
+        ))
 
     @staticmethod
-    def get_all_countries(db: Session, skip: int = 0, limit: int = 100) -> List[Country]:
-        """Get all countries with pagination and error handling."""
-        try:
-            if skip < 0 or limit <= 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid pagination parameters"
-                )
-            if limit > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Limit cannot exceed 1000"
-                )
-            return db.query(Country).offset(skip).limit(limit).all()
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching countries"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching countries"
-            )
+    def get_all_countries(skip: int = 0, limit: int = 100) -> bytes:
+        """Get all countries with pagination."""
+        _check_page(skip, limit)
+        return _serve("countries", lambda data: data.encoded(
+            ("countries", skip, limit),
+            "Countries retrieved successfully",
+            lambda: data.countries[skip:skip + limit]
+        ))
+
+    @staticmethod
+    def search_countries(query: str, limit: int = 10) -> List[dict]:
+        """Get countries whose name, or a word in it, starts with the query (accent-insensitive)."""
+        return _search("countries", lambda data: data.country_names.search(query, limit))
 
 
 # City Services
 class CityService:
     @staticmethod
-    def get_city(db: Session, city_id: int) -> Optional[City]:
-        """Get a single city by ID with error handling."""
-        try:
-            city = db.query(City).filter(City.id == city_id).first()
-            if not city:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"City with id {city_id} not found"
-                )
-            return city
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching city"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching city"
-            )
+    def get_city(city_id: int) -> bytes:
+        """Get a single city by ID."""
+        return _serve("city", lambda data: _item(
+            data, data.cities_by_id, ("city", city_id), city_id, "City"
+        ))
 
     @staticmethod
-    def get_all_cities(db: Session, skip: int = 0, limit: int = 100) -> List[City]:
-        """Get all cities with pagination and error handling."""
-        try:
-            if skip < 0 or limit <= 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid pagination parameters"
-                )
-            if limit > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Limit cannot exceed 1000"
-                )
-            return db.query(City).offset(skip).limit(limit).all()
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching cities"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching cities"
-            )
+    def get_all_cities(skip: int = 0, limit: int = 100) -> bytes:
+        """Get all cities with pagination."""
+        _check_page(skip, limit)
+        return _serve("cities", lambda data: data.encoded(
+            ("cities", skip, limit),
+            "Cities retrieved successfully",
+            lambda: data.cities[skip:skip + limit]
+        ))
 
     @staticmethod
-    def get_cities_by_country(db: Session, country_id: int) -> List[City]:
-        """Get all cities for a specific country with error handling."""
-        try:
-            # Verify country exists
-            country = db.query(Country).filter(Country.id == country_id).first()
-            if not country:
+    def get_cities_by_country(country_id: int) -> bytes:
+        """Get all cities for a specific country."""
+        def build(data: MasterData) -> bytes:
+            if country_id not in data.countries_by_id:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Country with id {country_id} not found"
                 )
-            return db.query(City).filter(City.country_id == country_id).all()
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching cities by country"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching cities by country"
+            return data.encoded(
+                ("country_cities", country_id),
+                "Cities retrieved successfully",
+                lambda: data.cities_by_country.get(country_id, ())
             )
+        return _serve("cities by country", build)
+
+    @staticmethod
+    def search_cities(query: str, country_id: Optional[int] = None, limit: int = 10) -> List[dict]:
+        """Get cities whose name, or a word in it, starts with the query (accent-insensitive)."""
+        def search(data: MasterData) -> List[dict]:
+            if country_id is None:
+                return data.city_names.search(query, limit)
+            index = data.city_names_by_country.get(country_id)
+            return index.search(query, limit) if index else []
+        return _search("cities", search)
 
 
 # Meal Services
 class MealService:
     @staticmethod
-    def get_meal(db: Session, meal_id: int) -> Optional[Meal]:
-        """Get a single meal by ID with error handling."""
-        try:
-            meal = db.query(Meal).filter(Meal.id == meal_id).first()
-            if not meal:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Meal with id {meal_id} not found"
-                )
-            return meal
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching meal"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching meal"
-            )
+    def get_meal(meal_id: int) -> bytes:
+        """Get a single meal by ID."""
+        return _serve("meal", lambda data: _item(
+            data, data.meals_by_id, ("meal", meal_id), meal_id, "Meal"
+        ))
 
     @staticmethod
-    def get_all_meals(db: Session, skip: int = 0, limit: int = 100) -> List[Meal]:
-        """Get all meals with pagination and error handling."""
-        try:
-            if skip < 0 or limit <= 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid pagination parameters"
-                )
-            if limit > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Limit cannot exceed 1000"
-                )
-            return db.query(Meal).offset(skip).limit(limit).all()
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching meals"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching meals"
-            )
+    def get_all_meals(skip: int = 0, limit: int = 100) -> bytes:
+        """Get all meals with pagination."""
+        _check_page(skip, limit)
+        return _serve("meals", lambda data: data.encoded(
+            ("meals", skip, limit),
+            "Meals retrieved successfully",
+            lambda: data.meals[skip:skip + limit]
+        ))
 
 
 # Ingredient Services
 class IngredientService:
     @staticmethod
-    def get_ingredient(db: Session, ingredient_id: int) -> Optional[Ingredient]:
-        """Get a single ingredient by ID with error handling."""
-        try:
-            ingredient = db.query(Ingredient).filter(Ingredient.id == ingredient_id).first()
-            if not ingredient:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Ingredient with id {ingredient_id} not found"
-                )
-            return ingredient
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching ingredient"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching ingredient"
-            )
+    def get_ingredient(ingredient_id: int) -> bytes:
+        """Get a single ingredient by ID."""
+        return _serve("ingredient", lambda data: _item(
+            data, data.ingredients_by_id, ("ingredient", ingredient_id), ingredient_id, "Ingredient"
+        ))
 
     @staticmethod
-    def get_all_ingredients(db: Session, skip: int = 0, limit: int = 100) -> List[Ingredient]:
-        """Get all ingredients with pagination and error handling."""
-        try:
-            if skip < 0 or limit <= 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid pagination parameters"
-                )
-            if limit > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Limit cannot exceed 1000"
-                )
-            return db.query(Ingredient).offset(skip).limit(limit).all()
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching ingredients"
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching ingredients"
-            )
+    def get_all_ingredients(skip: int = 0, limit: int = 100) -> bytes:
+        """Get all ingredients with pagination."""
+        _check_page(skip, limit)
+        return _serve("ingredients", lambda data: data.encoded(
+            ("ingredients", skip, limit),
+            "Ingredients retrieved successfully",
+            lambda: data.ingredients[skip:skip + limit]
+        ))
 
     @staticmethod
-    def get_ingredients_by_type(db: Session, ingredient_type: str) -> List[Ingredient]:
-        """Get all ingredients by type with error handling."""
-        try:
-            # Validate ingredient type
-            valid_types = ["Vegetables", "Protein", "Dairy", "Grains"]
-            if ingredient_type not in valid_types:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid ingredient type. Must be one of: {', '.join(valid_types)}"
-                )
-            return db.query(Ingredient).filter(Ingredient.type == ingredient_type).all()
-        except HTTPException:
-            raise
-        except OperationalError:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database connection error. Please try again later."
-            )
-        except DatabaseError:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error occurred while fetching ingredients by type"
-            )
-        except Exception:
+    def get_ingredients_by_type(ingredient_type: str) -> bytes:
+        """Get all ingredients by type."""
+        # Validate ingredient type
+        valid_types = ["Vegetables", "Protein", "Dairy", "Grains"]
+        if ingredient_type not in valid_types:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while fetching ingredients by type"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid ingredient type. Must be one of: {', '.join(valid_types)}"
             )
+        return _serve("ingredients by type", lambda data: data.encoded(
+            ("ingredient_type", ingredient_type),
+            "Ingredients retrieved successfully",
+            lambda: data.ingredients_by_type.get(ingredient_type, ())
+        ))
+
+
+# Bundle Services
+BUNDLE_TABLES = (
+    ("countries", CountryResponse),
+    ("cities", CityResponse),
+    ("meals", MealResponse),
+    ("ingredients", IngredientResponse),
+)
+
+
+def _table(rows, columns: List[str]) -> List[list]:
+    """Rows as value lists in column order."""
+    return [[row[column] for column in columns] for row in rows]
+
+
+class MasterBundleService:
+    @staticmethod
+    def get_bundle(since_version: Optional[str] = None) -> Tuple[str, bytes, bytes]:
+        """
+        Get every master table in one columnar payload.
+
+        With since_version, only rows added or changed since that content
+        version are returned, plus the ids of deleted rows. A version this
+        worker no longer remembers gets the full bundle ("full": true).
+
+        Args:
+            since_version: Content version the client already has
+
+        Returns:
+            Tuple of (ETag, JSON body, gzip-compressed JSON body)
+        """
+        def build(data: MasterData) -> Tuple[str, bytes, bytes]:
+            previous = master_cache.get_version(since_version) if since_version else None
+            if previous is None:
+                key = ("bundle", None)
+                etag = f'"{data.content_version}"'
+            else:
+                key = ("bundle", previous.content_version)
+                etag = f'"{data.content_version}-{previous.content_version}"'
+
+            def bundle() -> dict:
+                payload = {
+                    "version": data.content_version,
+                    "since_version": previous.content_version if previous else None,
+                    "full": previous is None,
+                }
+                for name, schema in BUNDLE_TABLES:
+                    columns = list(schema.model_fields)
+                    rows = getattr(data, name)
+                    if previous is None:
+                        payload[name] = {"columns": columns, "rows": _table(rows, columns)}
+                        continue
+                    old_rows = getattr(previous, f"{name}_by_id")
+                    new_rows = getattr(data, f"{name}_by_id")
+                    payload[name] = {
+                        "columns": columns,
+                        "rows": _table((row for row in rows if old_rows.get(row["id"]) != row), columns),
+                        "deleted": [row_id for row_id in old_rows if row_id not in new_rows],
+                    }
+                return payload
+
+            body = data.encoded(key, "Master data bundle retrieved successfully", bundle)
+            compressed = data.memoized(key + ("gzip",), lambda: gzip.compress(body, compresslevel=6))
+            return etag, body, compressed
+
+        return _serve("master data bundle", build)
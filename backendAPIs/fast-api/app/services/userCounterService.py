@@ -0,0 +1,100 @@
+"""Maintenance of the denormalized counters on ``users``.
+
+``follower_count``, ``following_count`` and ``post_count`` (approved posts)
+are updated with relative ``UPDATE ... SET n = n + 1`` statements in the
+same transaction as the change they count, so concurrent follows do not
+overwrite each other. ``recount`` recomputes them from ``follows`` and
+``creator_posts`` and is used by ``app/scripts/repair_user_counters.py``.
+
+These helpers run inside the caller's transaction and leave committing and
+error handling to the calling service.
+"""
+from typing import List
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.follow import Follow
+from app.models.user import User
+
+
+class UserCounterService:
+    """Helpers that keep user counters in step with follows and posts."""
+
+    @staticmethod
+    def adjust(db: Session, user_id: str, **deltas: int) -> None:
+        """
+        Add to one user's counters, e.g. ``adjust(db, user_id, post_count=1)``.
+
+        Args:
+            db: Database session
+            user_id: User whose counters change
+            **deltas: Amount to add per counter column
+        """
+        values = {
+            getattr(User, column): getattr(User, column) + delta
+            for column, delta in deltas.items() if delta
+        }
+        if values:
+            db.query(User).filter(User.id == user_id).update(values, synchronize_session=False)
+
+    @staticmethod
+    def followed(db: Session, user_id: str, target_user_id: str, delta: int = 1) -> None:
+        """Count a follow (delta=1) or an unfollow (delta=-1) on both users."""
+        UserCounterService.adjust(db, user_id, following_count=delta)
+        UserCounterService.adjust(db, target_user_id, follower_count=delta)
+
+    @staticmethod
+    def remove_user(db: Session, user_id: str) -> None:
+        """
+        Uncount a user's follows before the user is deleted.
+
+        The follows rows go with the user (ON DELETE CASCADE), so the users on
+        the other side of them are decremented here.
+        """
+        followed_ids = db.query(Follow.followed_user_id).filter(
+            Follow.following_user_id == user_id
+        ).scalar_subquery()
+        db.query(User).filter(User.id.in_(followed_ids)).update(
+            {User.follower_count: User.follower_count - 1}, synchronize_session=False
+        )
+
+        follower_ids = db.query(Follow.following_user_id).filter(
+            Follow.followed_user_id == user_id
+        ).scalar_subquery()
+        db.query(User).filter(User.id.in_(follower_ids)).update(
+            {User.following_count: User.following_count - 1}, synchronize_session=False
+        )
+
+    @staticmethod
+    def recount(db: Session, user_ids: List[str]) -> int:
+        """
+        Recompute the counters of the given users and fix any that drifted.
+
+        Args:
+            db: Database session
+            user_ids: Users to check
+
+        Returns:
+            Number of users whose counters were corrected
+        """
+        if not user_ids:
+            return 0
+
+        actual = {
+            User.follower_count: select(func.count()).where(
+                Follow.followed_user_id == User.id
+            ).scalar_subquery(),
+            User.following_count: select(func.count()).where(
+                Follow.following_user_id == User.id
+            ).scalar_subquery(),
+            User.post_count: select(func.count()).where(
+                CreatorPost.user_id == User.id,
+                CreatorPost.status == CreatorPostStatus.APPROVED
+            ).scalar_subquery(),
+        }
+        return db.query(User).filter(
+            User.id.in_(user_ids),
+            or_(*(column != count for column, count in actual.items()))
+        ).update(actual, synchronize_session=False)
@@ -1,6 +1,7 @@
 """Service layer for user dashboard operations."""
 from datetime import date
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, DatabaseError
 from sqlalchemy import and_, func
@@ -57,7 +58,7 @@ class UserDashboardService:
                 meals_data.append(meal_info)
 
             return {
-                "date": target_date.isoformat(),
+                "date": target_date,
                 "meals": meals_data
             }
 
@@ -123,7 +124,7 @@ class UserDashboardService:
                         total_calories += plan.meal.calories
 
             return {
-                "date": target_date.isoformat(),
+                "date": target_date,
                 "total_calories": total_calories,
                 "target_calories": user.calories_target or 0
             }
@@ -235,7 +236,7 @@ class UserDashboardService:
                 "image": latest_post.image,
                 "ingredients": latest_post.ingredients,
                 "instructions": latest_post.instructions,
-                "created_at": latest_post.created_at.isoformat() if latest_post.created_at else None
+                "created_at": latest_post.created_at
             }
 
         except OperationalError:
@@ -253,3 +254,38 @@ class UserDashboardService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred while fetching post"
             )
+
+    @staticmethod
+    async def get_todays_meals_async(
+        db: AsyncSession,
+        user_id: str,
+        target_date: date
+    ) -> dict:
+        """Async variant of get_todays_meals for AsyncSession callers."""
+        return await db.run_sync(UserDashboardService.get_todays_meals, user_id, target_date)
+
+    @staticmethod
+    async def get_calories_intake_async(
+        db: AsyncSession,
+        user_id: str,
+        target_date: date
+    ) -> dict:
+        """Async variant of get_calories_intake for AsyncSession callers."""
+        return await db.run_sync(UserDashboardService.get_calories_intake, user_id, target_date)
+
+    @staticmethod
+    async def mark_meals_done_async(
+        db: AsyncSession,
+        user_id: str,
+        meal_ids: List[int]
+    ) -> dict:
+        """Async variant of mark_meals_done for AsyncSession callers."""
+        return await db.run_sync(UserDashboardService.mark_meals_done, user_id, meal_ids)
+
+    @staticmethod
+    async def get_latest_followed_user_post_async(
+        db: AsyncSession,
+        user_id: str
+    ) -> Optional[dict]:
+        """Async variant of get_latest_followed_user_post for AsyncSession callers."""
+        return await db.run_sync(UserDashboardService.get_latest_followed_user_post, user_id)
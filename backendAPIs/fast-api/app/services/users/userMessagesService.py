@@ -1,125 +1,102 @@
 """Service layer for user messaging operations."""
-from typing import List, Optional
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import OperationalError, DatabaseError, IntegrityError
-from sqlalchemy import and_, or_, func, case, desc
+from sqlalchemy import and_, or_, func, case, desc, select, union_all
 from fastapi import HTTPException, status
 
+from app.db.upsert import upsert_insert
+from app.models.admin_conversation import AdminConversation
+from app.models.conversation import Conversation
 from app.models.user_message import UserMessage
 from app.models.admin_message import AdminMessage, AdminMessageSender
 from app.models.user import User
 from app.models.follow import Follow
+from app.realtime import hub
+from app.utils.pagination import apply_keyset, keyset_page
+from app.utils.read_cursors import advance_admin_read_cursor
 
 
 class UserMessagesService:
     """Service class for user messaging operations."""
 
     @staticmethod
-    def get_conversations(db: Session, user_id: str) -> List[dict]:
+    def get_conversations(
+        db: Session,
+        user_id: str,
+        limit: int = 20,
+        cursor: Optional[int] = None
+    ) -> dict:
         """
-        Get list of all conversations for a user.
+        Get a page of conversations for a user, most recent first.
         
-        Returns conversations with last message, unread count, and user details.
+        Served from the conversations summary table with keyset pagination,
+        so each page is a single indexed range scan. Unread counts are the
+        partner's messages after the user's read cursor.
         
         Args:
             db: Database session
             user_id: Current user ID from request state
+            limit: Maximum number of conversations to return
+            cursor: next_cursor from the previous page, if any
             
         Returns:
-            List of conversation dictionaries
+            Dictionary with conversations list and the next page cursor
         """
         try:
-            # Subquery to get last message for each conversation
-            last_message_subquery = db.query(
-                UserMessage.sender_id,
-                UserMessage.recevier_id,
-                func.max(UserMessage.created_at).label('last_message_time')
-            ).filter(
-                or_(
-                    UserMessage.sender_id == user_id,
-                    UserMessage.recevier_id == user_id
-                )
-            ).group_by(
-                UserMessage.sender_id,
-                UserMessage.recevier_id
-            ).subquery()
-
-            # Get all unique users the current user has conversations with
-            sent_users = db.query(UserMessage.recevier_id.label('other_user_id')).filter(
-                UserMessage.sender_id == user_id
-            ).distinct()
-            
-            received_users = db.query(UserMessage.sender_id.label('other_user_id')).filter(
-                UserMessage.recevier_id == user_id
-            ).distinct()
-            
-            # Union both queries
-            all_conversation_users = sent_users.union(received_users).subquery()
-            
-            # Get user details with last message info
+            read_up_to = func.coalesce(Conversation.last_read_message_id, 0)
+            unread_count = case(
+                # Fully read conversations skip the count
+                (read_up_to >= Conversation.last_message_id, 0),
+                else_=select(func.count(UserMessage.id)).where(
+                    UserMessage.sender_id == Conversation.partner_id,
+                    UserMessage.recevier_id == Conversation.user_id,
+                    UserMessage.id > read_up_to
+                ).scalar_subquery()
+            )
+
             conversations_query = db.query(
-                User,
-                func.coalesce(
-                    func.count(
-                        case(
-                            (and_(
-                                UserMessage.recevier_id == user_id,
-                                UserMessage.is_read == False
-                            ), 1)
-                        )
-                    ), 0
-                ).label('unread_count')
+                Conversation,
+                User.name,
+                User.profile_pic,
+                unread_count.label("unread_count")
             ).join(
-                all_conversation_users,
-                User.id == all_conversation_users.c.other_user_id
-            ).outerjoin(
-                UserMessage,
-                or_(
-                    and_(
-                        UserMessage.sender_id == user_id,
-                        UserMessage.recevier_id == User.id
-                    ),
-                    and_(
-                        UserMessage.sender_id == User.id,
-                        UserMessage.recevier_id == user_id
-                    )
+                User,
+                User.id == Conversation.partner_id
+            ).filter(
+                Conversation.user_id == user_id
+            )
+
+            if cursor is not None:
+                conversations_query = conversations_query.filter(
+                    Conversation.last_message_id < cursor
                 )
-            ).group_by(User.id)
 
-            conversations = conversations_query.all()
+            rows = conversations_query.order_by(
+                Conversation.last_message_id.desc()
+            ).limit(limit + 1).all()
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
 
-            # Build conversation list with last message details
             conversation_list = []
-            for user, unread_count in conversations:
-                # Get last message for this conversation
-                last_message = db.query(UserMessage).filter(
-                    or_(
-                        and_(
-                            UserMessage.sender_id == user_id,
-                            UserMessage.recevier_id == user.id
-                        ),
-                        and_(
-                            UserMessage.sender_id == user.id,
-                            UserMessage.recevier_id == user_id
-                        )
-                    )
-                ).order_by(UserMessage.created_at.desc()).first()
-
-                if last_message:
-                    conversation_list.append({
-                        "id": user.id,
-                        "username": user.name or "Unknown User",
-                        "image": user.profile_pic or "",
-                        "lastMessage": last_message.content or "",
-                        "lastMessageTime": last_message.created_at.isoformat() if last_message.created_at else None,
-                        "unreadCount": unread_count,
-                        "isOnline": False  # Can be enhanced with real-time status
-                    })
-
-            # Sort by last message time
-            conversation_list.sort(key=lambda x: x['lastMessageTime'] or '', reverse=True)
-
-            return conversation_list
+            for conversation, name, profile_pic, unread_count in rows:
+                conversation_list.append({
+                    "id": conversation.partner_id,
+                    "username": name or "Unknown User",
+                    "image": profile_pic or "",
+                    "lastMessage": conversation.last_message_content or "",
+                    "lastMessageTime": conversation.last_message_at,
+                    "unreadCount": unread_count,
+                    "isOnline": hub.is_online(conversation.partner_id)
+                })
+
+            return {
+                "conversations": conversation_list,
+                "has_more": has_more,
+                "next_cursor": rows[-1][0].last_message_id if has_more else None
+            }
 
         except OperationalError:
             raise HTTPException(
@@ -137,26 +114,91 @@ class UserMessagesService:
                 detail="An unexpected error occurred while fetching conversations"
             )
 
+    @staticmethod
+    def _record_conversation_message(db: Session, message: UserMessage) -> None:
+        """
+        Point both participants' conversation rows at a new message.
+        
+        A single upsert writes the sender's and the receiver's row. Rows never
+        move back to an older message if concurrent sends commit out of order.
+        
+        Args:
+            db: Database session (message must already be flushed)
+            message: The message that was just sent
+        """
+        insert = upsert_insert(db)
+        message_values = {
+            "last_message_id": message.id,
+            "last_message_sender_id": message.sender_id,
+            "last_message_content": message.content,
+            "last_message_at": func.now(),
+        }
+        upsert = insert(Conversation).values([
+            {"user_id": message.sender_id, "partner_id": message.recevier_id, **message_values},
+            {"user_id": message.recevier_id, "partner_id": message.sender_id, **message_values},
+        ])
+        is_newer = upsert.excluded.last_message_id > Conversation.last_message_id
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[Conversation.user_id, Conversation.partner_id],
+            set_={
+                column: case((is_newer, upsert.excluded[column]), else_=getattr(Conversation, column))
+                for column in message_values
+            }
+        )
+        db.execute(upsert)
+
+    @staticmethod
+    def _advance_read_cursor(db: Session, user_id: str, partner_id: str, message_id=None) -> int:
+        """
+        Move the reader's cursor forward, never back.
+        
+        The conversation row exists as soon as a message does, so this is a
+        single-row UPDATE; it matches no row when nothing new was read.
+        
+        Args:
+            db: Database session
+            user_id: The reader
+            partner_id: The other user in the conversation
+            message_id: Read up to this message (default: the latest message)
+            
+        Returns:
+            Number of rows updated (0 or 1)
+        """
+        read_up_to = Conversation.last_message_id if message_id is None else message_id
+        return db.query(Conversation).filter(
+            Conversation.user_id == user_id,
+            Conversation.partner_id == partner_id,
+            or_(
+                Conversation.last_read_message_id.is_(None),
+                Conversation.last_read_message_id < read_up_to
+            )
+        ).update({"last_read_message_id": read_up_to}, synchronize_session=False)
+
     @staticmethod
     def get_messages(
         db: Session,
         user_id: str,
         creator_id: str,
-        skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> dict:
         """
-        Get messages for a specific conversation.
+        Get a page of messages for a specific conversation, newest first.
+        
+        Viewing a page moves the user's read cursor up to its newest message;
+        re-reading already read messages writes nothing.
         
         Args:
             db: Database session
             user_id: Current user ID from request state
             creator_id: The creator user in the conversation
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            before_id: Only messages older than this message id
+            after_id: Only messages newer than this message id
             
         Returns:
-            Dictionary with messages list and pagination info
+            Dictionary with messages list and has_more flag
         """
         try:
             # Verify creator exists
@@ -167,51 +209,59 @@ class UserMessagesService:
                     detail="Creator not found"
                 )
 
-            # Get messages between the two users
-            messages_query = db.query(UserMessage).filter(
-                or_(
-                    and_(
-                        UserMessage.sender_id == user_id,
-                        UserMessage.recevier_id == creator_id
+            # Page each direction of the conversation on its own
+            # (sender_id, recevier_id, id) index range, then merge the two
+            direction_ids = [
+                select(apply_keyset(
+                    select(UserMessage.id).where(
+                        UserMessage.sender_id == sender_id,
+                        UserMessage.recevier_id == receiver_id
                     ),
-                    and_(
-                        UserMessage.sender_id == creator_id,
-                        UserMessage.recevier_id == user_id
-                    )
-                )
-            ).order_by(UserMessage.created_at.asc())
-
-            # Get total count
-            total = messages_query.count()
-
-            # Get paginated messages
-            messages = messages_query.offset(skip).limit(limit).all()
+                    UserMessage.id, limit, before_id, after_id
+                ).subquery().c.id)
+                for sender_id, receiver_id in ((user_id, creator_id), (creator_id, user_id))
+            ]
+            page_ids = union_all(*direction_ids).subquery()
+
+            messages, has_more = keyset_page(
+                apply_keyset(
+                    db.query(UserMessage).filter(UserMessage.id.in_(select(page_ids.c.id))),
+                    UserMessage.id, limit, before_id, after_id
+                ).all(),
+                limit, before_id, after_id
+            )
 
-            # Mark received messages as read
-            db.query(UserMessage).filter(
-                and_(
-                    UserMessage.sender_id == creator_id,
-                    UserMessage.recevier_id == user_id,
-                    UserMessage.is_read == False
+            # Both participants' read cursors
+            read_cursors = dict(db.query(
+                Conversation.user_id,
+                Conversation.last_read_message_id
+            ).filter(
+                or_(
+                    and_(Conversation.user_id == user_id, Conversation.partner_id == creator_id),
+                    and_(Conversation.user_id == creator_id, Conversation.partner_id == user_id)
                 )
-            ).update({"is_read": True}, synchronize_session=False)
-            db.commit()
+            ).all())
+
+            if messages and messages[0].id > (read_cursors.get(user_id) or 0):
+                UserMessagesService._advance_read_cursor(db, user_id, creator_id, messages[0].id)
+                db.commit()
+                read_cursors[user_id] = messages[0].id
 
             messages_data = []
             for message in messages:
+                reader_id = creator_id if message.sender_id == user_id else user_id
                 messages_data.append({
                     "id": message.id,
                     "senderId": message.sender_id,
                     "receiverId": message.recevier_id,
                     "content": message.content,
-                    "isRead": message.is_read,
-                    "createdAt": message.created_at.isoformat() if message.created_at else None
+                    "isRead": message.id <= (read_cursors.get(reader_id) or 0),
+                    "createdAt": message.created_at
                 })
 
             return {
                 "messages": messages_data,
-                "total": total,
-                "skip": skip,
+                "has_more": has_more,
                 "limit": limit
             }
 
@@ -272,11 +322,12 @@ class UserMessagesService:
             message = UserMessage(
                 sender_id=user_id,
                 recevier_id=receiver_id,
-                content=content,
-                is_read=False
+                content=content
             )
             
             db.add(message)
+            db.flush()
+            UserMessagesService._record_conversation_message(db, message)
             db.commit()
             db.refresh(message)
 
@@ -285,8 +336,8 @@ class UserMessagesService:
                 "senderId": message.sender_id,
                 "receiverId": message.recevier_id,
                 "content": message.content,
-                "isRead": message.is_read,
-                "createdAt": message.created_at.isoformat() if message.created_at else None
+                "isRead": False,
+                "createdAt": message.created_at
             }
 
         except HTTPException:
@@ -325,6 +376,8 @@ class UserMessagesService:
         """
         Mark all messages in a conversation as read.
         
+        Moves the user's read cursor to the latest message.
+        
         Args:
             db: Database session
             user_id: Current user ID
@@ -334,14 +387,18 @@ class UserMessagesService:
             Dictionary with success message
         """
         try:
-            # Mark all unread messages from creator as read
-            updated_count = db.query(UserMessage).filter(
-                and_(
-                    UserMessage.sender_id == creator_id,
-                    UserMessage.recevier_id == user_id,
-                    UserMessage.is_read == False
-                )
-            ).update({"is_read": True}, synchronize_session=False)
+            last_read_message_id = db.query(Conversation.last_read_message_id).filter(
+                Conversation.user_id == user_id,
+                Conversation.partner_id == creator_id
+            ).scalar()
+
+            # Messages from creator after the cursor are the ones marked read
+            updated_count = db.query(func.count(UserMessage.id)).filter(
+                UserMessage.sender_id == creator_id,
+                UserMessage.recevier_id == user_id,
+                UserMessage.id > (last_read_message_id or 0)
+            ).scalar()
+            UserMessagesService._advance_read_cursor(db, user_id, creator_id)
 
             db.commit()
 
@@ -369,6 +426,49 @@ class UserMessagesService:
                 detail="An unexpected error occurred while marking messages as read"
             )
 
+    @staticmethod
+    async def get_conversations_async(
+        db: AsyncSession,
+        user_id: str,
+        limit: int = 20,
+        cursor: Optional[int] = None
+    ) -> dict:
+        """Async variant of get_conversations for AsyncSession callers."""
+        return await db.run_sync(UserMessagesService.get_conversations, user_id, limit, cursor)
+
+    @staticmethod
+    async def get_messages_async(
+        db: AsyncSession,
+        user_id: str,
+        creator_id: str,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
+    ) -> dict:
+        """Async variant of get_messages for AsyncSession callers."""
+        return await db.run_sync(
+            UserMessagesService.get_messages, user_id, creator_id, limit, before_id, after_id
+        )
+
+    @staticmethod
+    async def send_message_async(
+        db: AsyncSession,
+        user_id: str,
+        receiver_id: str,
+        content: str
+    ) -> dict:
+        """Async variant of send_message for AsyncSession callers."""
+        return await db.run_sync(UserMessagesService.send_message, user_id, receiver_id, content)
+
+    @staticmethod
+    async def mark_conversation_as_read_async(
+        db: AsyncSession,
+        user_id: str,
+        creator_id: str
+    ) -> dict:
+        """Async variant of mark_conversation_as_read for AsyncSession callers."""
+        return await db.run_sync(UserMessagesService.mark_conversation_as_read, user_id, creator_id)
+
 
 class AdminMessagesService:
     """Service class for admin messaging operations."""
@@ -377,59 +477,61 @@ class AdminMessagesService:
     def get_admin_conversation(
         db: Session,
         user_id: str,
-        skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> dict:
         """
-        Get messages between user and admin.
+        Get a page of messages between user and admin, newest first.
+        
+        Viewing a page moves the user's read cursor up to its newest message.
         
         Args:
             db: Database session
             user_id: Current user ID
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            before_id: Only messages older than this message id
+            after_id: Only messages newer than this message id
             
         Returns:
-            Dictionary with messages list and pagination info
+            Dictionary with messages list and has_more flag
         """
         try:
-            # Get messages
-            messages_query = db.query(AdminMessage).filter(
-                AdminMessage.user_id == user_id
-            ).order_by(AdminMessage.created_at.asc())
+            messages, has_more = keyset_page(
+                apply_keyset(
+                    db.query(AdminMessage).filter(AdminMessage.user_id == user_id),
+                    AdminMessage.id, limit, before_id, after_id
+                ).all(),
+                limit, before_id, after_id
+            )
 
-            # Get total count
-            total = messages_query.count()
+            cursors = db.query(AdminConversation).filter(
+                AdminConversation.user_id == user_id
+            ).first()
+            user_read_up_to = (cursors.user_last_read_message_id if cursors else None) or 0
+            admin_read_up_to = (cursors.admin_last_read_message_id if cursors else None) or 0
 
-            # Get paginated messages
-            messages = messages_query.offset(skip).limit(limit).all()
-
-            # Mark admin messages as read
-            db.query(AdminMessage).filter(
-                and_(
-                    AdminMessage.user_id == user_id,
-                    AdminMessage.sender == AdminMessageSender.Admin,
-                    AdminMessage.is_read == False
-                )
-            ).update({"is_read": True}, synchronize_session=False)
-            db.commit()
+            if messages and messages[0].id > user_read_up_to:
+                advance_admin_read_cursor(db, user_id, AdminMessageSender.User, messages[0].id)
+                db.commit()
+                user_read_up_to = messages[0].id
 
             messages_data = []
             for message in messages:
+                read_up_to = admin_read_up_to if message.sender == AdminMessageSender.User else user_read_up_to
                 messages_data.append({
                     "id": message.id,
                     "userId": message.user_id,
                     "adminId": message.admin_id,
                     "sender": message.sender.value,
                     "content": message.content,
-                    "isRead": message.is_read,
-                    "createdAt": message.created_at.isoformat() if message.created_at else None
+                    "isRead": message.id <= read_up_to,
+                    "createdAt": message.created_at
                 })
 
             return {
                 "messages": messages_data,
-                "total": total,
-                "skip": skip,
+                "has_more": has_more,
                 "limit": limit
             }
 
@@ -471,8 +573,7 @@ class AdminMessagesService:
             message = AdminMessage(
                 user_id=user_id,
                 sender=AdminMessageSender.User,
-                content=content,
-                is_read=False
+                content=content
             )
             
             db.add(message)
@@ -485,8 +586,8 @@ class AdminMessagesService:
                 "adminId": message.admin_id,
                 "sender": message.sender.value,
                 "content": message.content,
-                "isRead": message.is_read,
-                "createdAt": message.created_at.isoformat() if message.created_at else None
+                "isRead": False,
+                "createdAt": message.created_at
             }
 
         except IntegrityError:
@@ -527,11 +628,16 @@ class AdminMessagesService:
             Dictionary with unread count
         """
         try:
+            user_read_up_to = db.query(AdminConversation.user_last_read_message_id).filter(
+                AdminConversation.user_id == user_id
+            ).scalar()
+
+            # Admin messages after the user's read cursor
             unread_count = db.query(func.count(AdminMessage.id)).filter(
                 and_(
                     AdminMessage.user_id == user_id,
                     AdminMessage.sender == AdminMessageSender.Admin,
-                    AdminMessage.is_read == False
+                    AdminMessage.id > (user_read_up_to or 0)
                 )
             ).scalar()
 
@@ -554,3 +660,33 @@ class AdminMessagesService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred while fetching unread count"
             )
+
+    @staticmethod
+    async def get_admin_conversation_async(
+        db: AsyncSession,
+        user_id: str,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
+    ) -> dict:
+        """Async variant of get_admin_conversation for AsyncSession callers."""
+        return await db.run_sync(
+            AdminMessagesService.get_admin_conversation, user_id, limit, before_id, after_id
+        )
+
+    @staticmethod
+    async def send_message_to_admin_async(
+        db: AsyncSession,
+        user_id: str,
+        content: str
+    ) -> dict:
+        """Async variant of send_message_to_admin for AsyncSession callers."""
+        return await db.run_sync(AdminMessagesService.send_message_to_admin, user_id, content)
+
+    @staticmethod
+    async def get_unread_admin_message_count_async(
+        db: AsyncSession,
+        user_id: str
+    ) -> dict:
+        """Async variant of get_unread_admin_message_count for AsyncSession callers."""
+        return await db.run_sync(AdminMessagesService.get_unread_admin_message_count, user_id)
@@ -1,13 +1,18 @@
 """Service layer for user post and social operations."""
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import OperationalError, DatabaseError, IntegrityError
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_
 from fastapi import HTTPException, status
 
-from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.db.search import search_users
+from app.models.creator_post import CreatorPost
 from app.models.follow import Follow
 from app.models.user import User
+from app.services.feedService import FeedService
+from app.services.userCounterService import UserCounterService
+from app.utils.pagination import CountMode, decode_cursor, encode_cursor, paginate
 
 
 class UserPostService:
@@ -17,41 +22,42 @@ class UserPostService:
     def get_user_feed(
         db: Session,
         user_id: str,
-        skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None
     ) -> dict:
         """
-        Get feed of approved posts from followed users.
+        Get feed of approved posts from followed users, newest first.
+        
+        Pages through the user's materialized timeline (see FeedService) by
+        post id, so each page reads at most one page of rows per source.
         
         Args:
             db: Database session
             user_id: User ID from request state
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: next_cursor from the previous page, if any
             
         Returns:
-            Dictionary with posts list and pagination info
+            Dictionary with posts list and the next page cursor
         """
         try:
-            # Get posts from followed users
-            posts_query = db.query(CreatorPost).join(
-                Follow,
-                CreatorPost.user_id == Follow.followed_user_id
-            ).filter(
-                and_(
-                    Follow.following_user_id == user_id,
-                    CreatorPost.status == CreatorPostStatus.APPROVED
+            try:
+                before_id = decode_cursor(cursor) if cursor else None
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
                 )
-            ).order_by(CreatorPost.created_at.desc())
 
-            # Get total count
-            total = posts_query.count()
+            post_ids = FeedService.page_post_ids(db, user_id, limit, before_id)
+            has_more = len(post_ids) > limit
+            post_ids = post_ids[:limit]
 
-            # Get paginated posts with user info
-            posts = posts_query.options(
-                joinedload(CreatorPost.user).joinedload(User.country),
-                joinedload(CreatorPost.user).joinedload(User.city)
-            ).offset(skip).limit(limit).all()
+            posts = db.query(CreatorPost).options(
+                joinedload(CreatorPost.user)
+            ).filter(
+                CreatorPost.id.in_(post_ids)
+            ).order_by(CreatorPost.id.desc()).all() if post_ids else []
 
             posts_data = []
             for post in posts:
@@ -68,17 +74,19 @@ class UserPostService:
                     "image": post.image,
                     "ingredients": post.ingredients,
                     "instructions": post.instructions,
-                    "created_at": post.created_at.isoformat() if post.created_at else None
+                    "created_at": post.created_at
                 }
                 posts_data.append(post_info)
 
             return {
                 "posts": posts_data,
-                "total": total,
-                "skip": skip,
+                "has_more": has_more,
+                "next_cursor": encode_cursor(post_ids[-1]) if has_more else None,
                 "limit": limit
             }
 
+        except HTTPException:
+            raise
         except OperationalError:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -95,12 +103,23 @@ class UserPostService:
                 detail="An unexpected error occurred while fetching feed"
             )
 
+    @staticmethod
+    async def get_user_feed_async(
+        db: AsyncSession,
+        user_id: str,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """Async variant of get_user_feed for AsyncSession callers."""
+        return await db.run_sync(UserPostService.get_user_feed, user_id, limit, cursor)
+
     @staticmethod
     def get_following_list(
         db: Session,
         user_id: str,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        count_mode: CountMode = CountMode.EXACT
     ) -> dict:
         """
         Get list of users that the current user is following.
@@ -110,6 +129,7 @@ class UserPostService:
             user_id: User ID from request state
             skip: Number of records to skip
             limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
             
         Returns:
             Dictionary with following list and pagination info
@@ -120,14 +140,14 @@ class UserPostService:
                 Follow.following_user_id == user_id
             ).order_by(Follow.created_at.desc())
 
-            # Get total count
-            total = following_query.count()
-
             # Get paginated following with user details
-            following = following_query.options(
-                joinedload(Follow.followed).joinedload(User.country),
-                joinedload(Follow.followed).joinedload(User.city)
-            ).offset(skip).limit(limit).all()
+            following, page_info = paginate(
+                following_query.options(
+                    joinedload(Follow.followed).joinedload(User.country),
+                    joinedload(Follow.followed).joinedload(User.city)
+                ),
+                skip, limit, count_mode
+            )
 
             following_data = []
             for follow in following:
@@ -142,15 +162,13 @@ class UserPostService:
                     "gender": user.gender,
                     "language": user.language,
                     "is_creator": user.is_creator,
-                    "followed_at": follow.created_at.isoformat() if follow.created_at else None
+                    "followed_at": follow.created_at
                 }
                 following_data.append(user_info)
 
             return {
                 "following": following_data,
-                "total": total,
-                "skip": skip,
-                "limit": limit
+                **page_info
             }
 
         except OperationalError:
@@ -218,6 +236,8 @@ class UserPostService:
                 followed_user_id=target_user_id
             )
             db.add(follow)
+            UserCounterService.followed(db, user_id, target_user_id)
+            FeedService.backfill_author(db, user_id, target_user)
             db.commit()
 
             return {"message": "User followed successfully"}
@@ -278,6 +298,8 @@ class UserPostService:
                 )
 
             db.delete(follow)
+            UserCounterService.followed(db, user_id, target_user_id, delta=-1)
+            FeedService.prune_author(db, user_id, target_user_id)
             db.commit()
 
             return {"message": "User unfollowed successfully"}
@@ -308,7 +330,8 @@ class UserPostService:
         db: Session,
         search_query: Optional[str] = None,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        count_mode: CountMode = CountMode.ESTIMATE
     ) -> dict:
         """
         Search for creators by name.
@@ -318,6 +341,7 @@ class UserPostService:
             search_query: Search term for creator name
             skip: Number of records to skip
             limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
             
         Returns:
             Dictionary with creators list and pagination info
@@ -326,20 +350,18 @@ class UserPostService:
             # Build query for creators
             creators_query = db.query(User).filter(User.is_creator == True)
 
-            # Add search filter if provided
+            # Add search filter if provided, best matches first
             if search_query:
-                creators_query = creators_query.filter(
-                    User.name.ilike(f"%{search_query}%")
-                )
-
-            # Get total count
-            total = creators_query.count()
+                creators_query = search_users(creators_query, search_query)
 
             # Get paginated creators with location info
-            creators = creators_query.options(
-                joinedload(User.country),
-                joinedload(User.city)
-            ).offset(skip).limit(limit).all()
+            creators, page_info = paginate(
+                creators_query.options(
+                    joinedload(User.country),
+                    joinedload(User.city)
+                ),
+                skip, limit, count_mode
+            )
 
             creators_data = []
             for creator in creators:
@@ -357,9 +379,7 @@ class UserPostService:
 
             return {
                 "creators": creators_data,
-                "total": total,
-                "skip": skip,
-                "limit": limit
+                **page_info
             }
 
         except OperationalError:
@@ -408,19 +428,6 @@ class UserPostService:
                     detail="Creator not found"
                 )
 
-            # Get follower count
-            follower_count = db.query(func.count(Follow.following_user_id)).filter(
-                Follow.followed_user_id == creator_id
-            ).scalar()
-
-            # Get post count
-            post_count = db.query(func.count(CreatorPost.id)).filter(
-                and_(
-                    CreatorPost.user_id == creator_id,
-                    CreatorPost.status == CreatorPostStatus.APPROVED
-                )
-            ).scalar()
-
             location = None
             if creator.city and creator.country:
                 location = f"{creator.city.name}, {creator.country.name}"
@@ -435,8 +442,8 @@ class UserPostService:
                 "location": location,
                 "gender": creator.gender,
                 "language": creator.language,
-                "follower_count": follower_count or 0,
-                "post_count": post_count or 0
+                "follower_count": creator.follower_count,
+                "post_count": creator.post_count
             }
 
         except HTTPException:
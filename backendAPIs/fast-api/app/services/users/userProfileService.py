@@ -3,18 +3,16 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, DatabaseError
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 
 from app.models.user import User
 from app.models.user_auth_identity import UserAuthIdentity
 from app.models.country import Country
 from app.models.city import City
+from app.utils.password_hasher import password_hasher
+from app.utils.principal_cache import principal_cache
 from app.schemas.userProfileSchema import UpdateUserProfileRequest, UpdatePasswordRequest
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class UserProfileService:
     """Service class for user profile operations."""
 
@@ -125,6 +123,7 @@ class UserProfileService:
 
             db.commit()
             db.refresh(user)
+            principal_cache.invalidate_user(user_id)
             return user
 
         except HTTPException:
@@ -149,7 +148,7 @@ class UserProfileService:
             )
 
     @staticmethod
-    def update_password(
+    async def update_password(
         db: Session,
         user_id: str,
         password_data: UpdatePasswordRequest
@@ -190,7 +189,7 @@ class UserProfileService:
                 )
 
             # Verify old password
-            if not pwd_context.verify(password_data.old_password, auth_identity.password_hash):
+            if not await password_hasher.verify(password_data.old_password, auth_identity.password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Old password is incorrect"
@@ -204,7 +203,7 @@ class UserProfileService:
                 )
 
             # Hash and update new password
-            auth_identity.password_hash = pwd_context.hash(password_data.new_password)
+            auth_identity.password_hash = await password_hasher.hash(password_data.new_password)
             
             db.commit()
             return {"message": "Password updated successfully"}
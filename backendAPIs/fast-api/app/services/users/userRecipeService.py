@@ -0,0 +1,200 @@
+"""Service layer for matching recipes to a user's ingredients."""
+from typing import List
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.exc import OperationalError, DatabaseError
+from fastapi import HTTPException, status
+
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.post_ingredient import PostIngredient
+from app.utils.ingredient_matcher import entry_name, normalize_ingredient_name
+from app.utils.master_cache import master_cache
+from app.utils.pagination import CountMode, paginate
+from app.utils.recipe_index import recipe_index
+
+# Rankings retried after dropping posts other workers deleted or unapproved
+MATCH_ATTEMPTS = 3
+
+
+class UserRecipeService:
+    """Service class for recipe matching operations."""
+
+    @staticmethod
+    def match_recipes(
+        db: Session,
+        ingredients: List[str],
+        skip: int = 0,
+        limit: int = 10
+    ) -> dict:
+        """
+        Find approved posts that can be cooked with the given ingredients.
+        
+        Posts are ranked by the share of their ingredients covered, then by
+        the number of ingredients still missing (see RecipeIndex.match).
+        
+        Args:
+            db: Database session
+            ingredients: Ingredient names the user has
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Dictionary with matched posts and pagination info
+        """
+        try:
+            recipe_index.ensure_fresh(db)
+
+            # The index trails changes made on other workers by up to one
+            # refresh; drop ranked posts that are gone and rank again so the
+            # page stays full and the total exact
+            for _ in range(MATCH_ATTEMPTS):
+                matches, total = recipe_index.match(ingredients, limit, skip)
+                posts = {
+                    post.id: post
+                    for post in db.query(CreatorPost).options(
+                        joinedload(CreatorPost.user)
+                    ).filter(
+                        CreatorPost.id.in_([match["post_id"] for match in matches]),
+                        CreatorPost.status == CreatorPostStatus.APPROVED
+                    )
+                } if matches else {}
+                gone = [match["post_id"] for match in matches if match["post_id"] not in posts]
+                if not gone:
+                    break
+                recipe_index.remove_posts(gone)
+
+            wanted = {normalize_ingredient_name(name) for name in ingredients}
+            recipes_data = []
+            for match in matches:
+                post = posts.get(match["post_id"])
+                if post is None:
+                    continue
+                recipes_data.append({
+                    "id": post.id,
+                    "user_id": post.user_id,
+                    "user_name": post.user.name,
+                    "user_profile_pic": post.user.profile_pic,
+                    "title": post.title,
+                    "overview": post.overview,
+                    "cooking_time": post.cooking_time,
+                    "cuisine_type": post.cuisine_type,
+                    "servings": post.servings,
+                    "image": post.image,
+                    "ingredients": post.ingredients,
+                    "matched_count": match["matched"],
+                    "missing_count": match["missing"],
+                    "coverage": match["coverage"],
+                    "missing_ingredients": [
+                        name for name in map(entry_name, post.ingredients or [])
+                        if name and normalize_ingredient_name(name) not in wanted
+                    ],
+                    "created_at": post.created_at
+                })
+
+            return {
+                "recipes": recipes_data,
+                "total": total,
+                "has_more": skip + len(matches) < total,
+                "skip": skip,
+                "limit": limit
+            }
+
+        except OperationalError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection error. Please try again later."
+            )
+        except DatabaseError:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database error occurred while matching recipes"
+            )
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while matching recipes"
+            )
+
+    @staticmethod
+    def get_recipes_with_ingredient(
+        db: Session,
+        ingredient_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        count_mode: CountMode = CountMode.ESTIMATE
+    ) -> dict:
+        """
+        Get approved posts that use a master ingredient, newest first.
+
+        Reads the post_ingredients links through their (ingredient_id,
+        post_id) index instead of parsing every post's ingredients JSON.
+
+        Args:
+            db: Database session
+            ingredient_id: Master ingredient ID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            count_mode: How to compute the total (exact, estimate or none)
+
+        Returns:
+            Dictionary with the ingredient, its posts and pagination info
+        """
+        try:
+            ingredient = master_cache.get().ingredients_by_id.get(ingredient_id)
+            if ingredient is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Ingredient not found"
+                )
+
+            query = db.query(CreatorPost).join(
+                PostIngredient, PostIngredient.post_id == CreatorPost.id
+            ).filter(
+                PostIngredient.ingredient_id == ingredient_id,
+                CreatorPost.status == CreatorPostStatus.APPROVED
+            ).order_by(PostIngredient.post_id.desc())
+
+            posts, page_info = paginate(
+                query.options(joinedload(CreatorPost.user)), skip, limit, count_mode
+            )
+
+            recipes_data = [
+                {
+                    "id": post.id,
+                    "user_id": post.user_id,
+                    "user_name": post.user.name,
+                    "user_profile_pic": post.user.profile_pic,
+                    "title": post.title,
+                    "overview": post.overview,
+                    "cooking_time": post.cooking_time,
+                    "cuisine_type": post.cuisine_type,
+                    "servings": post.servings,
+                    "image": post.image,
+                    "ingredients": post.ingredients,
+                    "created_at": post.created_at
+                }
+                for post in posts
+            ]
+
+            return {
+                "ingredient": ingredient,
+                "recipes": recipes_data,
+                **page_info
+            }
+
+        except HTTPException:
+            raise
+        except OperationalError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database connection error. Please try again later."
+            )
+        except DatabaseError:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database error occurred while retrieving recipes"
+            )
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred while retrieving recipes"
+            )
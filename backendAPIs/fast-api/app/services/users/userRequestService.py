@@ -5,11 +5,14 @@ from fastapi import HTTPException, status
 
 from app.models.creator_request import CreatorRequest, CreatorRequestStatus
 from app.models.creator_post import CreatorPost
+from app.models.post_ingredient import PostIngredient
 from app.models.user import User
 from app.schemas.userRequestSchema import (
     CreateCreatorRequest,
     CreateCreatorPost
 )
+from app.utils.ingredient_matcher import master_matcher
+from app.utils.master_cache import master_cache
 
 
 class CreatorRequestService:
@@ -143,6 +146,16 @@ class CreatorPostService:
             )
             
             db.add(creator_post)
+            db.flush()
+
+            # Link the master ingredients the post uses, matched against the
+            # in-memory master data instead of reading the ingredients table
+            matcher = master_matcher(master_cache.get())
+            db.add_all(
+                PostIngredient(post_id=creator_post.id, ingredient_id=ingredient_id)
+                for ingredient_id in matcher.match_post(creator_post.ingredients)
+            )
+
             db.commit()
             db.refresh(creator_post)
             return creator_post
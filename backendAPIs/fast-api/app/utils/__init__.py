@@ -6,10 +6,20 @@ from .jwt_utils import (
     decode_token,
     update_user_tokens
 )
+from .password_hasher import PasswordHasher, password_hasher
+from .principal_cache import PrincipalCache, principal_cache
+from .token_revocation import RevocationList, revocation_list, revoke_principal_tokens
 
 __all__ = [
     "create_access_token",
     "create_refresh_token",
     "decode_token",
-    "update_user_tokens"
+    "update_user_tokens",
+    "PasswordHasher",
+    "password_hasher",
+    "PrincipalCache",
+    "principal_cache",
+    "RevocationList",
+    "revocation_list",
+    "revoke_principal_tokens"
 ]
@@ -0,0 +1,99 @@
+"""Matching free-form ingredient names to the ingredients master table.
+
+Creator posts store their ingredients as JSON entries such as
+``{"name": "Fresh basil leaves", "quantity": "10-12"}``. Names are
+normalized (case, punctuation, whitespace and simple plurals) and matched
+against master ingredient names: an exact match first, otherwise the longest
+run of words inside the name that is a master ingredient, preferring the
+last one ("Fresh basil leaves" -> Basil, "Extra virgin olive oil" ->
+Olive Oil).
+
+New posts are matched with ``master_matcher``, built once per master data
+snapshot from its in-memory ingredient rows; batch jobs that need the table
+as it is right now use ``IngredientMatcher.load``.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.ingredient import Ingredient
+from app.utils.master_cache import MasterData
+
+_NON_WORD = re.compile(r"[^\w\s]|\d|_")
+
+
+def _singular(word: str) -> str:
+    """Strip common English plural endings."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("oes", "ches", "shes", "xes", "sses")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us")):
+        return word[:-1]
+    return word
+
+
+def normalize_ingredient_name(name: str) -> str:
+    """Lower-case an ingredient name, drop punctuation and digits and singularize each word."""
+    words = _NON_WORD.sub(" ", str(name).lower()).split()
+    return " ".join(_singular(word) for word in words)
+
+
+def entry_name(ingredient) -> Optional[str]:
+    """The name of a post ingredient entry (a dict with ``name`` or a plain string)."""
+    name = ingredient.get("name") if isinstance(ingredient, dict) else ingredient
+    return name if isinstance(name, str) else None
+
+
+class IngredientMatcher:
+    """Resolve post ingredient names to master ingredient ids."""
+
+    def __init__(self, ingredients: Iterable[Tuple[int, str]]):
+        self._ids: Dict[str, int] = {}
+        for ingredient_id, name in ingredients:
+            self._ids.setdefault(normalize_ingredient_name(name), ingredient_id)
+        self._max_words = max((len(key.split()) for key in self._ids), default=0)
+
+    @classmethod
+    def load(cls, db: Session) -> "IngredientMatcher":
+        """Build a matcher over the current ingredients master."""
+        return cls(db.query(Ingredient.id, Ingredient.name).all())
+
+    def match(self, name: str) -> Optional[int]:
+        """Return the master ingredient id for a free-form name, if any."""
+        normalized = normalize_ingredient_name(name)
+        if normalized in self._ids:
+            return self._ids[normalized]
+
+        words = normalized.split()
+        for size in range(min(self._max_words, len(words) - 1), 0, -1):
+            for start in range(len(words) - size, -1, -1):
+                ingredient_id = self._ids.get(" ".join(words[start:start + size]))
+                if ingredient_id is not None:
+                    return ingredient_id
+        return None
+
+    def match_post(self, ingredients: List) -> Set[int]:
+        """Return the master ingredient ids used by a post's ingredients JSON."""
+        ingredient_ids = set()
+        for ingredient in ingredients or ():
+            name = entry_name(ingredient)
+            ingredient_id = self.match(name) if name else None
+            if ingredient_id is not None:
+                ingredient_ids.add(ingredient_id)
+        return ingredient_ids
+
+
+# (snapshot digest, matcher) of the last master_matcher call
+_master_matcher: Tuple[Optional[str], Optional[IngredientMatcher]] = (None, None)
+
+
+def master_matcher(data: MasterData) -> IngredientMatcher:
+    """Return the matcher over a master data snapshot's ingredients, built once per content."""
+    global _master_matcher
+    digest, matcher = _master_matcher
+    if matcher is None or digest != data.digest:
+        matcher = IngredientMatcher((row["id"], row["name"]) for row in data.ingredients)
+        _master_matcher = (data.digest, matcher)
+    return matcher
@@ -6,6 +6,7 @@ for user authentication and authorization.
 import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from uuid import uuid4
 
 import jwt
 from sqlalchemy.orm import Session
@@ -14,20 +15,42 @@ from app.models.user import User
 from app.models.user_auth_identity import UserAuthIdentity
 
 
+def access_token_lifetime() -> timedelta:
+    """Return the configured lifetime of user access tokens."""
+    expires_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    return timedelta(minutes=expires_minutes)
+
+
+def admin_access_token_lifetime() -> timedelta:
+    """Return the configured lifetime of admin access tokens."""
+    expires_hours = int(os.getenv("ADMIN_ACCESS_TOKEN_EXPIRE_HOURS", "8"))
+    return timedelta(hours=expires_hours)
+
+
 def create_access_token(
     user_id: str,
     email: str,
     provider_id: int,
     is_admin: bool = False,
-    expires_delta: Optional[timedelta] = None
+    expires_delta: Optional[timedelta] = None,
+    is_creator: bool = False,
+    is_active: bool = True,
+    token_version: int = 0
 ) -> str:
     """Create a JWT access token.
     
+    The token carries snapshots of the user's creator/active flags and token
+    version so it can be validated without a database lookup in stateless mode.
+    
     Args:
         user_id: User's unique identifier
         email: User's email address
-        role: User's role (Admin, Creator, User)
+        provider_id: Authentication provider ID
+        is_admin: Whether the token belongs to an admin
         expires_delta: Token expiration time delta
+        is_creator: Snapshot of the user's creator status
+        is_active: Snapshot of the user's active status
+        token_version: User's current token version
         
     Returns:
         Encoded JWT token string
@@ -37,8 +60,7 @@ def create_access_token(
         raise ValueError("SECRET_KEY environment variable is not set")
     
     if expires_delta is None:
-        expires_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-        expires_delta = timedelta(minutes=expires_minutes)
+        expires_delta = access_token_lifetime()
     
     expire = datetime.now(timezone.utc) + expires_delta
     
@@ -49,6 +71,10 @@ def create_access_token(
         "iat": datetime.now(timezone.utc),
         "is_admin": is_admin,
         "provider_id": provider_id,
+        "is_creator": is_creator,
+        "is_active": is_active,
+        "ver": token_version,
+        "jti": uuid4().hex,
         "type": "access"
     }
     
@@ -0,0 +1,266 @@
+"""In-memory snapshot of the master data tables.
+
+Countries, cities, meals and ingredients change only when an admin edits
+them, yet every master route used to query the database, validate each row
+into a Pydantic model and JSON-encode the result. This module loads the four
+tables once (at startup, see the lifespan in ``app/main.py``) into an
+immutable ``MasterData`` snapshot indexed by id, by country and by type,
+with name prefix indexes for autocomplete. Encoded response bodies are
+memoized on the snapshot per page or lookup, so a repeated request is a
+dict lookup.
+
+``reload`` swaps in a fresh snapshot and bumps ``version`` when the content
+changed; call it after editing master data. ``content_version`` is derived
+from the data itself, so it is the same on every worker and can be handed
+to clients. Each worker holds its own
+snapshot and also reloads every ``MASTER_CACHE_REFRESH_SECONDS`` so edits
+made through another worker show up. Reading four tables, validating and
+hashing them takes long enough to stall the event loop, so on the loop a due
+refresh runs in a worker thread while requests keep getting the current
+snapshot.
+"""
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.config.json_response import dumps
+from app.config.logging_config import log_error, log_info
+from app.config.response_helper import ResponseHelper
+from app.db.database import SessionLocal
+from app.models.city import City
+from app.models.country import Country
+from app.models.ingredient import Ingredient
+from app.models.meal import Meal
+from app.schemas.masterSchema import CityResponse, CountryResponse, IngredientResponse, MealResponse
+from app.utils.prefix_index import PrefixIndex
+
+MAX_ENCODED_BODIES = 1024
+# Snapshots kept to answer bundle deltas (see MasterBundleService)
+HISTORY_SIZE = 8
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Validator for a list of schema rows, built once per schema."""
+    return TypeAdapter(List[schema])
+
+
+def _rows(db: Session, model, schema: Type[BaseModel]) -> Tuple[dict, ...]:
+    """
+    Serialize every row of a master table, ordered by id.
+
+    Only the schema's columns are selected, as plain row tuples, and the
+    whole table is validated and dumped by one cached TypeAdapter instead
+    of loading ORM objects and validating them one at a time.
+    """
+    names = list(schema.model_fields)
+    columns = [getattr(model, name) for name in names]
+    rows = [dict(zip(names, row)) for row in db.query(*columns).order_by(model.id)]
+    adapter = _adapter(schema)
+    return tuple(adapter.dump_python(adapter.validate_python(rows), mode="json"))
+
+
+def _by_id(rows: Tuple[dict, ...]) -> Mapping[int, dict]:
+    return MappingProxyType({row["id"]: row for row in rows})
+
+
+def _grouped(rows: Tuple[dict, ...], key: str) -> Mapping[Hashable, Tuple[dict, ...]]:
+    groups: Dict[Hashable, list] = {}
+    for row in rows:
+        groups.setdefault(row[key], []).append(row)
+    return MappingProxyType({value: tuple(group) for value, group in groups.items()})
+
+
+@dataclass(frozen=True)
+class MasterData:
+    """One immutable load of the master data tables."""
+
+    version: int
+    digest: str
+    loaded_at: float
+    countries: Tuple[dict, ...]
+    cities: Tuple[dict, ...]
+    meals: Tuple[dict, ...]
+    ingredients: Tuple[dict, ...]
+    countries_by_id: Mapping[int, dict]
+    cities_by_id: Mapping[int, dict]
+    cities_by_country: Mapping[int, Tuple[dict, ...]]
+    meals_by_id: Mapping[int, dict]
+    ingredients_by_id: Mapping[int, dict]
+    ingredients_by_type: Mapping[str, Tuple[dict, ...]]
+    country_names: PrefixIndex
+    city_names: PrefixIndex
+    city_names_by_country: Mapping[int, PrefixIndex]
+    _bodies: Dict[Hashable, bytes] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def content_version(self) -> str:
+        """Version derived from the content, equal on every worker holding the same data."""
+        return self.digest[:16]
+
+    def encoded(self, key: Hashable, message: str, build: Callable[[], object]) -> bytes:
+        """
+        Return the encoded success response for a page or lookup.
+
+        Args:
+            key: Identifies the page, e.g. ("countries", skip, limit)
+            message: Response message
+            build: Returns the response data on a miss
+
+        Returns:
+            JSON body in the ResponseHelper success format
+        """
+        return self.memoized(
+            key,
+            lambda: dumps(ResponseHelper.body(build(), message))
+        )
+
+    def memoized(self, key: Hashable, build: Callable[[], bytes]) -> bytes:
+        """Return the bytes stored under key, building them on a miss."""
+        body = self._bodies.get(key)
+        if body is None:
+            body = build()
+            if len(self._bodies) < MAX_ENCODED_BODIES:
+                self._bodies[key] = body
+        return body
+
+
+class MasterDataCache:
+    """Holds the current MasterData snapshot and reloads it."""
+
+    def __init__(self, refresh_seconds: float = 300.0):
+        self.refresh_seconds = refresh_seconds
+        self._data: Optional[MasterData] = None
+        self._history: "OrderedDict[str, MasterData]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._refresh_task: Optional[asyncio.Future] = None
+        # A failed refresh is retried after another refresh_seconds
+        self._retry_at = 0.0
+        self.reloads = 0
+
+    def load(self, db: Session) -> MasterData:
+        """Build a snapshot from the database and make it current."""
+        countries = _rows(db, Country, CountryResponse)
+        cities = _rows(db, City, CityResponse)
+        meals = _rows(db, Meal, MealResponse)
+        ingredients = _rows(db, Ingredient, IngredientResponse)
+        digest = hashlib.sha256(dumps([countries, cities, meals, ingredients])).hexdigest()
+
+        with self._lock:
+            current = self._data
+            if current is not None and current.digest == digest:
+                # Unchanged: keep the snapshot and its encoded bodies
+                data = replace(current, loaded_at=time.monotonic())
+            else:
+                cities_by_country = _grouped(cities, "country_id")
+                data = MasterData(
+                    version=(current.version + 1) if current else 1,
+                    digest=digest,
+                    loaded_at=time.monotonic(),
+                    countries=countries,
+                    cities=cities,
+                    meals=meals,
+                    ingredients=ingredients,
+                    countries_by_id=_by_id(countries),
+                    cities_by_id=_by_id(cities),
+                    cities_by_country=cities_by_country,
+                    meals_by_id=_by_id(meals),
+                    ingredients_by_id=_by_id(ingredients),
+                    ingredients_by_type=_grouped(ingredients, "type"),
+                    country_names=PrefixIndex(countries),
+                    city_names=PrefixIndex(cities),
+                    city_names_by_country=MappingProxyType({
+                        country_id: PrefixIndex(group)
+                        for country_id, group in cities_by_country.items()
+                    }),
+                )
+                log_info(f"Master data cache loaded version {data.version} ({data.content_version})")
+            self._data = data
+            self._history.pop(data.content_version, None)
+            self._history[data.content_version] = data
+            while len(self._history) > HISTORY_SIZE:
+                self._history.popitem(last=False)
+            self.reloads += 1
+            return data
+
+    def reload(self, db: Optional[Session] = None) -> MasterData:
+        """Reload after master data was edited; opens a session when none is given."""
+        if db is not None:
+            return self.load(db)
+        session = SessionLocal()
+        try:
+            return self.load(session)
+        finally:
+            session.close()
+
+    def get(self) -> MasterData:
+        """
+        Return the current snapshot and start a refresh when one is due.
+
+        On the event loop the refresh runs in a worker thread and this call
+        returns the current snapshot; elsewhere (threadpool routes, scripts)
+        it refreshes in place. Only the first load, when startup could not
+        load the snapshot, runs on the caller's thread regardless.
+        """
+        data = self._data
+        if data is None:
+            return self.reload()
+        now = time.monotonic()
+        due = self.refresh_seconds > 0 and now - data.loaded_at >= self.refresh_seconds and now >= self._retry_at
+        # One refresh at a time; everyone else keeps the current snapshot
+        if not due or not self._refreshing.acquire(blocking=False):
+            return data
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._refresh()
+            return self._data
+        self._refresh_task = loop.run_in_executor(None, self._refresh)
+        return data
+
+    async def reload_async(self, db: Optional[Session] = None) -> MasterData:
+        """``reload`` in a worker thread, for callers on the event loop."""
+        return await asyncio.to_thread(self.reload, db)
+
+    def _refresh(self) -> None:
+        """Reload for a due refresh; the caller holds ``_refreshing``."""
+        try:
+            self.reload()
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.refresh_seconds
+            log_error(f"Error refreshing master data cache: {str(e)}")
+        finally:
+            self._refreshing.release()
+
+    def get_version(self, content_version: str) -> Optional[MasterData]:
+        """Return a recent snapshot by content version, if this worker still has it."""
+        return self._history.get(content_version)
+
+    def stats(self) -> dict:
+        """Return cache counters for monitoring."""
+        data = self._data
+        return {
+            "loaded": data is not None,
+            "version": data.version if data else None,
+            "content_version": data.content_version if data else None,
+            "reloads": self.reloads,
+            "refreshing": self._refreshing.locked(),
+            "encoded_bodies": len(data._bodies) if data else 0,
+        }
+
+
+master_cache = MasterDataCache(
+    refresh_seconds=float(os.getenv("MASTER_CACHE_REFRESH_SECONDS", "300")),
+)
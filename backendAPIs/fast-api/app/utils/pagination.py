@@ -0,0 +1,193 @@
+"""Pagination helpers.
+
+Keyset (cursor) pagination pages through rows by a monotonically increasing
+id instead of OFFSET, so each page is an index range scan no matter how deep
+the client has scrolled. Pages are returned newest-first.
+
+Offset pagination (``paginate``) is kept for lists that need page numbers;
+there the separate COUNT query is optional, see ``CountMode``.
+"""
+import base64
+import enum
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("PAGINATION_COUNT_CACHE_SECONDS", "60"))
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+
+def _scans_forward(before_id: Optional[int], after_id: Optional[int]) -> bool:
+    """Only an after_id-only page reads the index upwards, starting at after_id."""
+    return after_id is not None and before_id is None
+
+
+def apply_keyset(statement, id_column, limit: int, before_id: Optional[int] = None, after_id: Optional[int] = None):
+    """Restrict a query or select to one keyset page.
+
+    Fetches ``limit + 1`` rows so ``keyset_page`` can tell whether more exist.
+
+    Args:
+        statement: ORM Query or Select to page through
+        id_column: Monotonic id column to page by
+        limit: Page size
+        before_id: Only rows older than this id
+        after_id: Only rows newer than this id
+
+    Returns:
+        The filtered, ordered and limited statement
+    """
+    if before_id is not None:
+        statement = statement.filter(id_column < before_id)
+    if after_id is not None:
+        statement = statement.filter(id_column > after_id)
+
+    order = id_column.asc() if _scans_forward(before_id, after_id) else id_column.desc()
+    return statement.order_by(order).limit(limit + 1)
+
+
+def keyset_page(
+    rows: List,
+    limit: int,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None
+) -> Tuple[List, bool]:
+    """Turn the rows of an ``apply_keyset`` statement into a newest-first page.
+
+    Returns:
+        Tuple of (rows newest-first, has_more). ``has_more`` means older rows
+        exist, or newer ones when paging forward with only ``after_id``.
+    """
+    has_more = len(rows) > limit
+    rows = list(rows[:limit])
+    if _scans_forward(before_id, after_id):
+        rows.reverse()
+    return rows, has_more
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the last id of a page as an opaque cursor string."""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = json.loads(payload)["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(last_id, int):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+
+class CountMode(str, enum.Enum):
+    """How ``paginate`` reports the total number of rows."""
+
+    EXACT = "exact"        # COUNT(*) over the filtered query
+    ESTIMATE = "estimate"  # planner estimate (Postgres) or a cached count
+    NONE = "none"          # no total, only has_more
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a select, for planner row estimates."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+_count_cache: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+
+def _planner_estimate(query) -> int:
+    """Row estimate of the query's top plan node on Postgres."""
+    plan = query.session.execute(_Explain(query.statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _cached_count(query) -> int:
+    """Exact count, reused for COUNT_CACHE_TTL_SECONDS per distinct query."""
+    compiled = query.statement.compile(dialect=query.session.get_bind().dialect)
+    key = f"{compiled}|{sorted(compiled.params.items(), key=lambda item: item[0])!r}"
+    now = time.monotonic()
+
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+        if cached and now - cached[0] < COUNT_CACHE_TTL_SECONDS:
+            _count_cache.move_to_end(key)
+            return cached[1]
+
+    total = query.count()
+    with _count_cache_lock:
+        _count_cache[key] = (now, total)
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.popitem(last=False)
+    return total
+
+
+def estimate_count(query) -> int:
+    """Estimate how many rows an ORM query returns without counting them on Postgres."""
+    query = query.enable_eagerloads(False).order_by(None)
+    if query.session.get_bind().dialect.name == "postgresql":
+        return _planner_estimate(query)
+    return _cached_count(query)
+
+
+def paginate(query, skip: int, limit: int, count_mode: CountMode = CountMode.EXACT) -> Tuple[List, dict]:
+    """
+    Fetch one offset page of an ORM query.
+
+    Reads ``limit + 1`` rows to tell whether another page exists. The total
+    is computed according to ``count_mode``; when the page is the last one
+    it is known from the rows already fetched, so no count query runs.
+
+    Args:
+        query: Ordered ORM query
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        count_mode: How to compute the total
+
+    Returns:
+        Tuple of (rows, pagination info with total, has_more, skip and limit);
+        total is None for CountMode.NONE
+    """
+    rows = query.offset(skip).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if count_mode == CountMode.NONE:
+        total = None
+    elif not has_more and (rows or skip == 0):
+        total = skip + len(rows)
+    elif count_mode == CountMode.ESTIMATE:
+        # Never report fewer rows than this page shows exist
+        seen = skip + len(rows) + int(has_more) if rows else 0
+        total = max(estimate_count(query), seen)
+    else:
+        total = query.order_by(None).count()
+
+    return rows, {"total": total, "has_more": has_more, "skip": skip, "limit": limit}
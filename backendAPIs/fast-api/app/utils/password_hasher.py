@@ -0,0 +1,139 @@
+"""Bounded worker pool for bcrypt password hashing.
+
+bcrypt is deliberately slow, and calling it inside an ``async def`` handler
+blocks the event loop for every other request on the worker. This module runs
+hashing and verification on a dedicated thread pool (bcrypt releases the GIL
+while it works) and applies backpressure: once ``max_pending`` operations are
+queued or running, new ones are rejected with 503 instead of piling up.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import bcrypt
+from fastapi import HTTPException, status
+
+
+def bcrypt_hash(password: str) -> str:
+    """Hash a password using bcrypt."""
+    salt = bcrypt.gensalt()
+    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+
+def bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash."""
+    return bcrypt.checkpw(
+        plain_password.encode('utf-8'),
+        hashed_password.encode('utf-8')
+    )
+
+
+class PasswordHasher:
+    """Run bcrypt operations on a size-limited thread pool."""
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64, retry_after_seconds: int = 1):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after_seconds = retry_after_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._durations = deque(maxlen=1024)
+        self._waits = deque(maxlen=1024)
+        self.completed = 0
+        self.rejected = 0
+
+    async def hash(self, password: str) -> str:
+        """Hash a password on the pool."""
+        return await self._submit(bcrypt_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash on the pool."""
+        return await self._submit(bcrypt_verify, plain_password, hashed_password)
+
+    async def _submit(self, func: Callable, *args):
+        """Queue a bcrypt call, rejecting it when the pool is saturated."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy. Please try again later.",
+                    headers={"Retry-After": str(self.retry_after_seconds)}
+                )
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="bcrypt"
+                )
+            executor = self._executor
+
+        queued_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self._run, func, args, queued_at)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _run(self, func: Callable, args: tuple, queued_at: float):
+        """Execute a bcrypt call on a worker thread and record its timings."""
+        started_at = time.perf_counter()
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+                self._waits.append(started_at - queued_at)
+                self._durations.append(finished_at - started_at)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, waiting for in-flight work."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """Return pool counters and latency percentiles for monitoring."""
+        with self._lock:
+            durations = sorted(self._durations)
+            waits = sorted(self._waits)
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "running": self._running,
+                "queue_depth": max(self._pending - self._running, 0),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "hash_ms_p50": _percentile_ms(durations, 0.50),
+                "hash_ms_p95": _percentile_ms(durations, 0.95),
+                "hash_ms_max": _percentile_ms(durations, 1.0),
+                "queue_wait_ms_p95": _percentile_ms(waits, 0.95),
+            }
+
+
+def _percentile_ms(sorted_values: list, fraction: float) -> float:
+    """Return a percentile of sorted second values in milliseconds."""
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return round(sorted_values[index] * 1000, 2)
+
+
+password_hasher = PasswordHasher(
+    max_workers=int(os.getenv("BCRYPT_POOL_SIZE", "4")),
+    max_pending=int(os.getenv("BCRYPT_MAX_PENDING", "64")),
+)
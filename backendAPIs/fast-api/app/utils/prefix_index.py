@@ -0,0 +1,64 @@
+"""Sorted-array prefix index for autocomplete over master data names.
+
+Names are accent-folded and case-folded ("São Paulo" -> "sao paulo") and
+kept in sorted arrays, so a prefix lookup is a binary search followed by a
+scan of at most ``limit`` matches. Matches on the start of the name rank
+before matches on the start of a later word ("paulo" -> "São Paulo").
+"""
+import unicodedata
+from bisect import bisect_left
+from typing import Iterable, List, Tuple
+
+
+def fold(text: str) -> str:
+    """Strip accents, case-fold and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+class PrefixIndex:
+    """Immutable prefix index over rows with a ``name``."""
+
+    def __init__(self, rows: Iterable[dict]):
+        names: List[Tuple[str, int]] = []
+        words: List[Tuple[str, int]] = []
+        self._rows: List[dict] = []
+        for position, row in enumerate(rows):
+            self._rows.append(row)
+            folded = fold(row["name"])
+            names.append((folded, position))
+            # Later words, keeping the rest of the name: "paulo" in "sao paulo"
+            offset = folded.find(" ")
+            while offset != -1:
+                words.append((folded[offset + 1:], position))
+                offset = folded.find(" ", offset + 1)
+        names.sort()
+        words.sort()
+        self._name_keys = [key for key, _ in names]
+        self._name_rows = [position for _, position in names]
+        self._word_keys = [key for key, _ in words]
+        self._word_rows = [position for _, position in words]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        """Return up to ``limit`` rows whose name or a word in it starts with ``query``."""
+        prefix = fold(query)
+        if not prefix or limit <= 0:
+            return []
+
+        seen = set()
+        results: List[dict] = []
+        for keys, positions in ((self._name_keys, self._name_rows), (self._word_keys, self._word_rows)):
+            index = bisect_left(keys, prefix)
+            while index < len(keys) and keys[index].startswith(prefix):
+                position = positions[index]
+                if position not in seen:
+                    seen.add(position)
+                    results.append(self._rows[position])
+                    if len(results) == limit:
+                        return results
+                index += 1
+        return results
@@ -0,0 +1,148 @@
+"""In-memory cache of verified authentication principals.
+
+The auth middleware validates every bearer token against the database. This
+module keeps the result of a successful validation in a bounded LRU cache with
+a TTL, keyed by a fingerprint of the token, so repeated requests with the same
+token skip the database entirely.
+
+Entries are invalidated explicitly whenever a user's authentication state
+changes (logout, deactivation, creator status changes). The cache is local to
+the worker process, so the TTL bounds how long another worker may keep serving
+a stale principal.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+
+class PrincipalCache:
+    """Bounded TTL/LRU cache of validated token principals."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._user_index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def fingerprint(token: str) -> str:
+        """Return a stable fingerprint for a token so raw tokens are never stored."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Return the cached principal for a token, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        key = self.fingerprint(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, principal = entry
+            if now >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def set(self, token: str, principal: dict, expires_at: Optional[float] = None) -> None:
+        """Cache a principal for a token.
+
+        Args:
+            token: Raw bearer token
+            principal: Validated auth data attached to the request state
+            expires_at: Optional epoch timestamp after which the token is no
+                longer valid; the entry never outlives it
+        """
+        if not self.enabled:
+            return
+
+        key = self.fingerprint(token)
+        entry_expires_at = time.time() + self.ttl_seconds
+        if expires_at is not None:
+            entry_expires_at = min(entry_expires_at, expires_at)
+
+        user_id = str(principal.get("user_id"))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (entry_expires_at, principal)
+            self._user_index.setdefault(user_id, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Drop every cached principal belonging to a user.
+
+        Returns:
+            Number of cache entries removed
+        """
+        with self._lock:
+            keys = self._user_index.pop(str(user_id), set())
+            for key in keys:
+                self._entries.pop(key, None)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all cached principals."""
+        with self._lock:
+            self._entries.clear()
+            self._user_index.clear()
+
+    def stats(self) -> dict:
+        """Return cache counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove a key from the entries and the user index. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = str(entry[1].get("user_id"))
+        keys = self._user_index.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._user_index[user_id]
+
+
+principal_cache = PrincipalCache(
+    max_entries=int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000")),
+    ttl_seconds=float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60")),
+)
@@ -0,0 +1,53 @@
+"""Read cursors for support (admin) conversations.
+
+Instead of flagging every message as read, each side of a conversation keeps
+the id of the last message it has read; anything after it is unread. Marking
+a conversation read is then a single-row upsert.
+"""
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import upsert_insert
+from app.models.admin_conversation import AdminConversation
+from app.models.admin_message import AdminMessage, AdminMessageSender
+
+READER_COLUMNS = {
+    AdminMessageSender.User: "user_last_read_message_id",
+    AdminMessageSender.Admin: "admin_last_read_message_id",
+}
+
+
+def advance_admin_read_cursor(
+    db: Session,
+    user_id: str,
+    reader: AdminMessageSender,
+    message_id: Optional[int] = None
+) -> None:
+    """
+    Move one side's read cursor forward, never back.
+
+    The row is only rewritten when the cursor actually moves.
+
+    Args:
+        db: Database session (the caller commits)
+        user_id: User whose support conversation is read
+        reader: Side that read the messages (the user or the admins)
+        message_id: Read up to this message (default: the latest message)
+    """
+    column = READER_COLUMNS[reader]
+    if message_id is None:
+        message_id = select(func.max(AdminMessage.id)).where(
+            AdminMessage.user_id == user_id
+        ).scalar_subquery()
+
+    insert = upsert_insert(db)
+    upsert = insert(AdminConversation).values(user_id=user_id, **{column: message_id})
+    current = getattr(AdminConversation, column)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[AdminConversation.user_id],
+        set_={column: upsert.excluded[column], "updated_at": func.now()},
+        where=upsert.excluded[column] > func.coalesce(current, 0)
+    )
+    db.execute(upsert)
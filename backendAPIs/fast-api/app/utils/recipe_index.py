@@ -0,0 +1,259 @@
+"""In-memory inverted index from ingredient names to approved posts.
+
+Each indexed post is given a dense slot number, and each ingredient maps to a
+bitset (a Python int) with the slot bit set for every approved post using
+it. Slots freed by removed posts are reused lowest first, so bitsets are as
+wide as the live index rather than the highest post id. Matching a pantry of ``k`` ingredients adds
+those ``k`` bitsets into bit-sliced counters, so the number of matched
+ingredients for every post is known after ``O(k log k)`` whole-bitset
+operations instead of a pass over the posts per ingredient.
+
+The index is local to the worker process. It is loaded on first use and
+updated in place when this worker approves or removes posts. Every
+``RECIPE_INDEX_REFRESH_SECONDS`` it is synced with the set of approved post
+ids in the database: posts that are no longer approved (rejected, deleted or
+removed with their author) are dropped and unseen approved posts are loaded.
+Comparing id sets instead of following a timestamp watermark picks up
+approvals whatever order their transactions commit in.
+"""
+import heapq
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.utils.ingredient_matcher import entry_name, normalize_ingredient_name
+
+
+def post_ingredient_names(ingredients) -> Set[str]:
+    """Normalized names of a post's ``ingredients`` JSON."""
+    names = set()
+    for ingredient in ingredients or ():
+        name = entry_name(ingredient)
+        name = normalize_ingredient_name(name) if name else None
+        if name:
+            names.add(name)
+    return names
+
+
+# Ids per ingredient query when loading posts the index has not seen
+LOAD_BATCH_SIZE = 1000
+
+
+def _bit_positions(bits: int) -> List[int]:
+    """Positions of the set bits of an int, lowest first."""
+    return [position for position, bit in enumerate(bin(bits)[:1:-1]) if bit == "1"]
+
+
+class RecipeIndex:
+    """Ingredient to approved-post bitsets with coverage ranking."""
+
+    def __init__(self, refresh_seconds: float = 30.0):
+        self.refresh_seconds = refresh_seconds
+        self._postings: Dict[str, int] = {}
+        self._post_names: Dict[int, Set[str]] = {}
+        # Bit positions: post id -> slot, slot -> post id (None when free)
+        self._slots: Dict[int, int] = {}
+        self._slot_posts: List[Optional[int]] = []
+        self._free_slots: List[int] = []
+        # Every indexed post id, including posts without usable ingredients
+        self._post_ids: Set[int] = set()
+        # Posts this worker approved, by time, so a sync that read the database
+        # before their commit does not drop them again
+        self._added_at: Dict[int, float] = {}
+        self._loaded = False
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.syncs = 0
+        self.removed = 0
+        self.queries = 0
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Load the index on first use and sync it with the database periodically."""
+        if self._loaded and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+
+        started = time.monotonic()
+        approved = CreatorPost.status == CreatorPostStatus.APPROVED
+        if not self._loaded:
+            rows = db.query(CreatorPost.id, CreatorPost.ingredients).filter(approved).all()
+            with self._lock:
+                self._postings.clear()
+                self._post_names.clear()
+                self._post_ids.clear()
+                self._slots.clear()
+                self._slot_posts.clear()
+                self._free_slots.clear()
+                for post_id, ingredients in rows:
+                    self._add(post_id, post_ingredient_names(ingredients))
+                self._loaded = True
+                self._refreshed_at = time.monotonic()
+                self.loads += 1
+            return
+
+        approved_ids = {post_id for (post_id,) in db.query(CreatorPost.id).filter(approved)}
+        with self._lock:
+            added_since = {post_id for post_id, added_at in self._added_at.items() if added_at >= started}
+            stale = self._post_ids - approved_ids - added_since
+            unseen = sorted(approved_ids - self._post_ids)
+
+        rows = []
+        for start in range(0, len(unseen), LOAD_BATCH_SIZE):
+            rows.extend(db.query(CreatorPost.id, CreatorPost.ingredients).filter(
+                CreatorPost.id.in_(unseen[start:start + LOAD_BATCH_SIZE]), approved
+            ))
+
+        with self._lock:
+            for post_id in stale:
+                self._remove(post_id)
+            for post_id, ingredients in rows:
+                self._add(post_id, post_ingredient_names(ingredients))
+            self._added_at = {post_id: added_at for post_id, added_at in self._added_at.items() if added_at >= started}
+            self._refreshed_at = time.monotonic()
+            self.syncs += 1
+            self.removed += len(stale)
+
+    def add_post(self, post: CreatorPost) -> None:
+        """Index (or re-index) an approved post."""
+        with self._lock:
+            if self._loaded:
+                self._add(post.id, post_ingredient_names(post.ingredients))
+                self._added_at[post.id] = time.monotonic()
+
+    def remove_posts(self, post_ids: Iterable[int]) -> None:
+        """Drop posts that are no longer approved or no longer exist."""
+        with self._lock:
+            for post_id in post_ids:
+                if post_id in self._post_ids:
+                    self._remove(post_id)
+                    self.removed += 1
+                self._added_at.pop(post_id, None)
+
+    def match(
+        self,
+        names: Iterable[str],
+        limit: int,
+        skip: int = 0
+    ) -> Tuple[List[dict], int]:
+        """
+        Rank posts by how much of each recipe the given ingredients cover.
+
+        Posts are ordered by coverage (matched / recipe ingredients), then by
+        fewest missing ingredients, then newest first.
+
+        Args:
+            names: Ingredient names the user has
+            limit: Maximum number of matches to return
+            skip: Number of matches to skip
+
+        Returns:
+            Tuple of (matches with post_id, matched, missing and coverage,
+            total number of posts sharing at least one ingredient)
+        """
+        wanted = {normalize_ingredient_name(name) for name in names}
+        wanted.discard("")
+
+        with self._lock:
+            self.queries += 1
+            bitsets = [self._postings[name] for name in wanted if name in self._postings]
+
+            # Bit-sliced counters: planes[i] holds bit i of each post's match count
+            planes: List[int] = []
+            for bits in bitsets:
+                carry = bits
+                for i, plane in enumerate(planes):
+                    planes[i], carry = plane ^ carry, plane & carry
+                    if not carry:
+                        break
+                if carry:
+                    planes.append(carry)
+
+            candidates = 0
+            for bits in bitsets:
+                candidates |= bits
+
+            matches = []
+            # No post matched more than the planes can count
+            for matched in range(min(len(bitsets), (1 << len(planes)) - 1), 0, -1):
+                with_count = candidates
+                for i, plane in enumerate(planes):
+                    with_count &= plane if matched >> i & 1 else ~plane
+                if not with_count:
+                    continue
+                for slot in _bit_positions(with_count):
+                    post_id = self._slot_posts[slot]
+                    size = len(self._post_names[post_id])
+                    matches.append((matched, size, post_id))
+
+        ranked = heapq.nsmallest(
+            skip + limit,
+            matches,
+            key=lambda match: (-match[0] / match[1], match[1] - match[0], -match[2])
+        )[skip:]
+        return [
+            {
+                "post_id": post_id,
+                "matched": matched,
+                "missing": size - matched,
+                "coverage": round(matched / size, 4),
+            }
+            for matched, size, post_id in ranked
+        ], len(matches)
+
+    def stats(self) -> dict:
+        """Return index counters for monitoring."""
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "posts": len(self._post_ids),
+                "ingredients": len(self._postings),
+                "slots": len(self._slot_posts),
+                "loads": self.loads,
+                "syncs": self.syncs,
+                "removed": self.removed,
+                "queries": self.queries,
+            }
+
+    def _add(self, post_id: int, names: Set[str]) -> None:
+        """Set a post's bits. Caller holds the lock."""
+        self._remove(post_id)
+        self._post_ids.add(post_id)
+        if not names:
+            return
+        if self._free_slots:
+            slot = heapq.heappop(self._free_slots)
+            self._slot_posts[slot] = post_id
+        else:
+            slot = len(self._slot_posts)
+            self._slot_posts.append(post_id)
+        self._slots[post_id] = slot
+        bit = 1 << slot
+        for name in names:
+            self._postings[name] = self._postings.get(name, 0) | bit
+        self._post_names[post_id] = names
+
+    def _remove(self, post_id: int) -> None:
+        """Clear a post's bits. Caller holds the lock."""
+        self._post_ids.discard(post_id)
+        names = self._post_names.pop(post_id, None)
+        if not names:
+            return
+        slot = self._slots.pop(post_id)
+        self._slot_posts[slot] = None
+        heapq.heappush(self._free_slots, slot)
+        mask = ~(1 << slot)
+        for name in names:
+            bits = self._postings[name] & mask
+            if bits:
+                self._postings[name] = bits
+            else:
+                del self._postings[name]
+
+
+recipe_index = RecipeIndex(
+    refresh_seconds=float(os.getenv("RECIPE_INDEX_REFRESH_SECONDS", "30")),
+)
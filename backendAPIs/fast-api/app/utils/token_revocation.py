@@ -0,0 +1,198 @@
+"""Token revocation list for stateless JWT validation.
+
+In stateless mode the auth middleware trusts the signed claims of an access
+token and only consults an in-memory revocation list. Revocations are written
+to the small ``token_revocations`` table by logout and admin actions; every
+worker applies its own writes immediately and picks up the others by
+incrementally reading rows past the last seen id. Ids are allocated before
+commit, so a row can become visible after a higher id was already read; each
+refresh therefore also re-reads the rows created in a short overlap window.
+
+A revocation either targets a single token (``jti``) or every token of a user
+or admin issued below a minimum ``token_version``. Rows only need to live as
+long as the principal's longest access token, so expired rows are purged as
+new ones are written.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Tuple, Union
+
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.admin import Admin
+from app.models.token_revocation import TokenRevocation
+from app.models.user import User
+from app.utils.jwt_utils import access_token_lifetime, admin_access_token_lifetime
+
+
+class RevocationList:
+    """In-memory view of the token revocation table."""
+
+    def __init__(self, refresh_interval_seconds: float = 5.0, overlap_seconds: float = 60.0):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.overlap_seconds = overlap_seconds
+        self._min_versions: Dict[str, Tuple[int, float]] = {}
+        self._revoked_jtis: Dict[str, float] = {}
+        self._cursor = 0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self.refreshes = 0
+        self.rejections = 0
+
+    def is_revoked(self, claims: dict) -> bool:
+        """Check whether a decoded access token has been revoked."""
+        now = time.time()
+        with self._lock:
+            jti = claims.get("jti")
+            if jti:
+                jti_expires_at = self._revoked_jtis.get(jti)
+                if jti_expires_at is not None and jti_expires_at > now:
+                    self.rejections += 1
+                    return True
+
+            entry = self._min_versions.get(str(claims.get("sub")))
+            if entry is not None:
+                min_version, expires_at = entry
+                if expires_at > now and int(claims.get("ver", 0)) < min_version:
+                    self.rejections += 1
+                    return True
+
+        return False
+
+    def apply(self, revocation: TokenRevocation) -> None:
+        """Apply a single revocation row to the in-memory list."""
+        expires_at = revocation.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        expires_ts = expires_at.timestamp()
+
+        with self._lock:
+            if revocation.jti:
+                self._revoked_jtis[revocation.jti] = max(
+                    expires_ts, self._revoked_jtis.get(revocation.jti, 0.0)
+                )
+            if revocation.token_version is not None:
+                current = self._min_versions.get(revocation.user_id)
+                if current is None or revocation.token_version >= current[0]:
+                    self._min_versions[revocation.user_id] = (revocation.token_version, expires_ts)
+
+    def refresh(self, db: Session) -> int:
+        """Load revocations written since the last refresh.
+
+        Rows past the last seen id are read together with every row created
+        within ``overlap_seconds``, which covers rows whose transaction
+        committed after a higher id had been read. Applying a row twice is
+        harmless.
+
+        Returns:
+            Number of revocation rows applied
+        """
+        with self._lock:
+            cursor = self._cursor
+
+        now = datetime.now(timezone.utc)
+        rows = (
+            db.query(TokenRevocation)
+            .filter(
+                or_(
+                    TokenRevocation.id > cursor,
+                    TokenRevocation.created_at >= now - timedelta(seconds=self.overlap_seconds)
+                ),
+                TokenRevocation.expires_at > now
+            )
+            .order_by(TokenRevocation.id)
+            .all()
+        )
+
+        for row in rows:
+            self.apply(row)
+
+        now = time.time()
+        with self._lock:
+            if rows:
+                self._cursor = max(self._cursor, rows[-1].id)
+            self._last_refresh = now
+            self.refreshes += 1
+            self._prune(now)
+
+        return len(rows)
+
+    async def refresh_if_stale(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Refresh from the database when the refresh interval has elapsed.
+
+        The attempt time is recorded up front so a failing database is not
+        queried again on every request.
+        """
+        now = time.time()
+        with self._lock:
+            if now - self._last_refresh < self.refresh_interval_seconds:
+                return
+            self._last_refresh = now
+
+        async with session_factory() as db:
+            await db.run_sync(self.refresh)
+
+    def stats(self) -> dict:
+        """Return revocation list counters for monitoring."""
+        with self._lock:
+            return {
+                "revoked_users": len(self._min_versions),
+                "revoked_tokens": len(self._revoked_jtis),
+                "cursor": self._cursor,
+                "refreshes": self.refreshes,
+                "rejections": self.rejections,
+            }
+
+    def _prune(self, now: float) -> None:
+        """Drop entries whose tokens have all expired. Caller holds the lock."""
+        self._min_versions = {
+            user_id: entry for user_id, entry in self._min_versions.items() if entry[1] > now
+        }
+        self._revoked_jtis = {
+            jti: expires_at for jti, expires_at in self._revoked_jtis.items() if expires_at > now
+        }
+
+
+def revoke_principal_tokens(db: Session, principal: Union[User, Admin]) -> TokenRevocation:
+    """Revoke every access token issued to a user or admin so far.
+
+    Bumps the principal's token version and records a revocation row that
+    lives as long as the principal's access tokens can (admin tokens outlive
+    user tokens). The caller commits the session and then applies the
+    returned row to ``revocation_list`` so this worker enforces it
+    immediately.
+
+    Args:
+        db: Database session
+        principal: User or admin whose tokens are revoked
+
+    Returns:
+        The pending TokenRevocation row
+    """
+    now = datetime.now(timezone.utc)
+    lifetime = admin_access_token_lifetime() if isinstance(principal, Admin) else access_token_lifetime()
+
+    db.query(TokenRevocation).filter(
+        TokenRevocation.expires_at < now
+    ).delete(synchronize_session=False)
+
+    principal.token_version = (principal.token_version or 0) + 1
+    revocation = TokenRevocation(
+        user_id=principal.id,
+        token_version=principal.token_version,
+        expires_at=now + lifetime,
+        # Same clock as the refresh overlap window
+        created_at=now
+    )
+    db.add(revocation)
+    return revocation
+
+
+revocation_list = RevocationList(
+    refresh_interval_seconds=float(os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", "5")),
+    overlap_seconds=float(os.getenv("AUTH_REVOCATION_OVERLAP_SECONDS", "60")),
+)
@@ -0,0 +1,234 @@
+"""HTTP load benchmark for the hot endpoints.
+
+Drives concurrent authenticated traffic at the feed, conversations, dashboard
+meals, sign-in and master data routes and reports, per scenario, RPS,
+p50/p95/p99 latency and database queries per request (read from the
+``Server-Timing`` header the query stats middleware adds) as JSON, so runs
+can be compared between commits.
+
+The app runs in-process through httpx's ASGI transport by default, against
+the database in DATABASE_URL; pass --base-url to load a running server
+(e.g. ``uvicorn app.main:app --workers 4``) instead. Either way the database
+should be seeded first with ``python -m app.scripts.seed_data``, whose users
+(``user<N>@seed.example.com``) the benchmark signs in as.
+
+Usage:
+    python -m benchmarks.http_load [--concurrency 32] [--duration 10] [--output run.json]
+    python -m benchmarks.http_load --base-url http://127.0.0.1:8000 --scenarios feed,signin
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+SEED_DOMAIN = "seed.example.com"
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+class SignedInUser:
+    """A signed-in seeded user."""
+
+    def __init__(self, email: str, headers: Dict[str, str]):
+        self.email = email
+        self.headers = headers
+
+
+def _feed(client: httpx.AsyncClient, user: SignedInUser, rng: random.Random, args):
+    return client.get("/api/v1/users/posts/feed", params={"limit": 10}, headers=user.headers)
+
+
+def _conversations(client: httpx.AsyncClient, user: SignedInUser, rng: random.Random, args):
+    return client.get("/api/v1/users/messages/conversations", headers=user.headers)
+
+
+def _dashboard(client: httpx.AsyncClient, user: SignedInUser, rng: random.Random, args):
+    day = date.fromordinal(args.end_date.toordinal() - rng.randint(1, 30))
+    return client.post("/api/v1/users/dashboard/meals", json={"date": day.isoformat()}, headers=user.headers)
+
+
+def _signin(client: httpx.AsyncClient, user: SignedInUser, rng: random.Random, args):
+    return client.post("/auth/signin", json={"email": user.email, "password": args.password})
+
+
+MASTER_PATHS = (
+    "/api/v1/master/countries?limit=100",
+    "/api/v1/master/cities?limit=100",
+    "/api/v1/master/meals?limit=100",
+    "/api/v1/master/ingredients?limit=100",
+    "/api/v1/master/cities/search?q=sa",
+    "/api/v1/master/bundle",
+)
+
+
+def _master(client: httpx.AsyncClient, user: SignedInUser, rng: random.Random, args):
+    return client.get(rng.choice(MASTER_PATHS), headers=user.headers)
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "feed": _feed,
+    "conversations": _conversations,
+    "dashboard": _dashboard,
+    "signin": _signin,
+    "master": _master,
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def sign_in(client: httpx.AsyncClient, users: int, password: str) -> List[SignedInUser]:
+    """Sign in the first ``users`` seeded users."""
+    signed_in = []
+    for i in range(users):
+        email = f"user{i}@{SEED_DOMAIN}"
+        response = await client.post("/auth/signin", json={"email": email, "password": password})
+        if response.status_code != 200:
+            raise SystemExit(f"Sign-in failed for {email} ({response.status_code}); seed the database first")
+        token = response.json()["data"]["access_token"]
+        signed_in.append(SignedInUser(email, {"Authorization": f"Bearer {token}"}))
+    return signed_in
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    signed_in: List[SignedInUser],
+    args: argparse.Namespace
+) -> dict:
+    """Run one scenario with ``args.concurrency`` workers for ``args.duration`` seconds."""
+    request = SCENARIOS[name]
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors: Dict[str, int] = {}
+
+    async def worker(number: int) -> None:
+        rng = random.Random(f"{args.seed}-{name}-{number}")
+        while time.perf_counter() < deadline:
+            user = rng.choice(signed_in)
+            started = time.perf_counter()
+            try:
+                response = await request(client, user, rng, args)
+            except httpx.HTTPError as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+            match = _QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    # Warm-up: caches, connection pools, master data snapshot
+    deadline = time.perf_counter() + args.warmup
+    await asyncio.gather(*(worker(number) for number in range(args.concurrency)))
+    latencies.clear()
+    queries.clear()
+    errors.clear()
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(worker(number) for number in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round((latencies[-1] if latencies else 0.0) * 1000, 2),
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def _commit() -> Optional[str]:
+    """The checked-out commit, if this is a git checkout."""
+    with contextlib.suppress(OSError, subprocess.CalledProcessError):
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    return None
+
+
+@contextlib.asynccontextmanager
+async def open_client(base_url: Optional[str], concurrency: int):
+    """An HTTP client for a running server, or for the app in-process."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if base_url:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            yield client
+        return
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=30) as client:
+            yield client
+
+
+async def run(args: argparse.Namespace) -> dict:
+    async with open_client(args.base_url, args.concurrency) as client:
+        signed_in = await sign_in(client, args.users, args.password)
+        results = {}
+        for name in args.scenarios:
+            results[name] = await run_scenario(client, name, signed_in, args)
+            print(f"{name}: {results[name]}", file=sys.stderr)
+
+    return {
+        "commit": _commit(),
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mode": "server" if args.base_url else "in-process",
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "users": args.users,
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="Load a running server instead of the app in-process")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent requests")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2, help="Warm-up seconds per scenario")
+    parser.add_argument("--users", type=int, default=50, help="Seeded users to sign in as")
+    parser.add_argument("--password", default="password123", help="Password of the seeded users")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(), help="End date the data was seeded with")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for request parameters")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Per-row cost of serving a master data list page at limit=1000.
+
+Compares the old per-request path (load ORM objects, ``model_validate`` and
+``model_dump`` each row, encode with stdlib json) with the master cache:
+building its row dicts from column tuples through one cached TypeAdapter,
+encoding a page on a cache miss and returning the memoized body on a hit.
+Runs against an in-memory SQLite database (the app modules still expect
+DATABASE_URL to be set, as in .env).
+
+Usage:
+    python -m benchmarks.master_rows [--rows 1000] [--repeat 20]
+"""
+import argparse
+import time
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config.response_helper import ResponseHelper
+from app.models.base import Base
+from app.models.city import City
+from app.models.country import Country
+from app.models.ingredient import Ingredient, IngredientType
+from app.models.meal import Meal
+from app.schemas.masterSchema import CityResponse, IngredientResponse
+from app.utils.master_cache import MasterDataCache, _rows
+
+TYPES = list(IngredientType)
+
+
+def seed(db, rows: int) -> None:
+    country = Country(name="India", code="IN", phone_code="+91")
+    db.add(country)
+    db.flush()
+    db.add_all(City(name=f"City {i}", country_id=country.id) for i in range(rows))
+    db.add_all(
+        Ingredient(name=f"Ingredient {i}", type=TYPES[i % len(TYPES)], emoji="🥕")
+        for i in range(rows)
+    )
+    db.commit()
+
+
+def old_page(db, model, schema, limit: int) -> bytes:
+    items = db.query(model).order_by(model.id).limit(limit).all()
+    data = [schema.model_validate(item).model_dump() for item in items]
+    content = {"status_code": 200, "message": "Success", "data": data}
+    return JSONResponse(content=content).body
+
+
+def per_row_us(fn, rows: int, repeat: int, reset=None) -> float:
+    fn()
+    total = 0.0
+    for _ in range(repeat):
+        if reset:
+            reset()
+        started = time.perf_counter()
+        fn()
+        total += time.perf_counter() - started
+    return total / repeat / rows * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per table and page size")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Country.__table__, City.__table__, Meal.__table__, Ingredient.__table__])
+    db = sessionmaker(bind=engine)()
+    seed(db, args.rows)
+    data = MasterDataCache(refresh_seconds=0).load(db)
+
+    print(f"{'table':<14}{'path':<36}{'us/row':>10}")
+    for name, model, schema in (("cities", City, CityResponse), ("ingredients", Ingredient, IngredientResponse)):
+        rows = getattr(data, name)
+        page = (name, 0, args.rows)
+
+        def miss() -> bytes:
+            return ResponseHelper.success_response(data=list(rows[:args.rows])).body
+
+        for path, fn, reset in (
+            ("before: ORM + validate/dump per row", lambda: old_page(db, model, schema, args.rows), db.expunge_all),
+            ("snapshot load: tuples + TypeAdapter", lambda: _rows(db, model, schema), db.expunge_all),
+            ("page, cache miss (orjson)", miss, None),
+            ("page, cache hit", lambda: data.encoded(page, "Success", lambda: rows), None),
+        ):
+            print(f"{name:<14}{path:<36}{per_row_us(fn, args.rows, args.repeat, reset):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
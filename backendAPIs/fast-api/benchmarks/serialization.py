@@ -0,0 +1,154 @@
+"""Serialization throughput of feed and message pages.
+
+Compares building and encoding a page the old way (``.isoformat()`` per
+timestamp, Starlette's stdlib-json ``JSONResponse``) with the current way
+(datetimes passed through, ``ResponseHelper.success_response``, which
+renders with ``FastJSONResponse``). Rows are synthetic
+stand-ins for ORM objects, so only dict building and encoding are timed.
+
+Usage:
+    python -m benchmarks.serialization [--seconds 1.0]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+
+from app.config.response_helper import ResponseHelper
+
+NOW = datetime(2026, 10, 18, 9, 30, tzinfo=timezone.utc)
+
+
+def make_posts(count: int) -> list:
+    author = SimpleNamespace(name="Maria Lopez", profile_pic="https://cdn.example.com/u/42.jpg")
+    return [
+        SimpleNamespace(
+            id=10_000 - i,
+            user_id="5e15658b-e66b-434a-94db-26a875851656",
+            user=author,
+            title="Wood-fired margherita pizza",
+            overview="A classic Neapolitan pizza with San Marzano tomatoes and fresh basil.",
+            cooking_time=45,
+            cuisine_type="Italian",
+            servings=4,
+            image="https://images.example.com/pizza.jpg",
+            ingredients=[
+                {"name": "Pizza dough", "quantity": "1 ball", "unit": "piece"},
+                {"name": "Tomato sauce", "quantity": "1/2 cup", "unit": "cup"},
+                {"name": "Fresh mozzarella", "quantity": "200g", "unit": "grams"},
+                {"name": "Fresh basil leaves", "quantity": "10-12", "unit": "leaves"},
+            ],
+            instructions="<ol><li>Preheat the oven.</li><li>Top and bake.</li></ol>",
+            created_at=NOW - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def make_messages(count: int) -> list:
+    return [
+        SimpleNamespace(
+            id=50_000 - i,
+            sender_id="5e15658b-e66b-434a-94db-26a875851656",
+            receiver_id="f72b518f-a795-45b2-a34d-c0166065962c",
+            content="Thanks for the recipe, the crust came out perfect!",
+            created_at=NOW - timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def feed_page(posts: list, iso: bool) -> dict:
+    return {
+        "posts": [
+            {
+                "id": post.id,
+                "user_id": post.user_id,
+                "user_name": post.user.name,
+                "user_profile_pic": post.user.profile_pic,
+                "title": post.title,
+                "overview": post.overview,
+                "cooking_time": post.cooking_time,
+                "cuisine_type": post.cuisine_type,
+                "servings": post.servings,
+                "image": post.image,
+                "ingredients": post.ingredients,
+                "instructions": post.instructions,
+                "created_at": post.created_at.isoformat() if iso else post.created_at,
+            }
+            for post in posts
+        ],
+        "has_more": True,
+        "next_cursor": "eyJpZCI6OTk5MX0",
+        "limit": len(posts),
+    }
+
+
+def messages_page(messages: list, iso: bool) -> dict:
+    return {
+        "messages": [
+            {
+                "id": message.id,
+                "senderId": message.sender_id,
+                "receiverId": message.receiver_id,
+                "content": message.content,
+                "isRead": True,
+                "createdAt": message.created_at.isoformat() if iso else message.created_at,
+            }
+            for message in messages
+        ],
+        "has_more": True,
+        "limit": len(messages),
+    }
+
+
+def before(build, rows) -> bytes:
+    content = {"status_code": 200, "message": "Success", "data": build(rows, iso=True)}
+    return JSONResponse(content=content).body
+
+
+def after(build, rows, envelope: bool = True) -> bytes:
+    return ResponseHelper.success_response(data=build(rows, iso=False), envelope=envelope).body
+
+
+def measure(fn, seconds: float) -> tuple:
+    """Return (pages per second, MB per second) for fn over about ``seconds``."""
+    size = len(fn())
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(10):
+            fn()
+        count += 10
+    elapsed = time.perf_counter() - started
+    return count / elapsed, count * size / elapsed / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time per measurement")
+    args = parser.parse_args()
+
+    cases = [
+        ("feed, 10 posts", feed_page, make_posts(10)),
+        ("feed, 100 posts", feed_page, make_posts(100)),
+        ("messages, 50", messages_page, make_messages(50)),
+        ("messages, 200", messages_page, make_messages(200)),
+    ]
+    print(f"{'page':<18}{'variant':<22}{'pages/s':>12}{'MB/s':>10}{'speedup':>10}")
+    for name, build, rows in cases:
+        baseline, _ = measure(lambda: before(build, rows), args.seconds)
+        for variant, fn in (
+            ("before (json)", lambda: before(build, rows)),
+            ("after (orjson)", lambda: after(build, rows)),
+            ("after, no envelope", lambda: after(build, rows, envelope=False)),
+        ):
+            pages, megabytes = measure(fn, args.seconds)
+            print(f"{name:<18}{variant:<22}{pages:>12,.0f}{megabytes:>10.1f}{pages / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
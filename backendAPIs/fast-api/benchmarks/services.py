@@ -0,0 +1,260 @@
+"""Service-layer microbenchmarks with stored baselines.
+
+Calls the service classes behind the hot endpoints directly, without HTTP,
+routing or auth in the way, against the database in DATABASE_URL seeded
+with ``python -m app.scripts.seed_data``: a Postgres database migrated with
+alembic, or a SQLite file seeded with ``--create-schema`` (the migrations
+are Postgres-only). Each target runs for at least --min-rounds calls and
+--min-time seconds after a warm-up, and min/median/mean/stddev per call are
+reported in the spirit of pytest-benchmark.
+
+Save a run as a baseline with --save, then check later commits against it
+with --compare: the run fails (exit status 1) when any target's median (or
+the --stat of your choice) is more than --threshold percent slower than in
+the baseline. Baselines are only comparable on the same machine and the
+same seeded data set; the row counts of the data set are stored with the
+baseline and a mismatch is reported. On shared or noisy machines raise
+--threshold or compare --stat min.
+
+``tests/test_service_benchmarks.py`` runs the same targets and comparison
+under pytest on a small data set it seeds into the test database; it is
+skipped unless RUN_BENCHMARKS=1.
+
+Usage:
+    python -m benchmarks.services --save baseline.json
+    python -m benchmarks.services --compare baseline.json [--threshold 10]
+    python -m benchmarks.services --targets feed,conversations --min-time 2
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.models.admin import Admin
+from app.models.admin_message import AdminMessage
+from app.models.creator_post import CreatorPost
+from app.models.follow import Follow
+from app.models.meal_planner import MealPlanner
+from app.models.user import User
+from app.models.user_message import UserMessage
+from app.services.admin.adminMessagesService import AdminMessagesService
+from app.services.masterService import (
+    CityService,
+    CountryService,
+    IngredientService,
+    MasterBundleService,
+    MealService,
+)
+from app.services.users.userDashboardService import UserDashboardService
+from app.services.users.userMessagesService import UserMessagesService
+from app.services.users.userPostService import UserPostService
+from app.utils.master_cache import MasterDataCache
+from benchmarks.http_load import _commit
+
+SEED_DOMAIN = "seed.example.com"
+DATASET_TABLES = (User, Follow, CreatorPost, MealPlanner, UserMessage, AdminMessage)
+
+
+def _busiest(db: Session, column) -> Optional[str]:
+    """The value of ``column`` with the most rows, ties broken by value."""
+    return db.execute(
+        select(column).group_by(column).order_by(func.count().desc(), column).limit(1)
+    ).scalar()
+
+
+def targets(db: Session) -> Dict[str, Callable[[], object]]:
+    """
+    Build the benchmark targets against the seeded data.
+
+    Each user-facing target runs as the seeded user with the most data for
+    it (follows, sent messages, planned meals), so that it measures the
+    heavy end of the workload rather than an empty page.
+
+    Args:
+        db: Database session the services run in
+
+    Returns:
+        Target name to a zero-argument callable
+    """
+    reader = _busiest(db, Follow.following_user_id)
+    sender = _busiest(db, UserMessage.sender_id)
+    planner = _busiest(db, MealPlanner.user_id)
+    admin_id = db.execute(select(Admin.id).where(Admin.email == f"admin@{SEED_DOMAIN}")).scalar()
+    if not (reader and sender and planner and admin_id):
+        raise SystemExit("The database has no seeded data; run python -m app.scripts.seed_data first")
+    planned_day = db.execute(
+        select(func.max(MealPlanner.date)).where(MealPlanner.user_id == planner)
+    ).scalar()
+
+    return {
+        "feed": lambda: UserPostService.get_user_feed(db, reader, limit=10),
+        "conversations": lambda: UserMessagesService.get_conversations(db, sender, limit=20),
+        "calories_intake": lambda: UserDashboardService.get_calories_intake(db, planner, planned_day),
+        "admin_conversations": lambda: AdminMessagesService.get_conversations(db, admin_id),
+        "master_countries": lambda: CountryService.get_all_countries(0, 100),
+        "master_cities": lambda: CityService.get_all_cities(0, 100),
+        "master_city_search": lambda: CityService.search_cities("sa", limit=10),
+        "master_meals": lambda: MealService.get_all_meals(0, 100),
+        "master_ingredients": lambda: IngredientService.get_all_ingredients(0, 100),
+        "master_bundle": lambda: MasterBundleService.get_bundle(),
+        "master_snapshot_load": lambda: MasterDataCache(refresh_seconds=0).load(db),
+    }
+
+
+def dataset(db: Session) -> Dict[str, int]:
+    """Row counts of the tables the targets read."""
+    return {
+        model.__tablename__: db.execute(select(func.count()).select_from(model)).scalar()
+        for model in DATASET_TABLES
+    }
+
+
+def measure(db: Session, target: Callable[[], object], min_rounds: int, min_time: float, warmup: int) -> dict:
+    """
+    Time one target call by call.
+
+    Only the call itself is timed; the session is cleared between calls so
+    every round loads its rows afresh instead of hitting the identity map.
+
+    Args:
+        db: Database session the target runs in
+        target: Zero-argument callable to time
+        min_rounds: Minimum number of timed calls
+        min_time: Minimum total seconds of timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Per-call statistics in milliseconds
+    """
+    for _ in range(warmup):
+        target()
+        db.expunge_all()
+
+    samples: List[float] = []
+    total = 0.0
+    while len(samples) < min_rounds or total < min_time:
+        started = time.perf_counter()
+        target()
+        elapsed = time.perf_counter() - started
+        db.expunge_all()
+        samples.append(elapsed)
+        total += elapsed
+    db.rollback()
+
+    return {
+        "rounds": len(samples),
+        "min_ms": round(min(samples) * 1000, 4),
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "stddev_ms": round(statistics.stdev(samples) * 1000, 4) if len(samples) > 1 else 0.0,
+        "ops": round(len(samples) / total, 1),
+    }
+
+
+def compare(
+    results: Dict[str, dict],
+    baseline: Dict[str, dict],
+    threshold: float,
+    noise_floor_ms: float,
+    stat: str = "median"
+) -> List[str]:
+    """
+    Compare one statistic against a baseline and print the change per target.
+
+    Args:
+        results: Statistics of this run by target
+        baseline: Statistics of the baseline run by target
+        threshold: Percent slowdown that counts as a regression
+        noise_floor_ms: Slowdowns smaller than this are never regressions
+        stat: Statistic to compare: min, median or mean
+
+    Returns:
+        Regression messages, empty when no target got slower than allowed
+    """
+    key = f"{stat}_ms"
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{'new':<6}{name}: {stats[key]} ms", file=sys.stderr)
+            continue
+        change = (stats[key] - before[key]) / before[key] * 100
+        regressed = change > threshold and stats[key] - before[key] > noise_floor_ms
+        print(
+            f"{'FAIL' if regressed else 'ok':<6}{name}: {before[key]} -> {stats[key]} ms ({change:+.1f}%)",
+            file=sys.stderr
+        )
+        if regressed:
+            regressions.append(f"{name}: {stat} {change:+.1f}% slower than the baseline (threshold {threshold}%)")
+    return regressions
+
+
+def run(db: Session, args: argparse.Namespace) -> dict:
+    available = targets(db)
+    unknown = set(args.targets or ()) - set(available)
+    if unknown:
+        raise SystemExit(f"Unknown targets: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.targets or available:
+        results[name] = measure(db, available[name], args.min_rounds, args.min_time, args.warmup)
+        print(f"{name}: {results[name]}", file=sys.stderr)
+
+    return {
+        "commit": _commit(),
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dialect": db.get_bind().dialect.name,
+        "dataset": dataset(db),
+        "targets": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", help="Comma-separated targets to run (default: all)")
+    parser.add_argument("--min-rounds", type=int, default=20, help="Minimum timed calls per target")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Minimum timed seconds per target")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per target before timing")
+    parser.add_argument("--save", help="Write the results to this file as a baseline")
+    parser.add_argument("--compare", help="Baseline file to compare the results against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent slowdown that fails the run")
+    parser.add_argument("--stat", choices=("min", "median", "mean"), default="median", help="Statistic to compare")
+    parser.add_argument("--noise-floor-ms", type=float, default=0.005, help="Slowdowns below this many ms never fail the run")
+    args = parser.parse_args()
+    args.targets = [name.strip() for name in args.targets.split(",") if name.strip()] if args.targets else None
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    db = SessionLocal()
+    try:
+        report = run(db, args)
+    finally:
+        db.close()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            file.write(json.dumps(report, indent=2) + "\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if baseline is not None:
+        if baseline.get("dataset") != report["dataset"] or baseline.get("dialect") != report["dialect"]:
+            print("warning: the baseline was recorded against a different data set", file=sys.stderr)
+        regressions = compare(report["targets"], baseline["targets"], args.threshold, args.noise_floor_ms, args.stat)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
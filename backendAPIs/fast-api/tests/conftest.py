@@ -0,0 +1,86 @@
+"""Shared fixtures.
+
+Tests run against a throwaway SQLite database, through aiosqlite on the
+async paths, unless TEST_DATABASE_URL points them at a disposable Postgres
+database. The engines in ``app.db.database`` are built from DATABASE_URL at
+import time, so the URL is set before anything from the app is imported.
+The schema is created from the models and dropped again around every test.
+"""
+import os
+import tempfile
+
+_test_dir = tempfile.mkdtemp(prefix="culinary-compass-tests-")
+os.environ["DATABASE_URL"] = os.getenv(
+    "TEST_DATABASE_URL", f"sqlite:///{os.path.join(_test_dir, 'test.db')}"
+)
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.db.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.models import Base
+from app.models.user import User
+from app.utils.principal_cache import principal_cache
+
+
+@pytest.fixture(autouse=True)
+def schema():
+    """Create every table for the test and drop them afterwards."""
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+    principal_cache.clear()
+
+
+@pytest.fixture
+def db(schema):
+    """Sync session for arranging data and calling sync services."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest_asyncio.fixture
+async def async_db(schema):
+    """AsyncSession on the async driver, as get_async_db hands to routes."""
+    async with AsyncSessionLocal() as session:
+        yield session
+    # Pooled async connections belong to this test's event loop
+    await async_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(schema):
+    """HTTP client calling the app in-process, middleware included."""
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
+    await async_engine.dispose()
+
+
+@pytest.fixture
+def make_user(db):
+    """Insert a user and return it."""
+    def make(name: str = "User", **fields) -> User:
+        user = User(email=f"{name.lower().replace(' ', '.')}@example.com", name=name, **fields)
+        db.add(user)
+        db.commit()
+        return user
+    return make
+
+
+@pytest_asyncio.fixture
+async def user_headers(client):
+    """Authorization headers of a freshly signed-up user."""
+    response = await client.post(
+        "/auth/signup", json={"email": "signed.up@example.com", "password": "secret123", "name": "Signed Up"}
+    )
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
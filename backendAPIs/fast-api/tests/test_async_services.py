@@ -0,0 +1,121 @@
+"""The *_async service variants running on the async driver."""
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.follow import Follow
+from app.models.meal import Meal, MealType
+from app.models.meal_planner import MealPlanner
+from app.services.feedService import FeedService
+from app.services.users.userDashboardService import UserDashboardService
+from app.services.users.userMessagesService import AdminMessagesService, UserMessagesService
+from app.services.users.userPostService import UserPostService
+
+
+def approve_post(db, author, title: str) -> CreatorPost:
+    post = CreatorPost(
+        user_id=author.id, title=title, overview="", cooking_time=30, cuisine_type="Italian",
+        servings=2, ingredients=[], instructions="", status=CreatorPostStatus.APPROVED
+    )
+    db.add(post)
+    db.flush()
+    FeedService.fan_out_post(db, post)
+    db.commit()
+    return post
+
+
+@pytest.mark.asyncio
+async def test_feed_pages_followed_posts_newest_first(db, async_db, make_user):
+    creator = make_user("Creator", is_creator=True)
+    reader = make_user("Reader")
+    db.add(Follow(following_user_id=reader.id, followed_user_id=creator.id))
+    db.commit()
+    first = approve_post(db, creator, "First")
+    second = approve_post(db, creator, "Second")
+
+    page = await UserPostService.get_user_feed_async(async_db, reader.id, limit=1)
+    assert [post["id"] for post in page["posts"]] == [second.id]
+    assert page["has_more"] is True
+
+    page = await UserPostService.get_user_feed_async(async_db, reader.id, limit=1, cursor=page["next_cursor"])
+    assert [post["id"] for post in page["posts"]] == [first.id]
+    assert page["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_feed_rejects_invalid_cursor(async_db, make_user):
+    reader = make_user("Reader")
+
+    with pytest.raises(HTTPException) as error:
+        await UserPostService.get_user_feed_async(async_db, reader.id, cursor="not-a-cursor")
+
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_messages_show_in_both_conversation_lists(async_db, make_user):
+    sender = make_user("Sender")
+    receiver = make_user("Receiver", is_creator=True)
+
+    sent = await UserMessagesService.send_message_async(async_db, sender.id, receiver.id, "Hello")
+
+    outbox = await UserMessagesService.get_conversations_async(async_db, sender.id)
+    inbox = await UserMessagesService.get_conversations_async(async_db, receiver.id)
+    assert [(c["id"], c["lastMessage"], c["unreadCount"]) for c in outbox["conversations"]] == [
+        (receiver.id, "Hello", 0)
+    ]
+    assert [(c["id"], c["unreadCount"]) for c in inbox["conversations"]] == [(sender.id, 1)]
+
+    messages = await UserMessagesService.get_messages_async(async_db, receiver.id, sender.id)
+    assert [message["id"] for message in messages["messages"]] == [sent["id"]]
+
+    await UserMessagesService.mark_conversation_as_read_async(async_db, receiver.id, sender.id)
+    inbox = await UserMessagesService.get_conversations_async(async_db, receiver.id)
+    assert inbox["conversations"][0]["unreadCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cannot_message_yourself(async_db, make_user):
+    user = make_user("Lonely")
+
+    with pytest.raises(HTTPException) as error:
+        await UserMessagesService.send_message_async(async_db, user.id, user.id, "Hi me")
+
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_support_messages_round_trip(async_db, make_user):
+    user = make_user("Customer")
+
+    sent = await AdminMessagesService.send_message_to_admin_async(async_db, user.id, "Help")
+
+    conversation = await AdminMessagesService.get_admin_conversation_async(async_db, user.id)
+    assert [(m["id"], m["sender"]) for m in conversation["messages"]] == [(sent["id"], "User")]
+    unread = await AdminMessagesService.get_unread_admin_message_count_async(async_db, user.id)
+    assert unread["unreadCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_calories_intake_counts_meals_marked_done(db, async_db, make_user):
+    user = make_user("Planner", calories_target=2000)
+    meal = Meal(meal_type=MealType.BREAKFAST, meal_name="Porridge", calories=350)
+    db.add(meal)
+    db.flush()
+    day = date(2026, 1, 5)
+    planned = [
+        MealPlanner(user_id=user.id, date=day, meal_type="Breakfast", meal_id=meal.id),
+        MealPlanner(user_id=user.id, date=day, meal_type="Lunch", is_custom_meal=True,
+                    custom_meal_name="Soup", custom_calories="250"),
+        MealPlanner(user_id=user.id, date=day, meal_type="Dinner", is_custom_meal=True,
+                    custom_meal_name="Pasta", custom_calories="700"),
+    ]
+    db.add_all(planned)
+    db.commit()
+
+    await UserDashboardService.mark_meals_done_async(async_db, user.id, [planned[0].id, planned[1].id])
+    intake = await UserDashboardService.get_calories_intake_async(async_db, user.id, day)
+
+    assert intake == {"date": day, "total_calories": 600, "target_calories": 2000}
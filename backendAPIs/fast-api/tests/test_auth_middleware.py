@@ -0,0 +1,102 @@
+"""AuthMiddleware token validation in stateful and stateless mode."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config.middleware import AuthMiddleware
+from app.models.admin import Admin
+from app.models.token_revocation import TokenRevocation
+from app.services.authService import AuthService
+from app.utils.jwt_utils import admin_access_token_lifetime, create_access_token
+from app.utils.token_revocation import RevocationList
+
+
+async def sign_up(client, email: str) -> dict:
+    response = await client.post(
+        "/auth/signup", json={"email": email, "password": "secret123", "name": "Test User"}
+    )
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+@pytest.fixture
+def stateless(monkeypatch):
+    """A middleware instance validating tokens from their claims only."""
+    monkeypatch.setenv("AUTH_VALIDATION_MODE", "stateless")
+    return AuthMiddleware(app=None)
+
+
+@pytest.mark.asyncio
+async def test_missing_token_is_rejected(client):
+    response = await client.get("/api/v1/users/posts/feed")
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Missing authentication token"
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_rejected(client):
+    response = await client.get("/auth/me", headers={"Authorization": "Bearer not-a-jwt"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_stateful_token_works_until_logout(client):
+    headers = await sign_up(client, "stateful@example.com")
+
+    assert (await client.get("/auth/me", headers=headers)).status_code == 200
+    assert (await client.post("/auth/logout", headers=headers)).status_code == 200
+    assert (await client.get("/auth/me", headers=headers)).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_stateless_token_works_until_logout(db, make_user, stateless):
+    user = make_user("Stateless")
+    token = create_access_token(user.id, user.email, 1, token_version=user.token_version)
+
+    principal = await stateless.authenticate(token)
+    assert principal["user_id"] == user.id
+    assert principal["is_admin"] is False
+
+    AuthService.logout(db, user.id, 1)
+
+    assert await stateless.authenticate(token) is None
+
+
+@pytest.mark.asyncio
+async def test_stateless_admin_logout_revokes_for_the_admin_token_lifetime(db, stateless):
+    admin = Admin(email="admin@example.com", password="unused")
+    db.add(admin)
+    db.commit()
+    token = create_access_token(
+        admin.id, admin.email, 1, is_admin=True,
+        expires_delta=admin_access_token_lifetime(), token_version=admin.token_version
+    )
+
+    assert (await stateless.authenticate(token))["is_admin"] is True
+
+    AuthService.logout(db, admin.id, 1, is_admin=True)
+
+    assert await stateless.authenticate(token) is None
+    revocation = db.query(TokenRevocation).filter(TokenRevocation.user_id == admin.id).one()
+    expires_at = revocation.expires_at.replace(tzinfo=timezone.utc)
+    assert expires_at - datetime.now(timezone.utc) > admin_access_token_lifetime() - timedelta(minutes=1)
+
+
+def test_refresh_picks_up_revocations_committed_out_of_id_order(db):
+    revocations = RevocationList()
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=1)
+
+    db.add(TokenRevocation(id=20, user_id="later", token_version=1, expires_at=expires_at, created_at=now))
+    db.commit()
+    revocations.refresh(db)
+
+    # Allocated a lower id, but committed after id 20 was read
+    db.add(TokenRevocation(id=10, user_id="earlier", token_version=1, expires_at=expires_at, created_at=now))
+    db.commit()
+    revocations.refresh(db)
+
+    assert revocations.is_revoked({"sub": "earlier", "ver": 0})
+    assert not revocations.is_revoked({"sub": "earlier", "ver": 1})
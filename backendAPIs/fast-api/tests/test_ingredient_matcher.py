@@ -0,0 +1,102 @@
+"""Matching free-form post ingredient names to the ingredients master."""
+import pytest
+
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.ingredient import Ingredient, IngredientType
+from app.models.post_ingredient import PostIngredient
+from app.schemas.userRequestSchema import CreateCreatorPost
+from app.services.users.userRequestService import CreatorPostService
+from app.utils.ingredient_matcher import IngredientMatcher, master_matcher, normalize_ingredient_name
+from app.utils.master_cache import master_cache
+
+MASTER = [(1, "Basil"), (2, "Tomato"), (3, "Olive Oil"), (4, "Berry"), (5, "Potato"), (6, "Oil")]
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Tomatoes", "tomato"),
+    ("  Fresh   BASIL leaves! ", "fresh basil leave"),
+    ("2 cups berries", "cup berry"),
+    ("Potatoes", "potato"),
+    ("Glass", "glass"),
+    ("Couscous", "couscous"),
+    ("Extra-virgin olive oil", "extra virgin olive oil"),
+])
+def test_normalization(name, expected):
+    assert normalize_ingredient_name(name) == expected
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Basil", 1),
+    ("tomatoes", 2),
+    ("Fresh basil leaves", 1),
+    ("Extra virgin olive oil", 3),
+    ("Sunflower oil", 6),
+    ("Mixed berries", 4),
+    ("Salt", None),
+    ("", None),
+])
+def test_matching(name, expected):
+    assert IngredientMatcher(MASTER).match(name) == expected
+
+
+def test_match_post_reads_dict_and_string_entries():
+    matcher = IngredientMatcher(MASTER)
+
+    assert matcher.match_post([
+        {"name": "Cherry tomatoes", "quantity": "200 g"}, "basil", {"quantity": "1"}, {"name": 3}, "Salt"
+    ]) == {1, 2}
+
+
+@pytest.fixture
+def master(db):
+    db.add_all([
+        Ingredient(id=ingredient_id, name=name, type=IngredientType.Vegetables)
+        for ingredient_id, name in MASTER
+    ])
+    db.commit()
+    return master_cache.reload(db)
+
+
+def test_master_matcher_is_built_once_per_snapshot(db, master):
+    assert master_matcher(master) is master_matcher(master_cache.get())
+    assert master_matcher(master).match("Tomatoes") == 2
+
+    db.add(Ingredient(id=7, name="Garlic", type=IngredientType.Vegetables))
+    db.commit()
+    changed = master_cache.reload(db)
+
+    assert master_matcher(changed).match("garlic cloves") == 7
+
+
+def test_created_posts_are_linked_to_master_ingredients(db, make_user, master):
+    creator = make_user("Creator", is_creator=True)
+    post_data = CreateCreatorPost(
+        title="Tomato salad", overview="A quick summer salad", cooking_time=10, cuisine_type="Italian",
+        servings=2, ingredients=[{"name": "Fresh basil leaves"}, {"name": "tomatoes"}, {"name": "Salt"}]
+    )
+
+    post = CreatorPostService.create_creator_post(db, creator.id, post_data)
+
+    linked = db.query(PostIngredient.ingredient_id).filter(PostIngredient.post_id == post.id)
+    assert sorted(ingredient_id for (ingredient_id,) in linked) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_recipes_are_listed_by_master_ingredient(db, client, user_headers, make_user, master):
+    creator = make_user("Creator", is_creator=True)
+    for title, ingredients in [("Basil pesto", ["Basil", "Olive oil"]), ("Tomato soup", ["Tomatoes", "Basil"])]:
+        CreatorPostService.create_creator_post(db, creator.id, CreateCreatorPost(
+            title=title, overview="Simple and quick", cooking_time=20, cuisine_type="Italian",
+            servings=2, ingredients=[{"name": name} for name in ingredients]
+        ))
+    db.query(CreatorPost).update({CreatorPost.status: CreatorPostStatus.APPROVED})
+    db.commit()
+
+    basil = await client.get("/api/v1/users/recipes/ingredients/1", headers=user_headers)
+    tomato = await client.get("/api/v1/users/recipes/ingredients/2?count=exact", headers=user_headers)
+    unknown = await client.get("/api/v1/users/recipes/ingredients/99", headers=user_headers)
+
+    assert [recipe["title"] for recipe in basil.json()["data"]["recipes"]] == ["Tomato soup", "Basil pesto"]
+    assert tomato.json()["data"]["total"] == 1
+    assert tomato.json()["data"]["ingredient"]["name"] == "Tomato"
+    assert unknown.status_code == 404
@@ -0,0 +1,34 @@
+"""What the event loop monitor reports about stalls."""
+from app.config.loop_monitor import LoopMonitor
+
+
+def test_stall_stacks_and_request_paths_stay_out_of_stats(caplog):
+    monitor = LoopMonitor()
+    monitor._in_flight[0] = ("GET", "/api/v1/users/profile/42", 0.0)
+    sample = {
+        "route": "GET /api/v1/users/profile/{user_id}",
+        "service": "UserProfileService.get_profile",
+        "stack": ["app/services/users/userProfileService.py:10 in get_profile"],
+    }
+
+    monitor._record_stall(0.5, sample)
+
+    stats = monitor.stats()
+    assert stats["stalls"] == 1
+    assert stats["recent_stalls"] == [{
+        "lag_ms": 500.0,
+        "route": "GET /api/v1/users/profile/{user_id}",
+        "service": "UserProfileService.get_profile",
+    }]
+    assert "userProfileService.py" not in str(stats)
+    assert "/profile/42" not in str(stats)
+
+
+def test_lag_percentiles():
+    monitor = LoopMonitor()
+    assert monitor.stats()["lag_p99_ms"] == 0.0
+
+    monitor._lags.extend(n / 1000 for n in range(1, 101))
+
+    stats = monitor.stats()
+    assert (stats["lag_p50_ms"], stats["lag_p95_ms"], stats["lag_p99_ms"]) == (51.0, 96.0, 100.0)
@@ -0,0 +1,64 @@
+"""Refreshing the master data snapshot without blocking the event loop."""
+import threading
+from dataclasses import replace
+
+import pytest
+
+from app.models.country import Country
+from app.utils.master_cache import MasterDataCache
+
+
+@pytest.fixture
+def cache(db):
+    db.add(Country(name="Italy"))
+    db.commit()
+    cache = MasterDataCache(refresh_seconds=3600)
+    cache.reload()
+    return cache
+
+
+def add_country(db, name: str) -> None:
+    db.add(Country(name=name))
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_due_refresh_on_the_loop_runs_in_a_thread(db, cache, monkeypatch):
+    add_country(db, "Spain")
+    cache.refresh_seconds = 0.000001
+    loads = []
+    load = cache.load
+    monkeypatch.setattr(cache, "load", lambda session: loads.append(threading.get_ident()) or load(session))
+
+    current = cache.get()
+
+    # The caller keeps the current snapshot while the refresh runs elsewhere
+    assert [country["name"] for country in current.countries] == ["Italy"]
+    await cache._refresh_task
+    assert loads and loads[0] != threading.get_ident()
+    assert [country["name"] for country in cache.get().countries] == ["Italy", "Spain"]
+
+
+def test_due_refresh_off_the_loop_runs_in_place(db, cache):
+    add_country(db, "Spain")
+    cache.refresh_seconds = 0.000001
+
+    assert [country["name"] for country in cache.get().countries] == ["Italy", "Spain"]
+    assert cache.stats()["refreshing"] is False
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_the_snapshot_until_the_next_attempt(cache, monkeypatch):
+    cache.refresh_seconds = 60
+    cache._data = replace(cache._data, loaded_at=0.0)
+
+    def fail(session):
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(cache, "load", fail)
+    current = cache.get()
+    await cache._refresh_task
+
+    assert cache.get() is current
+    assert cache.stats()["refreshing"] is False
+    assert cache._refresh_task.done()
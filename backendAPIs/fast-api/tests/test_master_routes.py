@@ -0,0 +1,52 @@
+"""Content negotiation and revalidation of the master data bundle."""
+import pytest
+
+from app.routes.masterRoutes import _accepts_gzip
+
+BUNDLE = "/api/v1/master/bundle"
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.8", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.000", False),
+    ("deflate", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),
+    ("", False),
+])
+def test_accepts_gzip_honours_q_values(header, expected):
+    assert _accepts_gzip(header) is expected
+
+
+@pytest.mark.asyncio
+async def test_gzip_and_identity_bodies_have_different_etags(client, user_headers):
+    zipped = await client.get(BUNDLE, headers={**user_headers, "Accept-Encoding": "gzip"})
+    plain = await client.get(BUNDLE, headers={**user_headers, "Accept-Encoding": "gzip;q=0"})
+
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["etag"].endswith('-gz"')
+    assert zipped.headers["etag"] != plain.headers["etag"]
+    # httpx decodes the gzip body
+    assert zipped.json() == plain.json()
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_only_matches_the_same_encoding(client, user_headers):
+    plain = await client.get(BUNDLE, headers={**user_headers, "Accept-Encoding": "identity"})
+    etag = plain.headers["etag"]
+
+    same = await client.get(
+        BUNDLE, headers={**user_headers, "Accept-Encoding": "identity", "If-None-Match": f"W/{etag}"}
+    )
+    other = await client.get(
+        BUNDLE, headers={**user_headers, "Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+
+    assert same.status_code == 304
+    assert other.status_code == 200
+    assert other.headers["content-encoding"] == "gzip"
@@ -0,0 +1,43 @@
+"""Access to the runtime metrics endpoint."""
+import pytest
+
+from app.models.admin import Admin
+from app.utils.jwt_utils import admin_access_token_lifetime, create_access_token
+
+
+@pytest.fixture
+def admin_headers(db, monkeypatch):
+    """Authorization headers of an admin, validated from the token claims."""
+    from app.main import app
+
+    monkeypatch.setattr(app.state.auth, "validation_mode", "stateless")
+    admin = Admin(email="admin@example.com", password="unused")
+    db.add(admin)
+    db.commit()
+    token = create_access_token(
+        admin.id, admin.email, 1, is_admin=True,
+        expires_delta=admin_access_token_lifetime(), token_version=admin.token_version
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_metrics_need_a_token(client):
+    response = await client.get("/metrics")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_hidden_from_users(client, user_headers):
+    response = await client.get("/metrics", headers=user_headers)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admins_can_read_metrics(client, admin_headers):
+    response = await client.get("/metrics", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert "event_loop" in response.json()
@@ -0,0 +1,63 @@
+"""Offset pagination totals and has_more in every count mode."""
+import pytest
+
+from app.db.query_stats import assert_query_budget
+from app.models.user import User
+from app.utils import pagination
+from app.utils.pagination import CountMode, paginate
+
+ROWS = 6
+
+
+@pytest.fixture
+def users(db, make_user):
+    for n in range(ROWS):
+        make_user(f"User {n}")
+    pagination._count_cache.clear()
+    yield db.query(User).order_by(User.email)
+    pagination._count_cache.clear()
+
+
+def page(query, skip, limit, count_mode):
+    rows, info = paginate(query, skip, limit, count_mode)
+    return len(rows), info["total"], info["has_more"]
+
+
+@pytest.mark.parametrize("count_mode", [CountMode.EXACT, CountMode.ESTIMATE])
+@pytest.mark.parametrize("skip, limit, expected", [
+    (0, 4, (4, ROWS, True)),    # first page
+    (4, 4, (2, ROWS, False)),   # last, partial page
+    (3, 3, (3, ROWS, False)),   # last page, an exact multiple of limit
+    (0, 6, (6, ROWS, False)),   # one page holding every row
+    (10, 4, (0, ROWS, False)),  # skip past the end
+])
+def test_totals(users, count_mode, skip, limit, expected):
+    assert page(users, skip, limit, count_mode) == expected
+
+
+@pytest.mark.parametrize("skip, limit, expected", [
+    (0, 4, (4, None, True)),
+    (3, 3, (3, None, False)),
+    (10, 4, (0, None, False)),
+])
+def test_no_total(users, skip, limit, expected):
+    assert page(users, skip, limit, CountMode.NONE) == expected
+
+
+@pytest.mark.parametrize("count_mode", list(CountMode))
+def test_empty_results(db, count_mode):
+    query = db.query(User).order_by(User.email)
+
+    assert page(query, 0, 10, count_mode) == (0, None if count_mode == CountMode.NONE else 0, False)
+
+
+@pytest.mark.parametrize("count_mode", [CountMode.EXACT, CountMode.ESTIMATE])
+def test_last_page_needs_no_count_query(users, count_mode):
+    with assert_query_budget(1):
+        assert page(users, 4, 4, count_mode) == (2, ROWS, False)
+
+
+def test_estimate_never_reports_fewer_rows_than_seen(users, monkeypatch):
+    monkeypatch.setattr(pagination, "estimate_count", lambda query: 1)
+
+    assert page(users, 2, 2, CountMode.ESTIMATE) == (2, 5, True)
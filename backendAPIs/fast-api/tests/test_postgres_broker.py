@@ -0,0 +1,142 @@
+"""Supervision of the Postgres broker's LISTEN connection."""
+import asyncio
+import sys
+import types
+
+import pytest
+
+from app.realtime.broker import PostgresBroker
+
+
+class FakeConnection:
+    """The parts of an asyncpg connection the broker uses."""
+
+    def __init__(self):
+        self.listeners = []
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners.append((channel, callback))
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.remove((channel, callback))
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    async def execute(self, query, *args):
+        if self.closed:
+            raise ConnectionError("connection is closed")
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        self.closed = True
+
+    async def close(self):
+        self.closed = True
+
+    def drop(self):
+        """The server went away."""
+        self.closed = True
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+@pytest.fixture
+def asyncpg(monkeypatch):
+    """A fake asyncpg whose connect() fails while ``down`` is set."""
+    module = types.SimpleNamespace(connections=[], down=False)
+
+    async def connect(dsn):
+        if module.down:
+            raise OSError("connection refused")
+        connection = FakeConnection()
+        module.connections.append(connection)
+        return connection
+
+    module.connect = connect
+    monkeypatch.setitem(sys.modules, "asyncpg", module)
+    return module
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def broker():
+    return PostgresBroker(
+        "postgresql://app@db/foodie", health_check_seconds=0.05,
+        reconnect_min_seconds=0.01, reconnect_max_seconds=0.02
+    )
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_replaced_and_listening_again(asyncpg, broker):
+    resynced = []
+
+    async def on_reconnect():
+        resynced.append(True)
+
+    async def handler(event):
+        pass
+
+    broker.on_reconnect = on_reconnect
+    await broker.start(handler)
+    first = asyncpg.connections[0]
+
+    asyncpg.down = True
+    first.drop()
+    await wait_for(lambda: broker.stats()["outage_seconds"] > 0)
+    assert broker.stats()["connected"] is False
+
+    asyncpg.down = False
+    await wait_for(lambda: broker.reconnects == 1)
+
+    second = asyncpg.connections[-1]
+    assert second is not first
+    assert [channel for channel, _ in second.listeners] == ["foodie_realtime"]
+    assert resynced == [True]
+    assert broker.stats() == {"connected": True, "reconnects": 1, "outage_seconds": 0.0}
+    await broker.stop()
+    assert second.closed
+
+
+@pytest.mark.asyncio
+async def test_silently_closed_connection_is_found_by_the_health_check(asyncpg, broker):
+    async def handler(event):
+        pass
+
+    await broker.start(handler)
+    # Closed without the termination callback firing
+    asyncpg.connections[0].closed = True
+
+    await wait_for(lambda: broker.reconnects == 1)
+    await broker.stop()
+
+
+@pytest.mark.asyncio
+async def test_events_stay_local_while_reconnecting(asyncpg, broker):
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    await broker.start(handler)
+    asyncpg.down = True
+    asyncpg.connections[0].drop()
+    await wait_for(lambda: broker.stats()["outage_seconds"] > 0)
+
+    await broker.publish({"kind": "deliver", "to": ["user-1"], "event": {"type": "message"}})
+
+    assert received == [{"kind": "deliver", "to": ["user-1"], "event": {"type": "message"}}]
+    await broker.stop()
@@ -0,0 +1,56 @@
+"""Query budgets of the hot read paths (see app.db.query_stats)."""
+import pytest
+
+from app.db.query_stats import assert_query_budget
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.models.follow import Follow
+from app.models.user import User
+from app.services.feedService import FeedService
+from app.services.users.userMessagesService import UserMessagesService
+from app.services.users.userPostService import UserPostService
+
+PARTNERS = 5
+
+
+@pytest.fixture
+def reader(db, make_user):
+    """A user who follows and messages several creators."""
+    reader = make_user("Reader")
+    for n in range(PARTNERS):
+        creator = make_user(f"Creator {n}", is_creator=True)
+        db.add(Follow(following_user_id=reader.id, followed_user_id=creator.id))
+        db.flush()
+        for title in ("Soup", "Stew"):
+            post = CreatorPost(
+                user_id=creator.id, title=title, overview="", cooking_time=20, cuisine_type="Italian",
+                servings=2, ingredients=[], instructions="", status=CreatorPostStatus.APPROVED
+            )
+            db.add(post)
+            db.flush()
+            FeedService.fan_out_post(db, post)
+        db.commit()
+        UserMessagesService.send_message(db, creator.id, reader.id, f"Hello from {n}")
+    db.expunge_all()
+    return reader
+
+
+def test_feed_page_query_count_does_not_grow_with_authors(db, reader):
+    with assert_query_budget(3):
+        page = UserPostService.get_user_feed(db, reader.id, limit=10)
+
+    assert len(page["posts"]) == 2 * PARTNERS
+
+
+def test_conversation_list_query_count_does_not_grow_with_partners(db, reader):
+    with assert_query_budget(2):
+        result = UserMessagesService.get_conversations(db, reader.id)
+
+    assert len(result["conversations"]) == PARTNERS
+
+
+def test_n_plus_one_loops_fail_the_budget(db, reader):
+    with pytest.raises(AssertionError, match="N\\+1"):
+        with assert_query_budget(100):
+            for follow in db.query(Follow).filter(Follow.following_user_id == reader.id):
+                db.query(User).filter(User.id == follow.followed_user_id).one()
+                db.expunge_all()
@@ -0,0 +1,6 @@
+"""The hot queries are planned as index scans (see app.scripts.check_query_plans)."""
+from app.scripts.check_query_plans import check
+
+
+def test_hot_queries_use_indexes(db):
+    assert check(db, users=300) == []
@@ -0,0 +1,124 @@
+"""Cross-worker presence in the realtime hub."""
+import time
+
+import pytest
+import pytest_asyncio
+
+from app.realtime.broker import Broker
+from app.realtime.hub import ConnectionHub
+
+
+class SharedBroker(Broker):
+    """Delivers every event to every subscribed hub, like NOTIFY does."""
+
+    def __init__(self, handlers: list):
+        self.handlers = handlers
+        self.handler = None
+
+    async def start(self, handler) -> None:
+        self.handler = handler
+        self.handlers.append(handler)
+
+    async def publish(self, event: dict) -> None:
+        for handler in list(self.handlers):
+            await handler(event)
+
+    async def stop(self) -> None:
+        self.handlers.remove(self.handler)
+
+
+class FakeSocket:
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+@pytest_asyncio.fixture
+async def workers():
+    """Hubs that share a broker, as separate uvicorn workers would."""
+    handlers = []
+    hubs = []
+
+    def make() -> ConnectionHub:
+        hub = ConnectionHub(SharedBroker(handlers), heartbeat_seconds=3600)
+        hubs.append(hub)
+        return hub
+
+    yield make
+    for hub in hubs:
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_presence_follows_connect_and_disconnect(workers):
+    first, second = workers(), workers()
+    await first.start()
+    await second.start()
+    socket = FakeSocket()
+
+    await first.connect("user-1", socket)
+    assert second.is_online("user-1")
+
+    await first.disconnect("user-1", socket)
+    assert not second.is_online("user-1")
+
+
+@pytest.mark.asyncio
+async def test_stopping_a_worker_takes_its_users_offline(workers):
+    first, second = workers(), workers()
+    await first.start()
+    await second.start()
+    await first.connect("user-1", FakeSocket())
+
+    await first.stop()
+
+    assert not second.is_online("user-1")
+
+
+@pytest.mark.asyncio
+async def test_presence_of_a_silent_worker_expires(workers):
+    first, second = workers(), workers()
+    await first.start()
+    await second.start()
+    await first.connect("user-1", FakeSocket())
+
+    # The first worker crashes: no goodbye, no more heartbeats
+    second._worker_seen[first.worker_id] = time.monotonic() - second.presence_ttl_seconds - 1
+
+    assert not second.is_online("user-1")
+    second._expire_workers()
+    assert second._presence == {}
+
+
+@pytest.mark.asyncio
+async def test_joining_worker_receives_a_snapshot(workers):
+    first = workers()
+    await first.start()
+    await first.connect("user-1", FakeSocket())
+    await first.connect("user-2", FakeSocket())
+
+    late = workers()
+    await late.start()
+
+    assert late.is_online("user-1")
+    assert late.is_online("user-2")
+    assert not late.is_online("user-3")
+
+
+@pytest.mark.asyncio
+async def test_resync_after_a_broker_outage_restores_presence(workers):
+    first, second = workers(), workers()
+    await first.start()
+    await second.start()
+    await first.connect("user-1", FakeSocket())
+    await second.connect("user-2", FakeSocket())
+
+    # Presence events lost while the first worker's broker was down
+    first._presence.clear()
+    second._presence.clear()
+    second._presence["gone"] = {first.worker_id}
+
+    await first.broker.on_reconnect()
+
+    assert first.is_online("user-2")
+    assert second.is_online("user-1")
+    assert not second.is_online("gone")
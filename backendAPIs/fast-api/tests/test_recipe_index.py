@@ -0,0 +1,98 @@
+"""Keeping the recipe index in step with approved posts."""
+from datetime import datetime
+
+import pytest
+
+from app.models.creator_post import CreatorPost, CreatorPostStatus
+from app.services.users import userRecipeService
+from app.services.users.userRecipeService import UserRecipeService
+from app.utils.recipe_index import RecipeIndex
+
+
+@pytest.fixture
+def index(monkeypatch):
+    """An index that syncs with the database on every use."""
+    index = RecipeIndex(refresh_seconds=0)
+    monkeypatch.setattr(userRecipeService, "recipe_index", index)
+    return index
+
+
+@pytest.fixture
+def make_post(db, make_user):
+    author = make_user("Author", is_creator=True)
+
+    def make(title: str, ingredients, status=CreatorPostStatus.APPROVED, action_date=None, **fields) -> CreatorPost:
+        post = CreatorPost(
+            **fields, user_id=author.id, title=title, overview="", cooking_time=10, cuisine_type="Italian",
+            servings=1, ingredients=[{"name": name} for name in ingredients], instructions="",
+            status=status, action_date=action_date
+        )
+        db.add(post)
+        db.commit()
+        return post
+    return make
+
+
+def matched_ids(index: RecipeIndex, names) -> list:
+    return [match["post_id"] for match in index.match(names, limit=10)[0]]
+
+
+def test_sync_drops_posts_that_are_no_longer_approved(db, index, make_post):
+    kept = make_post("Kept", ["tomato"])
+    deleted = make_post("Deleted", ["tomato"])
+    rejected = make_post("Rejected", ["tomato"])
+    index.ensure_fresh(db)
+    assert sorted(matched_ids(index, ["tomato"])) == sorted([kept.id, deleted.id, rejected.id])
+
+    db.delete(deleted)
+    rejected.status = CreatorPostStatus.REJECTED
+    db.commit()
+    index.ensure_fresh(db)
+
+    assert matched_ids(index, ["tomato"]) == [kept.id]
+
+
+def test_sync_picks_up_approvals_whatever_their_action_date(db, index, make_post):
+    make_post("Recent", ["egg"], action_date=datetime(2026, 6, 1))
+    index.ensure_fresh(db)
+
+    # Approved earlier, committed later (e.g. on another worker)
+    late = make_post("Late commit", ["egg"], action_date=datetime(2026, 1, 1))
+    index.ensure_fresh(db)
+
+    assert late.id in matched_ids(index, ["egg"])
+
+
+def test_match_recipes_skips_posts_deleted_elsewhere_without_short_pages(db, index, make_post):
+    posts = [make_post(f"Post {n}", ["rice"]) for n in range(4)]
+    index.ensure_fresh(db)
+    index.refresh_seconds = 3600
+
+    # Deleted by another worker; this index has not synced yet
+    db.delete(posts[-1])
+    db.commit()
+
+    result = UserRecipeService.match_recipes(db, ["rice"], skip=0, limit=2)
+
+    assert len(result["recipes"]) == 2
+    assert result["total"] == 3
+    assert result["has_more"] is True
+    assert posts[-1].id not in matched_ids(index, ["rice"])
+
+
+def test_bitsets_stay_as_wide_as_the_live_index(db, index, make_post):
+    posts = [make_post(f"Post {n}", ["flour"]) for n in range(5)]
+    index.ensure_fresh(db)
+
+    for post in posts[:4]:
+        db.delete(post)
+    db.commit()
+    index.ensure_fresh(db)
+    # Ids far beyond the number of posts, as after years of churn
+    fresh = [make_post(f"Fresh {n}", ["flour", "sugar"], id=1_000_000 + n) for n in range(3)]
+    index.ensure_fresh(db)
+
+    assert index.stats()["slots"] == 5
+    assert index._postings["flour"].bit_length() <= 5
+    assert sorted(matched_ids(index, ["flour", "sugar"])) == sorted([posts[4].id] + [post.id for post in fresh])
+    assert matched_ids(index, ["sugar"]) == [post.id for post in reversed(fresh)]
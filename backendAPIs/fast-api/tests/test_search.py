@@ -0,0 +1,92 @@
+"""User search on SQLite: prefixes, typos, renames and emails."""
+import pytest
+
+from app.db.database import engine
+from app.db.search import search_users
+from app.models import Base
+from app.models.user import User
+
+
+@pytest.fixture
+def people(db):
+    for name, email in [
+        ("Anna Kowalski", "anna@example.com"),
+        ("Chris Grill", "chris@example.com"),
+        ("Grace Hopper", "admiral@navy.example.com"),
+        ("Annabel Lee", "poe@example.com"),
+    ]:
+        db.add(User(name=name, email=email))
+    db.commit()
+
+
+def search(db, term: str, include_email: bool = False) -> list:
+    return [user.name for user in search_users(db.query(User), term, include_email).all()]
+
+
+def search_set(db, term: str) -> set:
+    return set(search(db, term))
+
+
+@pytest.mark.parametrize("term, expected", [
+    ("chris gr", ["Chris Grill"]),
+    ("KOWALSKI", ["Anna Kowalski"]),
+    ("lee annab", ["Annabel Lee"]),
+])
+def test_prefixes_of_name_words_match(db, people, term, expected):
+    assert search(db, term) == expected
+
+
+@pytest.mark.parametrize("term, expected", [
+    ("grll", ["Chris Grill"]),
+    ("kowalsky", ["Anna Kowalski"]),
+    ("chirs", ["Chris Grill"]),
+])
+def test_one_typo_per_word_matches(db, people, term, expected):
+    assert search(db, term) == expected
+
+
+def test_short_words_match_with_a_typo(db, people):
+    assert search_set(db, "ann") == {"Anna Kowalski", "Annabel Lee"}
+    assert search_set(db, "ana") == {"Anna Kowalski", "Annabel Lee"}
+
+
+def test_exact_matches_rank_before_typos(db, people):
+    db.add(User(name="Ana Lopez", email="ana@example.com"))
+    db.commit()
+
+    assert search(db, "ana")[0] == "Ana Lopez"
+
+
+def test_unrelated_terms_match_nothing(db, people):
+    assert search(db, "zebra") == []
+    assert search(db, "grillmaster") == []
+
+
+def test_renamed_users_are_found_by_their_new_name(db, people):
+    user = db.query(User).filter(User.name == "Chris Grill").one()
+    user.name = "Christina Smoke"
+    db.commit()
+
+    assert search(db, "smoke") == ["Christina Smoke"]
+    assert search(db, "grill") == []
+
+
+def test_email_matches_only_when_included(db, people):
+    assert search(db, "navy") == []
+    assert search(db, "navy", include_email=True) == ["Grace Hopper"]
+    assert search(db, "admiral@navy", include_email=True) == ["Grace Hopper"]
+
+
+def test_index_is_rebuilt_after_the_users_table_is_recreated(db):
+    db.add(User(name="Old Timer", email="old@example.com"))
+    db.commit()
+    assert search(db, "timer") == ["Old Timer"]
+
+    db.close()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db.add(User(name="New Comer", email="new@example.com"))
+    db.commit()
+
+    assert search(db, "timer") == []
+    assert search(db, "comer") == ["New Comer"]
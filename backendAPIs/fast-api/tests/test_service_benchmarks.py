@@ -0,0 +1,64 @@
+"""Service benchmarks on a small seeded database, compared with a baseline.
+
+The benchmark itself is opt-in: it only runs with RUN_BENCHMARKS=1, since
+timings are only comparable on one machine. BENCHMARK_SAVE=path writes the
+run as a baseline (the same format ``python -m benchmarks.services --save``
+writes), and BENCHMARK_BASELINE=path fails the test when a target got more
+than BENCHMARK_THRESHOLD percent (default 10) slower than in that baseline,
+comparing the BENCHMARK_STAT statistic (min, median or mean; default median).
+
+    RUN_BENCHMARKS=1 BENCHMARK_SAVE=baseline.json python -m pytest tests/test_service_benchmarks.py
+    RUN_BENCHMARKS=1 BENCHMARK_BASELINE=baseline.json python -m pytest tests/test_service_benchmarks.py
+"""
+import json
+import os
+from argparse import Namespace
+from datetime import date
+
+import pytest
+
+from app.scripts.seed_data import load_master, seed
+from app.utils.master_cache import master_cache
+from benchmarks.services import compare, run
+
+SEED = Namespace(
+    seed=42, users=300, creator_share=0.05, follows=10, posts=10, planner_share=0.3, meal_days=30,
+    messages=5000, admin_messages=500, days=90, end_date=date(2026, 10, 1), password="password123",
+    batch_size=1000,
+)
+
+
+@pytest.mark.skipif(os.getenv("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run benchmarks")
+def test_services_are_not_slower_than_the_baseline(db):
+    load_master(db)
+    seed(db, SEED)
+    master_cache.reload(db)
+
+    report = run(db, Namespace(targets=None, min_rounds=20, min_time=0.2, warmup=3))
+
+    if os.getenv("BENCHMARK_SAVE"):
+        with open(os.environ["BENCHMARK_SAVE"], "w", encoding="utf-8") as file:
+            file.write(json.dumps(report, indent=2) + "\n")
+    if os.getenv("BENCHMARK_BASELINE"):
+        with open(os.environ["BENCHMARK_BASELINE"], encoding="utf-8") as file:
+            baseline = json.load(file)
+        assert baseline["dataset"] == report["dataset"], "the baseline was recorded against a different data set"
+        threshold = float(os.getenv("BENCHMARK_THRESHOLD", "10"))
+        stat = os.getenv("BENCHMARK_STAT", "median")
+        assert compare(report["targets"], baseline["targets"], threshold, noise_floor_ms=0.005, stat=stat) == []
+
+
+def test_compare_flags_slowdowns_past_the_threshold():
+    baseline = {"feed": {"median_ms": 1.0}, "conversations": {"median_ms": 2.0}}
+    results = {"feed": {"median_ms": 1.2}, "conversations": {"median_ms": 2.1}}
+
+    regressions = compare(results, baseline, threshold=10, noise_floor_ms=0.005)
+
+    assert regressions == ["feed: median +20.0% slower than the baseline (threshold 10%)"]
+
+
+def test_compare_ignores_slowdowns_under_the_noise_floor_and_new_targets():
+    baseline = {"master_countries": {"min_ms": 0.002}}
+    results = {"master_countries": {"min_ms": 0.004}, "master_bundle": {"min_ms": 5.0}}
+
+    assert compare(results, baseline, threshold=10, noise_floor_ms=0.005, stat="min") == []